@@ -0,0 +1,116 @@
+"""
+Benchmark: AutocompleteIndex typeahead latency.
+
+Indexes synthetic minions (random multi-word titles plus a few tags each),
+then times suggestions for prefixes of increasing length — cold (first
+query for a short prefix ranks the whole block) and warm — and while
+interleaving updates, against the linear ``search()`` scan that the UI
+previously issued per keystroke.  The churn phase removes or back-dates
+the top suggestion for a 1–2 character prefix and queries it again, once
+every such prefix has been queried, and reports per-query p50 and p99,
+which include the rescans of cached lists that ran short.
+
+Usage::
+
+    python benchmarks/bench_autocomplete.py --minions 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.autocomplete import AutocompleteIndex  # noqa: E402
+from minions.types import Minion  # noqa: E402
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+
+
+def _ts(rng: random.Random) -> str:
+    return f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"
+
+
+def _per_query_ms(fn, queries: list[str]) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minions", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tag_pool = [_word(rng) for _ in range(5_000)]
+    minions = [
+        Minion(
+            id=f"m{i}", title=" ".join(_word(rng) for _ in range(3)).title(),
+            minion_type_id="builtin-note", fields={}, created_at="", updated_at=_ts(rng),
+            tags=rng.sample(tag_pool, 3),
+        )
+        for i in range(args.minions)
+    ]
+
+    index = AutocompleteIndex()
+    start = time.perf_counter()
+    index.add_many(minions)
+    print(f"minions:             {args.minions:,}")
+    print(f"bulk build:          {time.perf_counter() - start:.2f} s")
+
+    for length in (1, 2, 3, 5):
+        prefixes = [m.title[:length] for m in rng.sample(minions, args.queries)]
+        cold = _per_query_ms(index.suggest, prefixes)
+        warm = _per_query_ms(index.suggest, prefixes)
+        print(f"prefix len {length}:        cold {cold:7.3f} ms   warm {warm:7.3f} ms")
+
+    updates = rng.sample(minions, args.queries)
+    start = time.perf_counter()
+    for m in updates:
+        index.add(replace(m, updated_at="2025-01-01T00:00:00Z"))
+    print(f"incremental update:  {(time.perf_counter() - start) / len(updates) * 1000:.3f} ms/op")
+
+    prefixes = [m.title[:2] for m in rng.sample(minions, args.queries)]
+    print(f"after updates (2):   {_per_query_ms(index.suggest, prefixes):.3f} ms/query")
+
+    by_id = {m.id: m for m in minions}
+    churned = [m.title[:rng.randint(1, 2)] for m in rng.sample(minions, args.queries * 20)]
+    for prefix in churned:
+        index.suggest(prefix)
+    latencies = []
+    for prefix in churned:
+        top = index.suggest(prefix, k=1, kinds=("title",))
+        if top:
+            m = by_id[top[0].minion_id]
+            if rng.random() < 0.5:
+                index.remove(m.id)
+            else:
+                index.add(replace(m, updated_at="2023-01-01T00:00:00Z"))
+        start = time.perf_counter()
+        index.suggest(prefix)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    p50, p99 = latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+    print(f"under churn (1-2):   p50 {p50:.3f} ms   p99 {p99:.3f} ms")
+
+    def scan(prefix: str) -> list[Minion]:
+        p = prefix.lower()
+        return [m for m in minions if p in m.title.lower()]
+
+    print(f"linear scan:         {_per_query_ms(scan, prefixes[:5]):.1f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: FrozenRelationGraph (CSR snapshot) against the live RelationGraph.
+
+Measures the memory held by each representation with :mod:`tracemalloc` and
+times neighbour lookups and a full breadth-first traversal on both.
+
+Usage::
+
+    python benchmarks/bench_frozen_graph.py --edges 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_relations import _per_call_ms, build_graph  # noqa: E402
+
+
+def _allocated(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    (graph, ids), live_bytes = _allocated(lambda: build_graph(args.edges, args.seed))
+    start = time.perf_counter()
+    graph.freeze()
+    freeze_s = time.perf_counter() - start
+    frozen, frozen_bytes = _allocated(graph.freeze)
+    edges = frozen.edge_count
+
+    print(f"edges:               {edges:,}   minions: {len(frozen):,}")
+    print(f"freeze:              {freeze_s:.2f} s")
+    print(f"live graph memory:   {live_bytes / 2**20:7.1f} MiB  ({live_bytes / edges:.0f} B/edge)")
+    print(f"frozen memory:       {frozen_bytes / 2**20:7.1f} MiB  ({frozen_bytes / edges:.0f} B/edge, "
+          f"{frozen.nbytes() / edges:.0f} B/edge in arrays)")
+    print(f"ratio:               {live_bytes / frozen_bytes:.1f}x smaller")
+
+    rng = random.Random(args.seed + 1)
+    sample = [rng.choice(ids) for _ in range(args.queries)]
+    live_ms = _per_call_ms(lambda i: [r.target_id for r in graph.get_from_source(i)], sample)
+    frozen_ms = _per_call_ms(frozen.neighbors, sample)
+    print(f"neighbors (live):    {live_ms * 1000:.2f} us/call")
+    print(f"neighbors (frozen):  {frozen_ms * 1000:.2f} us/call")
+
+    root = ids[0]
+    start = time.perf_counter()
+    live_count = sum(1 for _ in graph.traverse(root))
+    live_s = time.perf_counter() - start
+    start = time.perf_counter()
+    frozen_count = sum(1 for _ in frozen.traverse(root))
+    frozen_s = time.perf_counter() - start
+    assert live_count == frozen_count
+    print(f"BFS {live_count:,} minions (live):   {live_s:.2f} s")
+    print(f"BFS {frozen_count:,} minions (frozen): {frozen_s:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
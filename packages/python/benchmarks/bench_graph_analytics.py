@@ -0,0 +1,74 @@
+"""
+Benchmark: minions.graph_analytics on a large random relation graph.
+
+Builds a FrozenRelationGraph straight from generated edges (a parent_of
+forest plus random cross-links, as in ``bench_relations.py``) and times
+connected components, degree histograms and PageRank on the pure-Python
+and NumPy paths.
+
+Usage::
+
+    python benchmarks/bench_graph_analytics.py --edges 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions import graph_analytics  # noqa: E402
+from minions.frozen_graph import FrozenRelationGraph  # noqa: E402
+from minions.graph_analytics import _Edge  # noqa: E402
+
+
+def build_frozen(edges: int, seed: int) -> FrozenRelationGraph:
+    rng = random.Random(seed)
+    nodes = edges // 2
+    ids = [f"n{i}" for i in range(nodes)]
+
+    def generate():
+        for i in range(1, nodes):
+            yield _Edge(ids[rng.randrange(max(1, i // 8), i) if i > 8 else 0], ids[i], "parent_of")
+        for _ in range(edges - (nodes - 1)):
+            yield _Edge(rng.choice(ids), rng.choice(ids), rng.choice(("depends_on", "relates_to")))
+
+    return FrozenRelationGraph(generate())
+
+
+def _timed(label: str, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<32} {time.perf_counter() - start:6.2f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    frozen = build_frozen(args.edges, args.seed)
+    print(f"edges: {frozen.edge_count:,}  minions: {len(frozen):,}  "
+          f"(built in {time.perf_counter() - start:.1f} s)")
+
+    paths = [False]
+    if graph_analytics._np is not None:
+        paths.append(True)
+    for use_numpy in paths:
+        tag = "numpy" if use_numpy else "python"
+        _timed(f"components ({tag})", lambda: graph_analytics.connected_components(frozen, use_numpy=use_numpy))
+        _timed(f"components depends_on ({tag})", lambda: graph_analytics.connected_components(
+            frozen, types=["depends_on"], use_numpy=use_numpy))
+        _timed(f"degree histogram ({tag})", lambda: graph_analytics.degree_histogram(
+            frozen, "both", use_numpy=use_numpy))
+        _timed(f"pagerank ({tag})", lambda: graph_analytics.pagerank(frozen, use_numpy=use_numpy))
+
+
+if __name__ == "__main__":
+    main()
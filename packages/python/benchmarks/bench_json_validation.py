@@ -0,0 +1,88 @@
+"""
+Benchmark: ``json`` field validation on large nested payloads.
+
+Builds test-case style payloads — lists of records with nested dicts,
+lists and long strings — and compares the iterative compatibility walker
+behind ``json`` field validation against the ``json.dumps`` round-trip it
+replaced, in time and in peak memory allocated per check.
+
+Usage::
+
+    python benchmarks/bench_json_validation.py --mb 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.types import FieldDefinition  # noqa: E402
+from minions.validation import validate_field  # noqa: E402
+
+
+def build_payload(mb: float, rng: random.Random) -> dict:
+    """A payload whose JSON encoding is roughly *mb* megabytes."""
+    def text(n: int) -> str:
+        return "".join(rng.choices(string.ascii_letters + " ", k=n))
+
+    rows = []
+    size = 0
+    while size < mb * 1_000_000:
+        row = {
+            "id": len(rows),
+            "prompt": text(rng.randint(40, 400)),
+            "scores": [rng.random() for _ in range(8)],
+            "meta": {"tags": [text(6) for _ in range(3)], "ok": rng.random() < 0.5, "parent": None},
+        }
+        size += len(json.dumps(row))
+        rows.append(row)
+    return {"input": {"cases": rows}, "version": 2}
+
+
+def _measure(fn, repeat: int) -> tuple[float, int]:
+    """Return (ms per call, peak bytes allocated by one call)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat * 1000
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mb", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = build_payload(args.mb, random.Random(args.seed))
+    f = FieldDefinition(name="input", type="json")
+    print(f"rows:         {len(payload['input']['cases']):,}")
+
+    dumps_ms, dumps_peak = _measure(lambda: json.dumps(payload), args.repeat)
+    walk_ms, walk_peak = _measure(lambda: validate_field(payload, f), args.repeat)
+    print(f"json.dumps:   {dumps_ms:.1f} ms, peak {dumps_peak / 1e6:.2f} MB (before)")
+    print(f"walker:       {walk_ms:.1f} ms, peak {walk_peak / 1e3:.1f} KB")
+
+    nested: list = []
+    for _ in range(100_000):
+        nested = [nested]
+    start = time.perf_counter()
+    errors = validate_field(nested, f)
+    print(f"100k-deep:    rejected in {(time.perf_counter() - start) * 1000:.2f} ms ({errors[0].message})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: resident memory per Minion and Relation.
+
+Decodes synthetic minions and relations from JSON — as the file adapter
+does on load, so every document brings its own copies of type ids,
+statuses and tags — and reports bytes allocated per object for the
+slotted, interning ``Minion``/``Relation`` against plain ``@dataclass``
+replicas of the same fields, which is what they were before.
+
+Usage::
+
+    python benchmarks/bench_memory.py --minions 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.types import Minion, Relation  # noqa: E402
+
+
+def plain_replica(cls: type) -> type:
+    """A ``__dict__``-backed, non-interning dataclass with *cls*'s fields and ``from_dict``."""
+    specs = []
+    for f in dataclasses.fields(cls):
+        kwargs = {"init": f.init, "repr": f.repr, "compare": f.compare}
+        if f.default is not dataclasses.MISSING:
+            kwargs["default"] = f.default
+        elif f.default_factory is not dataclasses.MISSING:
+            kwargs["default_factory"] = f.default_factory
+        specs.append((f.name, f.type, dataclasses.field(**kwargs)))
+    return dataclasses.make_dataclass(
+        f"Plain{cls.__name__}", specs, namespace={"from_dict": classmethod(cls.from_dict.__func__)},
+    )
+
+
+def build_documents(n: int, rng: random.Random) -> tuple[list[str], list[str]]:
+    types = [f"builtin-{name}" for name in ("note", "task", "agent", "prompt", "thought")]
+    tags = [f"tag-{i}" for i in range(50)]
+    minions = [
+        json.dumps({
+            "id": f"{i:08x}-0000-4000-8000-000000000000", "title": f"Minion {i}",
+            "minionTypeId": rng.choice(types), "fields": {"content": f"body {i}"},
+            "createdAt": "2024-01-01T00:00:00+00:00", "updatedAt": "2024-01-01T00:00:00+00:00",
+            "status": rng.choice(["active", "todo", "completed"]),
+            "priority": rng.choice(["low", "medium", "high"]),
+            "tags": rng.sample(tags, 3),
+        })
+        for i in range(n)
+    ]
+    relations = [
+        json.dumps({
+            "id": f"r{i}", "sourceId": f"{i:08x}", "targetId": f"{rng.randrange(n):08x}",
+            "type": rng.choice(["parent_of", "depends_on", "relates_to"]),
+            "createdAt": "2024-01-01T00:00:00+00:00",
+        })
+        for i in range(n)
+    ]
+    return minions, relations
+
+
+def bytes_per_object(cls: type, documents: list[str]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    objects = [cls.from_dict(json.loads(doc)) for doc in documents]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / len(documents)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    minion_docs, relation_docs = build_documents(args.minions, random.Random(args.seed))
+    for cls, documents in ((Minion, minion_docs), (Relation, relation_docs)):
+        before = bytes_per_object(plain_replica(cls), documents)
+        after = bytes_per_object(cls, documents)
+        print(f"{cls.__name__ + ':':<10}{before:,.0f} -> {after:,.0f} bytes each "
+              f"({(1 - after / before) * 100:.0f}% smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: shortest_path / reachable on sparse and dense random graphs.
+
+Times the bidirectional BFS behind ``RelationGraph.shortest_path`` and
+``reachable`` against a one-sided BFS (``traverse`` until the target shows
+up) and the recursive ``get_network`` expansion applications used before.
+
+Usage::
+
+    python benchmarks/bench_paths.py --nodes 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.relations import RelationGraph  # noqa: E402
+
+
+def build_graph(nodes: int, degree: float, seed: int) -> tuple[RelationGraph, list[str]]:
+    """Return a random directed graph with about ``nodes * degree`` relates_to edges."""
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(nodes)]
+    graph = RelationGraph()
+    for _ in range(int(nodes * degree)):
+        graph.add({"source_id": rng.choice(ids), "target_id": rng.choice(ids), "type": "relates_to"})
+    return graph, ids
+
+
+def _one_sided(graph: RelationGraph, a: str, b: str) -> bool:
+    return any(step.node == b for step in graph.traverse(a))
+
+
+def _network_expansion(graph: RelationGraph, a: str, b: str) -> bool:
+    """What callers did before: expand get_network level by level until b appears."""
+    seen = {a}
+    frontier = [a]
+    while frontier:
+        nxt = []
+        for node in frontier:
+            for other in graph.get_network(node):
+                if other == b:
+                    return True
+                if other not in seen:
+                    seen.add(other)
+                    nxt.append(other)
+        frontier = nxt
+    return False
+
+
+def _time(fn, pairs) -> float:
+    start = time.perf_counter()
+    for a, b in pairs:
+        fn(a, b)
+    return (time.perf_counter() - start) / len(pairs) * 1000
+
+
+def run(label: str, nodes: int, degree: float, queries: int, seed: int) -> None:
+    start = time.perf_counter()
+    graph, ids = build_graph(nodes, degree, seed)
+    print(f"── {label}: {nodes:,} nodes, {len(graph.list()):,} edges "
+          f"(built in {time.perf_counter() - start:.1f} s)")
+
+    rng = random.Random(seed + 1)
+    pairs = [tuple(rng.sample(ids, 2)) for _ in range(queries)]
+    lengths = [graph.shortest_path(a, b) for a, b in pairs]
+    found = [len(p) - 1 for p in lengths if p]
+    if found:
+        print(f"   reachable pairs:     {len(found)}/{queries}, mean hops {sum(found) / len(found):.1f}")
+    print(f"   shortest_path:       {_time(graph.shortest_path, pairs):.3f} ms/query")
+    print(f"   reachable:           {_time(graph.reachable, pairs):.3f} ms/query")
+    few = pairs[: max(1, queries // 10)]
+    print(f"   one-sided BFS:       {_time(lambda a, b: _one_sided(graph, a, b), few):.3f} ms/query")
+    print(f"   get_network (before): {_time(lambda a, b: _network_expansion(graph, a, b), few):.3f} ms/query")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodes", type=int, default=50_000)
+    parser.add_argument("--sparse-degree", type=float, default=1.5)
+    parser.add_argument("--dense-degree", type=float, default=20)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    run("sparse", args.nodes, args.sparse_degree, args.queries, args.seed)
+    run("dense", args.nodes // 5, args.dense_degree, args.queries, args.seed)
+
+
+if __name__ == "__main__":
+    main()
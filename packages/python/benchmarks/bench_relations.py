@@ -0,0 +1,117 @@
+"""
+Benchmark: RelationGraph neighbourhood queries on large graphs.
+
+Builds a random forest of ``parent_of`` edges plus random cross-links
+(``depends_on`` / ``relates_to``) and times the adjacency-indexed queries
+and interval-labelled ``is_descendant`` checks against the full-scan and
+tree-walk implementations they replaced.
+
+Usage::
+
+    python benchmarks/bench_relations.py --edges 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.relations import RelationGraph  # noqa: E402
+
+
+def _scan_from_source(graph: RelationGraph, source_id: str, type=None):
+    return [
+        r for r in graph._relations.values()
+        if r.source_id == source_id and (type is None or r.type == type)
+    ]
+
+
+def _per_call_ms(fn, args: list) -> float:
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) / len(args) * 1000
+
+
+def generate_edges(edges: int, seed: int) -> tuple[list[dict], list[str]]:
+    """Return about *edges* relation inputs — a parent_of forest plus cross-links — and the minion ids."""
+    rng = random.Random(seed)
+    nodes = edges // 2
+    ids = [f"n{i}" for i in range(nodes)]
+    inputs = [
+        {"source_id": ids[rng.randrange(max(1, i // 8), i) if i > 8 else 0], "target_id": ids[i], "type": "parent_of"}
+        for i in range(1, nodes)
+    ]
+    for _ in range(edges - (nodes - 1)):
+        inputs.append({
+            "source_id": rng.choice(ids),
+            "target_id": rng.choice(ids),
+            "type": rng.choice(("depends_on", "relates_to")),
+        })
+    return inputs, ids
+
+
+def build_graph(edges: int, seed: int) -> tuple[RelationGraph, list[str]]:
+    """Return a graph with about *edges* relations: a parent_of forest plus cross-links."""
+    inputs, ids = generate_edges(edges, seed)
+    graph = RelationGraph()
+    graph.add_many(inputs)
+    return graph, ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    inputs, ids = generate_edges(args.edges, args.seed)
+    start = time.perf_counter()
+    graph = RelationGraph()
+    for input in inputs:
+        graph.add(input)
+    print(f"edges:               {len(graph.list()):,}")
+    print(f"build (add):         {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    graph = RelationGraph()
+    graph.add_many(inputs)
+    print(f"build (add_many):    {time.perf_counter() - start:.2f} s")
+    gc.collect()  # settle the collector before timing queries
+
+    rng = random.Random(args.seed + 1)
+    sample = rng.sample(ids, args.queries)
+    print(f"get_from_source:     {_per_call_ms(graph.get_from_source, sample) * 1000:.2f} us/call")
+    print(f"get_to_target:       {_per_call_ms(graph.get_to_target, sample) * 1000:.2f} us/call")
+    print(f"get_children:        {_per_call_ms(graph.get_children, sample) * 1000:.2f} us/call")
+    print(f"get_network:         {_per_call_ms(graph.get_network, sample) * 1000:.2f} us/call")
+    start = time.perf_counter()
+    graph.neighbors_many(sample)
+    print(f"neighbors_many:      {(time.perf_counter() - start) / len(sample) * 1e6:.2f} us/id")
+    print(f"get_tree (root):     {_per_call_ms(graph.get_tree, [ids[0]]):.1f} ms (visits every node)")
+    start = time.perf_counter()
+    graph.is_descendant(ids[1], ids[0])
+    print(f"is_descendant label: {(time.perf_counter() - start) * 1000:.1f} ms (first check)")
+    # "Is this minion under that folder?" — folders near the top of the forest.
+    pairs = [(rng.choice(ids), ids[rng.randrange(16)]) for _ in range(args.queries)]
+    print(f"is_descendant:       {_per_call_ms(lambda p: graph.is_descendant(*p), pairs) * 1000:.2f} us/call")
+    walk = pairs[: max(1, args.queries // 100)]
+    print(f"get_tree check:      {_per_call_ms(lambda p: p[0] in graph.get_tree(p[1]), walk):.2f} ms/call (before)")
+    scan = sample[: max(1, args.queries // 100)]
+    print(f"full scan (before):  {_per_call_ms(lambda i: _scan_from_source(graph, i), scan):.1f} ms/call")
+
+    victims = rng.sample(ids, args.queries)
+    start = time.perf_counter()
+    for v in victims:
+        graph.remove_by_minion_id(v)
+    print(f"remove_by_minion_id: {(time.perf_counter() - start) / len(victims) * 1e6:.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
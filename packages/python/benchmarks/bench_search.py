@@ -0,0 +1,109 @@
+"""
+Benchmark: SearchIndex exact and fuzzy query latency.
+
+Builds an index over synthetic minions drawn from a Zipf-ish vocabulary and
+times exact and typo-tolerant queries against it, alongside the linear
+substring scan the storage adapters used before the index existed.
+
+Usage::
+
+    python benchmarks/bench_search.py --docs 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.search import SearchIndex  # noqa: E402
+from minions.types import Minion  # noqa: E402
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < size:
+        n = rng.randint(4, 12)
+        words.add("".join(rng.choices(string.ascii_lowercase, k=n)))
+    return sorted(words)
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + word[i + 1:]
+
+
+def _timeit(fn, queries: list[str]) -> float:
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs", type=int, default=100_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--words", type=int, default=12, help="words per document")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocab = _vocabulary(args.vocab, rng)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocab))))
+
+    minions: list[Minion] = []
+    for i in range(args.docs):
+        text = " ".join(rng.choices(vocab, cum_weights=cum_weights, k=args.words))
+        minions.append(Minion(
+            id=f"m{i}", title=f"doc {i}", minion_type_id="builtin-note",
+            fields={}, created_at="", updated_at="", searchable_text=text,
+        ))
+
+    index = SearchIndex()
+    start = time.perf_counter()
+    for m in minions:
+        index.add(m)
+    build = time.perf_counter() - start
+
+    sample = rng.sample(vocab[:5_000], args.queries)
+    typos = [_typo(w, rng) for w in sample]
+
+    start = time.perf_counter()
+    index.fuzzy_terms(typos[0])
+    deletes_build = time.perf_counter() - start
+
+    def scan(q: str) -> list[str]:
+        tokens = q.lower().split()
+        return [m.id for m in minions if all(t in (m.searchable_text or m.title).lower() for t in tokens)]
+
+    scan_queries = sample[: max(1, args.queries // 10)]
+
+    print(f"documents:          {args.docs:,}")
+    print(f"vocabulary:         {index.vocabulary_size:,}")
+    print(f"index build:        {build:.2f} s")
+    print(f"deletes-map build:  {deletes_build:.2f} s (first fuzzy query)")
+    print(f"linear scan:        {_timeit(scan, scan_queries):.2f} ms/query")
+    print(f"exact (indexed):    {_timeit(index.search, sample):.2f} ms/query")
+    print(f"fuzzy term lookup:  {_timeit(index.fuzzy_terms, typos):.3f} ms/query")
+    print(f"fuzzy search:       {_timeit(lambda q: index.search(q, fuzzy=True), typos):.2f} ms/query")
+
+    sources = [m.id for m in rng.sample(minions, args.queries)]
+    print(f"similar (python):   {_timeit(lambda i: index.similar(i, use_numpy=False), sources):.2f} ms/query")
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("similar (numpy):    skipped, NumPy not installed")
+    else:
+        print(f"similar (numpy):    {_timeit(lambda i: index.similar(i, use_numpy=True), sources):.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
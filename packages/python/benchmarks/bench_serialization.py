@@ -0,0 +1,71 @@
+"""
+Benchmark: Minion serialization round-trips.
+
+Times the generated ``Minion.to_dict``/``from_dict`` (tolerant, and with
+the key style given) and the file adapter's JSON encode/decode step with the
+standard library ``json`` against the active ``json_codec`` backend, over
+synthetic camelCase documents like those ``JsonFileStorageAdapter`` writes.
+
+Usage::
+
+    python benchmarks/bench_serialization.py --minions 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from minions.storage import json_codec  # noqa: E402
+from minions.types import Minion  # noqa: E402
+
+
+def build_minions(n: int, rng: random.Random) -> list[Minion]:
+    return [
+        Minion(
+            id=f"{i:08x}-0000-4000-8000-000000000000", title=f"Minion {i}",
+            minion_type_id=rng.choice(["builtin-note", "builtin-task"]),
+            fields={"content": "lorem ipsum " * rng.randint(1, 20), "score": rng.random()},
+            created_at="2024-01-01T00:00:00+00:00", updated_at="2024-01-02T00:00:00+00:00",
+            tags=rng.sample(["a", "b", "c", "d"], 2), priority="high", due_date="2024-03-01",
+            created_by="agent-7", searchable_text=f"minion {i} lorem ipsum",
+        )
+        for i in range(n)
+    ]
+
+
+def _per_item_us(fn, items: list) -> float:
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--minions", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=9)
+    args = parser.parse_args()
+
+    minions = build_minions(args.minions, random.Random(args.seed))
+    dicts = [m.to_dict() for m in minions]
+    texts = [json.dumps(d, indent=2) for d in dicts]
+
+    print(f"to_dict:              {_per_item_us(Minion.to_dict, minions):.2f} us")
+    print(f"from_dict:            {_per_item_us(Minion.from_dict, dicts):.2f} us")
+    print(f"from_dict (camel):    {_per_item_us(lambda d: Minion.from_dict(d, 'camel'), dicts):.2f} us")
+    print(f"json.dumps:           {_per_item_us(lambda d: json.dumps(d, indent=2), dicts):.2f} us")
+    print(f"json.loads:           {_per_item_us(json.loads, texts):.2f} us")
+    backend = json_codec.JSON_BACKEND
+    print(f"codec dumps ({backend}): {_per_item_us(lambda d: json_codec.dumps(d, indent=True), dicts):.2f} us")
+    print(f"codec loads ({backend}): {_per_item_us(json_codec.loads, texts):.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,8 +47,17 @@ from .validation import (
     ValidationResult,
     validate_field,
     validate_fields,
+    compile_validator,
+    CompiledValidator,
+    validate_many,
+    validate_many_async,
+    RecordValidation,
 )
 
+# ─── Pattern Safety ───────────────────────────────────────────────────────────
+
+from .patterns import analyze_pattern, pattern_search, UnsafePatternWarning
+
 # ─── Schemas ──────────────────────────────────────────────────────────────────
 
 from .schemas import (
@@ -71,7 +80,13 @@ from .registry import TypeRegistry
 
 # ─── Relations ────────────────────────────────────────────────────────────────
 
-from .relations import RelationGraph
+from .relations import RelationGraph, TraversalStep, CriticalPath, CycleError, SCHEDULING_TYPES
+from .frozen_graph import FrozenRelationGraph
+
+# ─── Search ───────────────────────────────────────────────────────────────────
+
+from .search import SearchIndex
+from .autocomplete import AutocompleteIndex, Completion
 
 # ─── Lifecycle ────────────────────────────────────────────────────────────────
 
@@ -92,11 +107,17 @@ from .evolution import migrate_minion
 
 # ─── Client ───────────────────────────────────────────────────────────────────
 
-from .client import Minions, MinionWrapper, MinionPlugin, MinionMiddleware, MinionContext, MinionOperation, run_middleware
+from .client import Minions, MinionWrapper, MinionSubgraph, MinionPlugin, MinionMiddleware, MinionContext, MinionOperation, run_middleware
 
 # ─── Storage ──────────────────────────────────────────────────────────────────
 
 from .storage import StorageAdapter, StorageFilter, MemoryStorageAdapter, JsonFileStorageAdapter, with_hooks, StorageHooks
+from .storage import (
+    RelationStorageAdapter,
+    MemoryRelationStorageAdapter,
+    JsonFileRelationStorageAdapter,
+    SqliteRelationStorageAdapter,
+)
 
 # ─── Public API ───────────────────────────────────────────────────────────────
 
@@ -123,6 +144,15 @@ __all__ = [
     "ValidationResult",
     "validate_field",
     "validate_fields",
+    "compile_validator",
+    "CompiledValidator",
+    "validate_many",
+    "validate_many_async",
+    "RecordValidation",
+    # Pattern Safety
+    "analyze_pattern",
+    "pattern_search",
+    "UnsafePatternWarning",
     # Schemas
     "note_type",
     "link_type",
@@ -139,6 +169,15 @@ __all__ = [
     "TypeRegistry",
     # Relations
     "RelationGraph",
+    "TraversalStep",
+    "CriticalPath",
+    "CycleError",
+    "SCHEDULING_TYPES",
+    "FrozenRelationGraph",
+    # Search
+    "SearchIndex",
+    "AutocompleteIndex",
+    "Completion",
     # Lifecycle
     "create_minion",
     "update_minion",
@@ -153,6 +192,7 @@ __all__ = [
     # Client
     "Minions",
     "MinionWrapper",
+    "MinionSubgraph",
     "MinionPlugin",
     "MinionMiddleware",
     "MinionContext",
@@ -165,4 +205,8 @@ __all__ = [
     "JsonFileStorageAdapter",
     "with_hooks",
     "StorageHooks",
+    "RelationStorageAdapter",
+    "MemoryRelationStorageAdapter",
+    "JsonFileRelationStorageAdapter",
+    "SqliteRelationStorageAdapter",
 ]
@@ -0,0 +1,371 @@
+"""
+Minions SDK — Autocomplete Index
+Prefix typeahead over lowercased minion titles and tags.
+
+Completions live in a sorted array searched with :mod:`bisect`, so finding
+the block of keys that share a prefix is ``O(log n)``.  Ranking a long block
+(``"a"`` matches a sizeable fraction of a large corpus) is still linear, so
+the top ``16 * cache_size`` entries for every prefix of up to
+``cache_prefix_length`` characters are cached and kept current
+incrementally in ``O(log cache_size)``: a rising score (a newer
+``updated_at``, another recorded use) is merged into each cached list, and
+a removed or falling entry is dropped from it, shrinking it.  Only a list
+that shrinks below the ``k`` asked for is re-ranked from the block — the
+``O(block)`` cold path, which the first query for a prefix also takes — so
+at most one query in ``15 * cache_size`` removals of a prefix's leaders
+pays for a rescan.
+"""
+
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Literal, Optional
+
+from .types import Minion
+
+# ─── Types ────────────────────────────────────────────────────────────────────
+
+CompletionKind = Literal["title", "tag"]
+CompletionRank = Literal["recency", "usage"]
+
+_RANKS: tuple[CompletionRank, ...] = ("recency", "usage")
+_PREFIX_END = "\U0010ffff"
+# Cached top lists hold this multiple of ``cache_size`` entries.
+_CACHE_SLACK = 16
+_MISSING = object()
+
+_Entry = tuple[str, str]
+
+
+@dataclass
+class Completion:
+    """A single autocomplete suggestion."""
+    text: str
+    kind: CompletionKind
+    #: The matching minion for ``title`` completions; ``None`` for tags.
+    minion_id: Optional[str] = None
+
+
+# ─── Ranked Prefix Array ──────────────────────────────────────────────────────
+
+class _TopList:
+    """
+    Best-first ``(score, entry)`` pairs holding the exact top entries under a
+    prefix — or, when ``complete``, every entry under it.
+    """
+
+    __slots__ = ("items", "scores", "complete")
+
+    def __init__(self, items: list[tuple[Any, _Entry]], complete: bool) -> None:
+        self.items = items
+        self.scores = {entry: score for score, entry in items}
+        self.complete = complete
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def discard(self, entry: _Entry) -> None:
+        score = self.scores.pop(entry, _MISSING)
+        if score is not _MISSING:
+            del self.items[self._position((score, entry))]
+
+    def place(self, item: tuple[Any, _Entry]) -> None:
+        self.scores[item[1]] = item[0]
+        self.items.insert(self._position(item), item)
+
+    def pop(self) -> None:
+        del self.scores[self.items.pop()[1]]
+
+    def _position(self, item: tuple[Any, _Entry]) -> int:
+        items = self.items
+        lo, hi = 0, len(items)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _ahead(items[mid], item):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+def _ahead(a: tuple[Any, _Entry], b: tuple[Any, _Entry]) -> bool:
+    """Whether *a* ranks before *b*: higher score, ties alphabetically — matching ``_compute``."""
+    return a[0] > b[0] or (a[0] == b[0] and a[1] < b[1])
+
+
+class _PrefixRanking:
+    """Sorted ``(key, ref)`` array with cached top-N lists for short prefixes."""
+
+    def __init__(
+        self,
+        scorers: dict[CompletionRank, Callable[[_Entry], Any]],
+        cache_prefix_length: int,
+        cache_size: int,
+    ) -> None:
+        self._entries: list[_Entry] = []
+        self._scorers = scorers
+        self._cache_prefix_length = cache_prefix_length
+        self._cache_size = cache_size
+        self._cache_capacity = cache_size * _CACHE_SLACK
+        self._top: dict[tuple[str, CompletionRank], _TopList] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, entry: _Entry) -> None:
+        insort(self._entries, entry)
+        self._offer(entry)
+
+    def insert_many(self, entries: Iterable[_Entry]) -> None:
+        self._entries.extend(entries)
+        self._entries.sort()
+        self._top.clear()
+
+    def delete(self, entry: _Entry) -> None:
+        i = bisect_left(self._entries, entry)
+        if i < len(self._entries) and self._entries[i] == entry:
+            del self._entries[i]
+        for key in self._cache_keys(entry[0]):
+            top = self._top.get(key)
+            if top is not None:
+                top.discard(entry)
+
+    def rescore(self, entry: _Entry) -> None:
+        """Re-rank *entry* after the data behind its score changed."""
+        self._offer(entry)
+
+    def top(self, prefix: str, k: int, rank: CompletionRank) -> list[tuple[Any, _Entry]]:
+        if len(prefix) <= self._cache_prefix_length and k <= self._cache_size:
+            key = (prefix, rank)
+            top = self._top.get(key)
+            if top is None or (len(top) < k and not top.complete):
+                items = self._compute(prefix, rank, self._cache_capacity)
+                top = self._top[key] = _TopList(items, len(items) < self._cache_capacity)
+            return top.items[:k]
+        return self._compute(prefix, rank, k)
+
+    def _compute(self, prefix: str, rank: CompletionRank, k: int) -> list[tuple[Any, _Entry]]:
+        lo = bisect_left(self._entries, (prefix,))
+        hi = bisect_left(self._entries, (prefix + _PREFIX_END,))
+        scorer = self._scorers[rank]
+        # nlargest is stable, so ties keep the array's alphabetical order.
+        return heapq.nlargest(
+            k,
+            ((scorer(e), e) for e in self._entries[lo:hi]),
+            key=itemgetter(0),
+        )
+
+    def _cache_keys(self, text: str) -> Iterable[tuple[str, CompletionRank]]:
+        for n in range(min(len(text), self._cache_prefix_length) + 1):
+            for rank in _RANKS:
+                yield (text[:n], rank)
+
+    def _offer(self, entry: _Entry) -> None:
+        scores = {rank: scorer(entry) for rank, scorer in self._scorers.items()}
+        for key in self._cache_keys(entry[0]):
+            top = self._top.get(key)
+            if top is None:
+                continue
+            item = (scores[key[1]], entry)
+            top.discard(entry)
+            # Every entry outside an incomplete list ranks below its last
+            # one, so only an entry ahead of that is known to belong in it.
+            if top.complete or (top.items and _ahead(item, top.items[-1])):
+                top.place(item)
+                if len(top) > self._cache_capacity:
+                    top.pop()
+                    top.complete = False
+
+
+# ─── Index ────────────────────────────────────────────────────────────────────
+
+class AutocompleteIndex:
+    """
+    Incrementally maintained typeahead over minion titles and tags.
+
+    Title completions rank by the minion's ``updated_at`` (``"recency"``) or
+    by how often it was picked via :meth:`record_use` (``"usage"``, ties
+    broken by recency).  Tag completions rank by the newest ``updated_at`` of
+    any minion carrying the tag, or by how many minions carry it.
+    Soft-deleted minions are not indexed.
+    """
+
+    def __init__(self, cache_prefix_length: int = 3, cache_size: int = 16) -> None:
+        self._display: dict[str, str] = {}
+        self._titles: dict[str, str] = {}
+        self._tags_of: dict[str, tuple[str, ...]] = {}
+        self._updated: dict[str, str] = {}
+        self._uses: dict[str, int] = {}
+        self._tag_members: dict[str, dict[str, str]] = {}
+        self._tag_recency: dict[str, str] = {}
+
+        self._title_ranking = _PrefixRanking(
+            {
+                "recency": lambda e: self._updated[e[1]],
+                "usage": lambda e: (self._uses.get(e[1], 0), self._updated[e[1]]),
+            },
+            cache_prefix_length,
+            cache_size,
+        )
+        self._tag_ranking = _PrefixRanking(
+            {
+                "recency": lambda e: self._tag_recency[e[0]],
+                "usage": lambda e: (len(self._tag_members[e[0]]), self._tag_recency[e[0]]),
+            },
+            cache_prefix_length,
+            cache_size,
+        )
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._titles
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+
+    def add(self, minion: Minion) -> None:
+        """Index (or re-index) a minion. Soft-deleted minions are removed instead."""
+        if minion.deleted_at:
+            self.remove(minion.id)
+            return
+
+        id = minion.id
+        text = minion.title.lower()
+        tags = _normalize_tags(minion.tags)
+        old_text = self._titles.get(id)
+        old_tags = self._tags_of.get(id, ())
+
+        self._display[id] = minion.title
+        self._updated[id] = minion.updated_at
+        self._titles[id] = text
+        self._tags_of[id] = tags
+
+        if old_text is None:
+            self._title_ranking.insert((text, id))
+        elif old_text != text:
+            self._title_ranking.delete((old_text, id))
+            self._title_ranking.insert((text, id))
+        else:
+            self._title_ranking.rescore((text, id))
+
+        for tag in old_tags:
+            if tag not in tags:
+                self._leave_tag(tag, id)
+        for tag in tags:
+            self._join_tag(tag, id, minion.updated_at)
+
+    def add_many(self, minions: Iterable[Minion]) -> None:
+        """
+        Index many minions, sorting the prefix arrays once instead of per insert.
+        Minions that are already indexed or soft-deleted go through :meth:`add`.
+        """
+        new_titles: list[_Entry] = []
+        new_tags: list[_Entry] = []
+        for minion in minions:
+            if minion.deleted_at or minion.id in self._titles:
+                self.add(minion)
+                continue
+            id = minion.id
+            text = minion.title.lower()
+            tags = _normalize_tags(minion.tags)
+            self._display[id] = minion.title
+            self._updated[id] = minion.updated_at
+            self._titles[id] = text
+            self._tags_of[id] = tags
+            new_titles.append((text, id))
+            for tag in tags:
+                members = self._tag_members.get(tag)
+                if members is None:
+                    self._tag_members[tag] = {id: minion.updated_at}
+                    self._tag_recency[tag] = minion.updated_at
+                    new_tags.append((tag, ""))
+                else:
+                    members[id] = minion.updated_at
+                    if minion.updated_at > self._tag_recency[tag]:
+                        self._tag_recency[tag] = minion.updated_at
+
+        self._title_ranking.insert_many(new_titles)
+        self._tag_ranking.insert_many(new_tags)
+
+    def remove(self, id: str) -> None:
+        """Drop a minion from the index. Does nothing if it is not indexed."""
+        text = self._titles.pop(id, None)
+        if text is None:
+            return
+        self._title_ranking.delete((text, id))
+        for tag in self._tags_of.pop(id, ()):
+            self._leave_tag(tag, id)
+        self._display.pop(id, None)
+        self._updated.pop(id, None)
+        self._uses.pop(id, None)
+
+    def record_use(self, id: str) -> None:
+        """Count one selection of minion *id*, raising its ``"usage"`` rank."""
+        text = self._titles.get(id)
+        if text is None:
+            return
+        self._uses[id] = self._uses.get(id, 0) + 1
+        self._title_ranking.rescore((text, id))
+
+    def _join_tag(self, tag: str, id: str, updated_at: str) -> None:
+        members = self._tag_members.get(tag)
+        if members is None:
+            self._tag_members[tag] = {id: updated_at}
+            self._tag_recency[tag] = updated_at
+            self._tag_ranking.insert((tag, ""))
+            return
+        previous = members.get(id)
+        members[id] = updated_at
+        if updated_at >= self._tag_recency[tag]:
+            self._tag_recency[tag] = updated_at
+        elif previous == self._tag_recency[tag]:
+            self._tag_recency[tag] = max(members.values())
+        self._tag_ranking.rescore((tag, ""))
+
+    def _leave_tag(self, tag: str, id: str) -> None:
+        members = self._tag_members[tag]
+        previous = members.pop(id, None)
+        if not members:
+            self._tag_ranking.delete((tag, ""))
+            del self._tag_members[tag]
+            del self._tag_recency[tag]
+            return
+        if previous == self._tag_recency[tag]:
+            self._tag_recency[tag] = max(members.values())
+        self._tag_ranking.rescore((tag, ""))
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def suggest(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+        kinds: Iterable[CompletionKind] = ("title", "tag"),
+    ) -> list[Completion]:
+        """Return the top *k* completions for *prefix* (case-insensitive)."""
+        if k <= 0:
+            return []
+        prefix = prefix.lower()
+        kinds = set(kinds)
+
+        ranked: list[tuple[Any, int, Completion]] = []
+        if "title" in kinds:
+            for score, (_, id) in self._title_ranking.top(prefix, k, rank):
+                ranked.append((score, 0, Completion(self._display[id], "title", id)))
+        if "tag" in kinds:
+            for score, (tag, _) in self._tag_ranking.top(prefix, k, rank):
+                ranked.append((score, 1, Completion(tag, "tag")))
+
+        if len(kinds) > 1:
+            ranked.sort(key=itemgetter(1))
+            ranked.sort(key=itemgetter(0), reverse=True)
+        return [c for _, _, c in ranked[:k]]
+
+
+def _normalize_tags(tags: Optional[list[str]]) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(t.lower() for t in tags or ()))
@@ -1,6 +1,7 @@
 from .client import Minions, MinionWrapper
+from .subgraph import MinionSubgraph
 from .plugin import MinionPlugin
 from .middleware import MinionMiddleware, MinionContext, MinionOperation, run_middleware
 
-__all__ = ["Minions", "MinionWrapper", "MinionPlugin", "MinionMiddleware", "MinionContext", "MinionOperation", "run_middleware"]
+__all__ = ["Minions", "MinionWrapper", "MinionSubgraph", "MinionPlugin", "MinionMiddleware", "MinionContext", "MinionOperation", "run_middleware"]
 
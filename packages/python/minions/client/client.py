@@ -1,10 +1,13 @@
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Optional, Any
 from ..types import Minion, MinionType, CreateMinionInput, UpdateMinionInput, RelationType
+from ..autocomplete import Completion, CompletionRank
 from ..registry import TypeRegistry
-from ..relations import RelationGraph
+from ..relations import RelationGraph, TraversalDirection
 from ..lifecycle import create_minion, update_minion, soft_delete, hard_delete, restore_minion
 from ..storage.adapter import StorageAdapter, StorageFilter
+from ..storage.relation_adapter import RelationStorageAdapter
 from .plugin import MinionPlugin
+from .subgraph import MinionSubgraph
 from .middleware import MinionMiddleware, MinionContext, run_middleware
 
 class MinionWrapper:
@@ -43,6 +46,12 @@ class Minions:
             print(f"{ctx.operation} completed")
 
         minions = Minions(middleware=[logger])
+
+    Pass a ``relation_storage`` adapter to persist the relation graph; it is
+    loaded lazily, one minion's neighbourhood at a time::
+
+        relations = SqliteRelationStorageAdapter("./data/relations.db")
+        minions = Minions(storage=storage, relation_storage=relations)
     """
     registry: TypeRegistry
     graph: RelationGraph
@@ -52,11 +61,14 @@ class Minions:
         plugins: Optional[List[MinionPlugin]] = None,
         storage: Optional[StorageAdapter] = None,
         middleware: Optional[List[MinionMiddleware]] = None,
+        relation_storage: Optional[RelationStorageAdapter] = None,
     ):
         self.registry = TypeRegistry()
-        self.graph = RelationGraph()
+        self.graph = RelationGraph(relation_storage, lazy=True)
         self.storage: Optional[StorageAdapter] = storage
         self._middleware: List[MinionMiddleware] = middleware or []
+        #: Fingerprint of each minion as this client last saved or loaded it.
+        self._persisted: Dict[str, str] = {}
 
         if plugins:
             for plugin in plugins:
@@ -155,15 +167,25 @@ class Minions:
             )
         return self.storage
 
-    async def save(self, minion: Minion) -> None:
+    async def save(self, minion: Minion, force: bool = False) -> None:
         """
         Persist a minion to the configured storage adapter.
+
+        The write is skipped when the minion's ``fingerprint``, computed
+        afresh on every call, matches the version this client last saved or
+        loaded.  Pass ``force=True`` to
+        write regardless, e.g. when another process shares the storage.
         Raises if no storage adapter has been configured.
         """
         async def core(ctx: MinionContext):
-            await self._require_storage().set(minion)
+            storage = self._require_storage()
+            fingerprint = minion.fingerprint
+            if not force and self._persisted.get(minion.id) == fingerprint:
+                return
+            await storage.set(minion)
+            self._persisted[minion.id] = fingerprint
 
-        await self._run("save", {"minion": minion}, core)
+        await self._run("save", {"minion": minion, "force": force}, core)
 
     async def load(self, id: str) -> Optional[Minion]:
         """
@@ -173,10 +195,54 @@ class Minions:
         """
         async def core(ctx: MinionContext):
             ctx.result = await self._require_storage().get(id)
+            if ctx.result is not None:
+                self._persisted[id] = ctx.result.fingerprint
 
         ctx = await self._run("load", {"id": id}, core)
         return ctx.result
 
+    async def load_with_relations(
+        self,
+        id: str,
+        depth: int = 1,
+        types: Optional[Iterable[RelationType]] = None,
+        direction: TraversalDirection = "both",
+        max_nodes: Optional[int] = None,
+    ) -> Optional[MinionSubgraph]:
+        """
+        Load a minion together with everything within *depth* hops of it.
+
+        The relation graph is walked along *types* relations (all types when
+        ``None``) in *direction*, then every reached minion is fetched with a
+        single ``storage.get_many`` call, avoiding one ``load`` per neighbour.
+        Returns ``None`` if the minion does not exist.
+        Raises if no storage adapter has been configured.
+        """
+        async def core(ctx: MinionContext):
+            storage = self._require_storage()
+            types_ = None if types is None else tuple(types)
+            depths = {id: 0}
+            for step in self.graph.traverse(id, types_, direction, depth, max_nodes):
+                depths[step.node] = step.depth
+            minions = {m.id: m for m in await storage.get_many(depths)}
+            if id not in minions:
+                ctx.result = None
+                return
+            relations = [
+                r for node in depths for r in self.graph.get_from_source(node)
+                if r.target_id in depths and (types_ is None or r.type in types_)
+            ]
+            ctx.result = MinionSubgraph(
+                root=minions[id], minions=minions, relations=relations, depths=depths,
+            )
+
+        ctx = await self._run(
+            "load_with_relations",
+            {"id": id, "depth": depth, "types": types, "direction": direction},
+            core,
+        )
+        return ctx.result
+
     async def remove(self, minion: Minion) -> None:
         """
         Remove a minion from the configured storage adapter.
@@ -186,9 +252,61 @@ class Minions:
         async def core(ctx: MinionContext):
             hard_delete(minion, self.graph)
             await self._require_storage().delete(minion.id)
+            self._persisted.pop(minion.id, None)
 
         await self._run("remove", {"minion": minion}, core)
 
+    async def remove_subtree(
+        self,
+        root_id: str,
+        types: Iterable[RelationType] = ("parent_of",),
+        soft: bool = False,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        batch_size: int = 500,
+    ) -> List[str]:
+        """
+        Remove a minion and everything reachable from it along *types*
+        relations (its ``parent_of`` descendants by default).
+
+        The subtree is collected with one graph traversal, then written in
+        batches of *batch_size*: a hard delete drops every relation touching
+        the subtree and calls ``storage.delete_many``; ``soft=True`` marks the
+        stored minions deleted with one ``get_many``/``set_many`` per batch and
+        keeps their relations.  ``on_progress(done, total)`` is called after
+        each batch.  Returns the IDs of the subtree, root first.
+        Raises if no storage adapter has been configured.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        async def core(ctx: MinionContext):
+            storage = self._require_storage()
+            types_ = tuple(types)
+            ids = [root_id, *(step.node for step in self.graph.traverse(root_id, types_))]
+            if not soft:
+                self.graph.remove_by_minion_ids(ids)
+            for start in range(0, len(ids), batch_size):
+                batch = ids[start:start + batch_size]
+                if soft:
+                    await storage.set_many([
+                        soft_delete(m) for m in await storage.get_many(batch)
+                        if m.deleted_at is None
+                    ])
+                else:
+                    await storage.delete_many(batch)
+                for id in batch:
+                    self._persisted.pop(id, None)
+                if on_progress is not None:
+                    on_progress(start + len(batch), len(ids))
+            ctx.result = ids
+
+        ctx = await self._run(
+            "remove_subtree",
+            {"root_id": root_id, "types": types, "soft": soft},
+            core,
+        )
+        return ctx.result
+
     async def list_minions(self, filter: Optional[StorageFilter] = None) -> List[Minion]:
         """
         List persisted minions from the configured storage adapter.
@@ -200,13 +318,48 @@ class Minions:
         ctx = await self._run("list", {"filter": filter}, core)
         return ctx.result
 
-    async def search_minions(self, query: str) -> List[Minion]:
+    async def search_minions(self, query: str, fuzzy: bool = False) -> List[Minion]:
         """
         Full-text search across persisted minions.
+        Pass ``fuzzy=True`` to also match words within a small edit distance
+        of each query token.
+        Raises if no storage adapter has been configured.
+        """
+        async def core(ctx: MinionContext):
+            storage = self._require_storage()
+            if fuzzy:
+                ctx.result = await storage.search(query, fuzzy=True)
+            else:
+                ctx.result = await storage.search(query)
+
+        ctx = await self._run("search", {"query": query, "fuzzy": fuzzy}, core)
+        return ctx.result
+
+    async def similar_minions(self, minion_id: str, k: int = 10) -> List[Minion]:
+        """
+        Find up to ``k`` persisted minions most similar to ``minion_id``
+        (TF-IDF cosine over search tokens), most similar first.
+        Raises if no storage adapter has been configured.
+        """
+        async def core(ctx: MinionContext):
+            ctx.result = await self._require_storage().similar(minion_id, k)
+
+        ctx = await self._run("similar", {"minion_id": minion_id, "k": k}, core)
+        return ctx.result
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+    ) -> List[Completion]:
+        """
+        Typeahead over persisted minion titles and tags, ranked by
+        ``"recency"`` or ``"usage"``.
         Raises if no storage adapter has been configured.
         """
         async def core(ctx: MinionContext):
-            ctx.result = await self._require_storage().search(query)
+            ctx.result = await self._require_storage().autocomplete(prefix, k, rank)
 
-        ctx = await self._run("search", {"query": query}, core)
+        ctx = await self._run("autocomplete", {"prefix": prefix, "k": k, "rank": rank}, core)
         return ctx.result
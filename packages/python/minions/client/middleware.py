@@ -31,9 +31,13 @@ MinionOperation = Literal[
     "restore",
     "save",
     "load",
+    "load_with_relations",
     "remove",
+    "remove_subtree",
     "list",
     "search",
+    "similar",
+    "autocomplete",
 ]
 
 
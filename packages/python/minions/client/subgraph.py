@@ -0,0 +1,61 @@
+"""
+Minions SDK — Resolved Subgraph
+A minion together with the neighbourhood loaded by ``Minions.load_with_relations``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from ..relations import TraversalDirection
+from ..types import Minion, Relation, RelationType
+
+
+@dataclass
+class MinionSubgraph:
+    """
+    A root minion, the minions reached from it, and the relations among them.
+
+    ``minions`` maps id to minion for every reached minion found in storage
+    (the root included); ``depths`` records how many hops each id is from the
+    root.  ``relations`` holds every relation of the followed types whose
+    endpoints were both reached, so the subgraph can be rendered without
+    going back to storage.
+    """
+
+    root: Minion
+    minions: dict[str, Minion] = field(default_factory=dict)
+    relations: list[Relation] = field(default_factory=list)
+    depths: dict[str, int] = field(default_factory=dict)
+
+    def get(self, id: str) -> Optional[Minion]:
+        return self.minions.get(id)
+
+    def neighbors(
+        self,
+        id: str,
+        types: Optional[Iterable[RelationType]] = None,
+        direction: TraversalDirection = "out",
+    ) -> list[Minion]:
+        """Resolved minions linked to *id* within the subgraph."""
+        type_set = None if types is None else set(types)
+        found: dict[str, Minion] = {}
+        for r in self.relations:
+            if type_set is not None and r.type not in type_set:
+                continue
+            if direction != "in" and r.source_id == id:
+                other = r.target_id
+            elif direction != "out" and r.target_id == id:
+                other = r.source_id
+            else:
+                continue
+            if other in self.minions:
+                found.setdefault(other, self.minions[other])
+        return list(found.values())
+
+    def children(self, id: str) -> list[Minion]:
+        return self.neighbors(id, ["parent_of"], "out")
+
+    def parents(self, id: str) -> list[Minion]:
+        return self.neighbors(id, ["parent_of"], "in")
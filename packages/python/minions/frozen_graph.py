@@ -0,0 +1,212 @@
+"""
+Minions SDK — Frozen Relation Graph
+Immutable compressed-sparse-row (CSR) snapshot of a RelationGraph.
+
+Minion ids are interned to dense ints and relation types to small ints, and
+adjacency is stored as flat :mod:`array` columns: ``out_offsets[i]`` …
+``out_offsets[i + 1]`` delimit node ``i``'s slice of ``out_targets`` (and
+``out_types``), with the same layout mirrored for incoming edges.  A snapshot
+costs a few dozen bytes per edge instead of a full :class:`Relation` object
+plus five index entries, and walks neighbours without touching any Python
+objects beyond ints.
+
+Snapshots keep topology only (source, target, type) — not relation ids,
+timestamps or metadata.  Build one with :meth:`RelationGraph.freeze`.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from itertools import repeat
+from typing import Iterable, Iterator, Optional
+
+from .types import Relation, RelationType
+
+
+class FrozenRelationGraph:
+    """
+    Read-only CSR adjacency over interned minion ids.
+
+    String-keyed queries (:meth:`neighbors`, :meth:`traverse`) mirror
+    :class:`~minions.relations.RelationGraph`; the int-level columns and
+    :meth:`successors` / :meth:`predecessors` are there for analytics that
+    want to stay in integer space (see :mod:`minions.graph_analytics`).
+    """
+
+    __slots__ = (
+        "ids", "index", "types", "type_codes",
+        "out_offsets", "out_targets", "out_types",
+        "in_offsets", "in_sources", "in_types",
+    )
+
+    def __init__(self, relations: Iterable[Relation]) -> None:
+        ids: list[str] = []
+        index: dict[str, int] = {}
+        type_codes: dict[str, int] = {}
+        sources = array("i")
+        targets = array("i")
+        codes = array("B")
+        for r in relations:
+            s = index.get(r.source_id)
+            if s is None:
+                s = index[r.source_id] = len(ids)
+                ids.append(r.source_id)
+            t = index.get(r.target_id)
+            if t is None:
+                t = index[r.target_id] = len(ids)
+                ids.append(r.target_id)
+            c = type_codes.get(r.type)
+            if c is None:
+                c = type_codes[r.type] = len(type_codes)
+            sources.append(s)
+            targets.append(t)
+            codes.append(c)
+
+        #: Interned minion ids: ``ids[i]`` is the minion for int ``i``.
+        self.ids = ids
+        #: Minion id → int.
+        self.index = index
+        #: Relation type names by code.
+        self.types: tuple[RelationType, ...] = tuple(type_codes)
+        #: Relation type → code.
+        self.type_codes = type_codes
+        self.out_offsets, self.out_targets, self.out_types = _csr(len(ids), sources, targets, codes)
+        self.in_offsets, self.in_sources, self.in_types = _csr(len(ids), targets, sources, codes)
+
+    # ── Size ──────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Number of minions with at least one relation."""
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.out_targets)
+
+    def nbytes(self) -> int:
+        """Bytes held by the adjacency arrays (excluding the intern table)."""
+        return sum(
+            a.itemsize * len(a)
+            for a in (
+                self.out_offsets, self.out_targets, self.out_types,
+                self.in_offsets, self.in_sources, self.in_types,
+            )
+        )
+
+    # ── Int-level access ──────────────────────────────────────────────────────
+
+    def successors(self, node: int) -> array:
+        """Target ints of node ``node``'s outgoing relations."""
+        return self.out_targets[self.out_offsets[node]:self.out_offsets[node + 1]]
+
+    def predecessors(self, node: int) -> array:
+        """Source ints of node ``node``'s incoming relations."""
+        return self.in_sources[self.in_offsets[node]:self.in_offsets[node + 1]]
+
+    def edge_sources(self) -> array:
+        """Source int of every edge, parallel to ``out_targets`` / ``out_types``."""
+        sources = array("i")
+        offsets = self.out_offsets
+        for node in range(len(self.ids)):
+            sources.extend(repeat(node, offsets[node + 1] - offsets[node]))
+        return sources
+
+    def out_degree(self, node: int) -> int:
+        return self.out_offsets[node + 1] - self.out_offsets[node]
+
+    def in_degree(self, node: int) -> int:
+        return self.in_offsets[node + 1] - self.in_offsets[node]
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def neighbors(
+        self,
+        minion_id: str,
+        types: Optional[Iterable[RelationType]] = None,
+        direction: str = "out",
+    ) -> list[str]:
+        """
+        Ids one hop from *minion_id* along (``"out"``), against (``"in"``)
+        or either way of (``"both"``) relations of *types* (all when
+        ``None``), with repeats for parallel edges.
+        """
+        node = self.index.get(minion_id)
+        if node is None:
+            return []
+        codes = self._codes(types)
+        ids = self.ids
+        return [ids[n] for n in self._step(node, codes, direction)]
+
+    def traverse(
+        self,
+        start: str,
+        types: Optional[Iterable[RelationType]] = None,
+        direction: str = "out",
+        max_depth: Optional[int] = None,
+    ) -> Iterator[tuple[str, int]]:
+        """
+        Breadth-first walk from *start*, yielding ``(minion_id, depth)`` for
+        each minion reached (the start itself is not yielded).  Parameters
+        match :meth:`RelationGraph.traverse`.
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f'Unknown traversal direction "{direction}"')
+        node = self.index.get(start)
+        if node is None:
+            return
+        codes = self._codes(types)
+        ids = self.ids
+        seen = bytearray(len(ids))
+        seen[node] = 1
+        queue = deque([(node, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for n in self._step(node, codes, direction):
+                if not seen[n]:
+                    seen[n] = 1
+                    yield ids[n], depth + 1
+                    queue.append((n, depth + 1))
+
+    def _codes(self, types: Optional[Iterable[RelationType]]) -> Optional[frozenset[int]]:
+        if types is None:
+            return None
+        return frozenset(self.type_codes[t] for t in types if t in self.type_codes)
+
+    def _step(self, node: int, codes: Optional[frozenset[int]], direction: str) -> list[int]:
+        result: list[int] = []
+        if direction != "in":
+            lo, hi = self.out_offsets[node], self.out_offsets[node + 1]
+            if codes is None:
+                result.extend(self.out_targets[lo:hi])
+            else:
+                kinds = self.out_types
+                result.extend(t for t, k in zip(self.out_targets[lo:hi], kinds[lo:hi]) if k in codes)
+        if direction != "out":
+            lo, hi = self.in_offsets[node], self.in_offsets[node + 1]
+            if codes is None:
+                result.extend(self.in_sources[lo:hi])
+            else:
+                kinds = self.in_types
+                result.extend(s for s, k in zip(self.in_sources[lo:hi], kinds[lo:hi]) if k in codes)
+        return result
+
+
+def _csr(n: int, keys: array, values: array, codes: array) -> tuple[array, array, array]:
+    """Counting-sort ``(key, value, code)`` triples into CSR columns, keeping input order per key."""
+    offsets = array("q", bytes(8 * (n + 1)))
+    for k in keys:
+        offsets[k + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    cursor = offsets[:-1]
+    out_values = array("i", bytes(4 * len(values)))
+    out_codes = array("B", bytes(len(codes)))
+    for k, v, c in zip(keys, values, codes):
+        pos = cursor[k]
+        out_values[pos] = v
+        out_codes[pos] = c
+        cursor[k] = pos + 1
+    return offsets, out_values, out_codes
@@ -13,8 +13,9 @@ from datetime import datetime, timezone
 from typing import Any
 
 from .types import Minion, MinionType, FieldDefinition
-from .validation import validate_fields, ValidationResult
+from .validation import CompiledValidator, ValidationResult, compile_validator
 from .relations import RelationGraph
+from .search import JSON_SEARCH_MAX_CHARS, iter_json_strings, tokenize
 
 
 # ─── Utility Functions ────────────────────────────────────────────────────────
@@ -36,25 +37,78 @@ _SEARCHABLE_FIELD_TYPES = frozenset([
 ])
 
 
+_JSON_SEARCHABLE_FIELD_TYPES = frozenset(["json", "array"])
+
+
+class _SearchableTextExtractor:
+    """
+    Searchable-text builder specialised for one MinionType schema.
+
+    The searchable field names are resolved once from the schema, so each
+    call only looks up the fields that can contribute text.  ``json`` and
+    ``array`` fields contribute only when they opt in via ``search_paths``.
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, schema: list[FieldDefinition]) -> None:
+        #: ``(field_name, kind, search_paths, max_chars)`` in schema order,
+        #: where kind is ``"text"``, ``"tags"`` or ``"json"``.
+        fields: list[tuple[str, str, tuple[str, ...], int]] = []
+        for f in schema:
+            if f.type in _SEARCHABLE_FIELD_TYPES:
+                fields.append((f.name, "tags" if f.type == "tags" else "text", (), 0))
+            elif f.type in _JSON_SEARCHABLE_FIELD_TYPES and f.search_paths:
+                max_chars = f.search_max_chars if f.search_max_chars is not None else JSON_SEARCH_MAX_CHARS
+                fields.append((f.name, "json", tuple(f.search_paths), max_chars))
+        self.fields = tuple(fields)
+
+    def __call__(self, minion: Minion) -> tuple[str, tuple[str, ...]]:
+        """Return ``(searchable_text, search_tokens)`` for *minion*."""
+        parts: list[str] = [minion.title]
+
+        if minion.description:
+            parts.append(minion.description)
+
+        fields = minion.fields
+        for name, kind, paths, max_chars in self.fields:
+            value = fields.get(name)
+            if value is None:
+                continue
+            if kind == "json":
+                parts.extend(iter_json_strings(value, paths, max_chars))
+            elif kind == "tags" and isinstance(value, list):
+                parts.append(" ".join(value))
+            elif isinstance(value, str):
+                parts.append(value)
+
+        text = " ".join(parts).lower()
+        return text, tokenize(text)
+
+
+def _searchable_text_extractor(type: MinionType) -> _SearchableTextExtractor:
+    return type._compiled_for("searchable_text", _SearchableTextExtractor)
+
+
 def _compute_searchable_text(minion: Minion, type: MinionType) -> str:
     """Compute a lowercased full-text search string from a minion."""
-    parts: list[str] = [minion.title]
+    return _searchable_text_extractor(type)(minion)[0]
 
-    if minion.description:
-        parts.append(minion.description)
 
-    for field_def in type.schema:
-        if field_def.type not in _SEARCHABLE_FIELD_TYPES:
-            continue
-        value = minion.fields.get(field_def.name)
-        if value is None:
-            continue
-        if field_def.type == "tags" and isinstance(value, list):
-            parts.append(" ".join(value))
-        elif isinstance(value, str):
-            parts.append(value)
+def _index_searchable_text(minion: Minion, type: MinionType) -> None:
+    """Set ``searchable_text`` and ``search_tokens`` on a freshly built minion."""
+    minion.searchable_text, minion.search_tokens = _searchable_text_extractor(type)(minion)
+
+
+# ─── Validation ──────────────────────────────────────────────────────────────
 
-    return " ".join(parts).lower()
+def _compile_generated(schema: list[FieldDefinition]) -> CompiledValidator:
+    return compile_validator(schema, codegen=True)
+
+
+def _field_validator(type: MinionType) -> CompiledValidator:
+    """The type's compiled ``validate_fields``, rebuilt when its schema changes."""
+    return type._compiled_for("validator", _compile_generated)
 
 
 # ─── Defaults ─────────────────────────────────────────────────────────────────
@@ -97,7 +151,7 @@ def create_minion(
     Returns a tuple of (minion, validation_result).
     """
     fields = apply_defaults(input.get("fields") or {}, type)
-    validation = validate_fields(fields, type.schema)
+    validation = _field_validator(type)(fields)
 
     ts = now()
     minion = Minion(
@@ -117,7 +171,7 @@ def create_minion(
         created_by=input.get("created_by") or input.get("createdBy"),
     )
 
-    minion.searchable_text = _compute_searchable_text(minion, type)
+    _index_searchable_text(minion, type)
     return minion, validation
 
 
@@ -127,41 +181,64 @@ def update_minion(
     minion: Minion,
     input: dict[str, Any],
     type: MinionType,
+    *,
+    incremental: bool = True,
 ) -> tuple[Minion, ValidationResult]:
     """
     Update an existing Minion with new values.
     Validates updated fields against the provided MinionType schema.
 
+    By default only the fields present in ``input["fields"]`` are
+    type-checked, plus the presence of every required field; for a minion
+    that was valid before the update this gives the same result as
+    validating every field.  Pass ``incremental=False`` to re-validate the
+    whole schema, e.g. after the schema itself changed.
+
+    With ``incremental=True``, an update that would leave every attribute
+    and the search index as they are returns *minion* itself, with only the
+    presence of required fields checked and ``updated_at`` untouched.
+
     Returns a tuple of (updated_minion, validation_result).
     """
     # Merge fields — strip keys whose value is None (standing in for TS undefined)
-    merged_fields = {**minion.fields, **(input.get("fields") or {})}
+    changed = input.get("fields") or {}
+    merged_fields = {**minion.fields, **changed}
     fields = {k: v for k, v in merged_fields.items() if v is not None}
-    validation = validate_fields(fields, type.schema)
+    values = {
+        "title": input.get("title") or minion.title,
+        "fields": fields,
+        "tags": input.get("tags") if input.get("tags") is not None else minion.tags,
+        "status": input.get("status") or minion.status,
+        "priority": input.get("priority") or minion.priority,
+        "description": input.get("description") if input.get("description") is not None else minion.description,
+        "due_date": input.get("due_date") or input.get("dueDate") or minion.due_date,
+        "category_id": input.get("category_id") or input.get("categoryId") or minion.category_id,
+        "folder_id": input.get("folder_id") or input.get("folderId") or minion.folder_id,
+        "updated_by": input.get("updated_by") or input.get("updatedBy"),
+    }
+    validator = _field_validator(type)
+
+    if incremental and all(getattr(minion, name) == value for name, value in values.items()):
+        # The type's schema may have changed since *minion* was indexed.
+        if _searchable_text_extractor(type)(minion) == (minion.searchable_text, minion.search_tokens):
+            return minion, validator.validate_subset(fields, ())
+
+    validation = validator.validate_subset(fields, changed) if incremental else validator(fields)
 
     updated = Minion(
         id=minion.id,
-        title=input.get("title") or minion.title,
         minion_type_id=minion.minion_type_id,
-        fields=fields,
         created_at=minion.created_at,
         updated_at=now(),
-        tags=input.get("tags") if input.get("tags") is not None else minion.tags,
-        status=input.get("status") or minion.status,
-        priority=input.get("priority") or minion.priority,
-        description=input.get("description") if input.get("description") is not None else minion.description,
-        due_date=input.get("due_date") or input.get("dueDate") or minion.due_date,
-        category_id=input.get("category_id") or input.get("categoryId") or minion.category_id,
-        folder_id=input.get("folder_id") or input.get("folderId") or minion.folder_id,
         created_by=minion.created_by,
-        updated_by=input.get("updated_by") or input.get("updatedBy"),
         deleted_at=minion.deleted_at,
         deleted_by=minion.deleted_by,
         searchable_text=minion.searchable_text,
         _legacy=minion._legacy,
+        **values,
     )
 
-    updated.searchable_text = _compute_searchable_text(updated, type)
+    _index_searchable_text(updated, type)
     return updated, validation
 
 
@@ -170,7 +247,7 @@ def update_minion(
 def soft_delete(minion: Minion, deleted_by: str | None = None) -> Minion:
     """Soft-delete a minion by setting deletedAt/deletedBy."""
     ts = now()
-    return Minion(
+    deleted = Minion(
         id=minion.id,
         title=minion.title,
         minion_type_id=minion.minion_type_id,
@@ -191,6 +268,8 @@ def soft_delete(minion: Minion, deleted_by: str | None = None) -> Minion:
         searchable_text=minion.searchable_text,
         _legacy=minion._legacy,
     )
+    deleted.search_tokens = minion.search_tokens
+    return deleted
 
 
 # ─── Hard Delete ──────────────────────────────────────────────────────────────
@@ -207,7 +286,7 @@ def hard_delete(minion: Minion, graph: RelationGraph) -> None:
 
 def restore_minion(minion: Minion) -> Minion:
     """Restore a soft-deleted minion."""
-    return Minion(
+    restored = Minion(
         id=minion.id,
         title=minion.title,
         minion_type_id=minion.minion_type_id,
@@ -228,3 +307,5 @@ def restore_minion(minion: Minion) -> Minion:
         searchable_text=minion.searchable_text,
         _legacy=minion._legacy,
     )
+    restored.search_tokens = minion.search_tokens
+    return restored
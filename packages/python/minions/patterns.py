@@ -0,0 +1,291 @@
+"""
+Minions SDK — Pattern Safety
+Static ReDoS analysis and time-bounded matching for ``FieldValidation.pattern``.
+
+Python's ``re`` is a backtracking engine with no timeout, so a pattern such as
+``(a+)+$`` takes exponential time on a short hostile input.  Patterns are
+analysed once — :class:`~minions.registry.TypeRegistry` does so on
+``register`` — and the two classic catastrophic shapes are reported:
+
+- a variable-length part nested inside a repeat that can also start whatever
+  follows it, so the loop can split the same input many ways (``(a+)+``,
+  ``(\\w+\\s?)*``, ``(\\d|\\d\\d)*``) — ``([a-z]+\\.)+`` is fine;
+- a repeated alternation whose branches can start with the same character
+  (``(\\w|ab)*``).
+
+Patterns without hazards are matched in-process.  Hazardous ones are matched
+in a helper process under a time budget and treated as non-matching when the
+budget runs out, so one bad schema cannot stall the caller.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import re
+import threading
+from functools import lru_cache
+from multiprocessing.connection import Connection
+from re import _constants as _sre  # re internals; stable across 3.11–3.13
+from re import _parser as _sre_parse
+from typing import Any, Callable, Literal, Optional
+
+PatternPolicy = Literal["error", "warn", "allow"]
+"""What :class:`~minions.registry.TypeRegistry` does with a hazardous pattern."""
+
+PATTERN_TIMEOUT = 0.1
+"""Seconds a hazardous pattern may run on one value before it counts as a non-match."""
+
+
+class UnsafePatternWarning(UserWarning):
+    """Issued when a registered type's pattern is prone to catastrophic backtracking."""
+
+
+# ─── Analysis ─────────────────────────────────────────────────────────────────
+
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT)
+_ALL_LOW = frozenset(range(256))
+
+# First-character sets are approximated as (code points below 256, whether
+# any higher code point may also match); a class matching anything at or above
+# 256 only overlaps another such class conservatively.
+_CharSet = tuple[frozenset[int], bool]
+_ANY_CHAR: _CharSet = (_ALL_LOW, True)
+
+
+def _low(regex: str) -> frozenset[int]:
+    compiled = re.compile(regex)
+    return frozenset(c for c in range(256) if compiled.match(chr(c)))
+
+
+_CATEGORIES: dict[Any, frozenset[int]] = {
+    _sre.CATEGORY_DIGIT: _low(r"\d"),
+    _sre.CATEGORY_NOT_DIGIT: _low(r"\D"),
+    _sre.CATEGORY_SPACE: _low(r"\s"),
+    _sre.CATEGORY_NOT_SPACE: _low(r"\S"),
+    _sre.CATEGORY_WORD: _low(r"\w"),
+    _sre.CATEGORY_NOT_WORD: _low(r"\W"),
+}
+
+
+def _class_set(items: list[tuple[Any, Any]]) -> _CharSet:
+    low: set[int] = set()
+    high = False
+    negate = False
+    for op, av in items:
+        if op is _sre.NEGATE:
+            negate = True
+        elif op is _sre.LITERAL:
+            if av < 256:
+                low.add(av)
+            else:
+                high = True
+        elif op is _sre.RANGE:
+            lo, hi = av
+            low.update(range(lo, min(hi, 255) + 1))
+            high = high or hi >= 256
+        elif op is _sre.CATEGORY:
+            low |= _CATEGORIES.get(av, _ALL_LOW)
+            high = True
+        else:
+            return _ANY_CHAR
+    if negate:
+        return _ALL_LOW - low, True
+    return frozenset(low), high
+
+
+def _overlaps(a: _CharSet, b: _CharSet) -> bool:
+    return bool(a[0] & b[0]) or (a[1] and b[1])
+
+
+def _first(items: Any) -> tuple[_CharSet, bool]:
+    """Characters that can start a match of *items*, and whether it can match empty."""
+    low: frozenset[int] = frozenset()
+    high = False
+    for op, av in items:
+        (item_low, item_high), nullable = _first_item(op, av)
+        low |= item_low
+        high = high or item_high
+        if not nullable:
+            return (low, high), False
+    return (low, high), True
+
+
+def _first_item(op: Any, av: Any) -> tuple[_CharSet, bool]:
+    if op is _sre.LITERAL:
+        return (frozenset([av]) if av < 256 else frozenset(), av >= 256), False
+    if op is _sre.NOT_LITERAL:
+        return (_ALL_LOW - {av}, True), False
+    if op is _sre.IN:
+        return _class_set(av), False
+    if op is _sre.SUBPATTERN:
+        return _first(av[3])
+    if op is _sre.ATOMIC_GROUP:
+        return _first(av)
+    if op in _REPEATS or op is _sre.POSSESSIVE_REPEAT:
+        lo, _, body = av
+        first, nullable = _first(body)
+        return first, nullable or lo == 0
+    if op is _sre.BRANCH:
+        low: frozenset[int] = frozenset()
+        high = nullable = False
+        for alternative in av[1]:
+            (alt_low, alt_high), alt_nullable = _first(alternative)
+            low |= alt_low
+            high = high or alt_high
+            nullable = nullable or alt_nullable
+        return (low, high), nullable
+    if op in (_sre.AT, _sre.ASSERT, _sre.ASSERT_NOT):
+        return (frozenset(), False), True
+    return _ANY_CHAR, False  # ANY, back-references, conditionals
+
+
+def _union(a: _CharSet, b: _CharSet) -> _CharSet:
+    return a[0] | b[0], a[1] or b[1]
+
+
+_NOTHING: _CharSet = (frozenset(), False)
+
+
+def _scan(items: Any, follow: _CharSet, repeated: bool, hazards: list[str]) -> None:
+    """
+    Walk *items*, where *follow* is what may come right after them and
+    *repeated* says whether they sit inside a backtracking loop.
+
+    Inside a loop, a variable-length part whose characters can also start
+    what follows it (often the loop's next iteration) gives the engine many
+    ways to split the same input — the source of exponential backtracking.
+    """
+    # What may follow each item: the next items' first characters, plus
+    # *follow* when everything after the item can match empty.
+    follows: list[_CharSet] = [_NOTHING] * len(items)
+    after = follow
+    for k in range(len(items) - 1, -1, -1):
+        follows[k] = after
+        first, nullable = _first_item(*items[k])
+        after = _union(first, after) if nullable else first
+
+    for (op, av), item_follow in zip(items, follows):
+        if op in _REPEATS:
+            lo, hi, body = av
+            variable = lo != hi
+            body_first = _first(body)[0]
+            if variable and repeated and _overlaps(body_first, item_follow):
+                hazards.append("nested quantifier: a variable-length repeat inside another")
+            if hi > 1:
+                _scan(body, _union(body_first, item_follow), True, hazards)
+            else:
+                _scan(body, item_follow, repeated, hazards)
+        elif op is _sre.POSSESSIVE_REPEAT or op is _sre.ATOMIC_GROUP:
+            # Never backtracked into, so an enclosing loop cannot re-split it.
+            _scan(av[2] if op is _sre.POSSESSIVE_REPEAT else av, item_follow, False, hazards)
+        elif op is _sre.SUBPATTERN:
+            _scan(av[3], item_follow, repeated, hazards)
+        elif op is _sre.BRANCH:
+            alternatives = av[1]
+            if repeated:
+                firsts = [_first(alt) for alt in alternatives]
+                if any(
+                    _overlaps(firsts[i][0], firsts[j][0])
+                    for i in range(len(firsts)) for j in range(i + 1, len(firsts))
+                ):
+                    hazards.append("overlapping alternation inside a repeat")
+                if any(nullable for _, nullable in firsts) and any(
+                    _overlaps(first, item_follow) for first, _ in firsts
+                ):
+                    # ``\d(?:|\d)`` — how the parser factors ``(\d|\d\d)``
+                    hazards.append("nested quantifier: an optional alternative inside a repeat")
+            for alternative in alternatives:
+                _scan(alternative, item_follow, repeated, hazards)
+        elif op in (_sre.ASSERT, _sre.ASSERT_NOT):
+            _scan(av[1], _NOTHING, False, hazards)
+        elif op is _sre.GROUPREF_EXISTS:
+            _scan(av[1], item_follow, repeated, hazards)
+            if av[2] is not None:
+                _scan(av[2], item_follow, repeated, hazards)
+
+
+@lru_cache(maxsize=None)
+def analyze_pattern(pattern: str) -> tuple[str, ...]:
+    """
+    Return the catastrophic-backtracking hazards found in *pattern*, each
+    described once; empty when none were found.  Raises ``re.error`` if the
+    pattern does not compile.
+
+    The analysis is a conservative heuristic: it may flag a pattern whose
+    hazard is defused by surrounding context, but catches the classic
+    exponential shapes.
+    """
+    re.compile(pattern)
+    hazards: list[str] = []
+    _scan(_sre_parse.parse(pattern), _NOTHING, False, hazards)
+    return tuple(dict.fromkeys(hazards))
+
+
+# ─── Matching ─────────────────────────────────────────────────────────────────
+
+def _serve(conn: Connection) -> None:
+    """Helper-process loop: answer ``(pattern, text)`` with whether it matches."""
+    compiled: dict[str, re.Pattern[str]] = {}
+    while True:
+        try:
+            pattern, text = conn.recv()
+        except EOFError:
+            return
+        regex = compiled.get(pattern)
+        if regex is None:
+            regex = compiled[pattern] = re.compile(pattern)
+        conn.send(regex.search(text) is not None)
+
+
+class _Sandbox:
+    """A helper process that runs hazardous searches and is killed when one overruns."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+
+    def search(self, pattern: str, text: str, timeout: float) -> bool:
+        with self._lock:
+            if self._process is None:
+                self._conn, child = multiprocessing.Pipe()
+                self._process = multiprocessing.Process(target=_serve, args=(child,), daemon=True)
+                self._process.start()
+                child.close()
+            try:
+                self._conn.send((pattern, text))
+                if self._conn.poll(timeout):
+                    return self._conn.recv()
+            except (EOFError, OSError):
+                pass
+            self._stop()
+            return False
+
+    def _stop(self) -> None:
+        self._process.kill()
+        self._process.join()
+        self._conn.close()
+        self._process = self._conn = None
+
+
+_sandbox = _Sandbox()
+
+
+@lru_cache(maxsize=None)
+def pattern_search(pattern: str, timeout: float = PATTERN_TIMEOUT) -> Callable[[str], Any]:
+    """
+    Return a ``search(text)`` predicate for *pattern*, truthy when it matches.
+
+    Patterns free of hazards (see :func:`analyze_pattern`) get the compiled
+    regex's own ``search``.  Hazardous ones run in a helper process with a
+    *timeout*-second budget per call; an overrun kills the helper and counts
+    as a non-match.
+    """
+    compiled = re.compile(pattern)
+    if not analyze_pattern(pattern):
+        return compiled.search
+
+    def search(text: str) -> bool:
+        return _sandbox.search(pattern, text, timeout)
+
+    return search
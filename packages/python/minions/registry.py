@@ -6,6 +6,10 @@ Mirrors: packages/core/src/registry/index.ts
 
 from __future__ import annotations
 
+import re
+import warnings
+
+from .patterns import PatternPolicy, UnsafePatternWarning, analyze_pattern, pattern_search
 from .types import MinionType
 from .schemas import builtin_types
 
@@ -14,11 +18,20 @@ class TypeRegistry:
     """
     An in-memory registry for MinionTypes.
     Pre-loaded with all built-in system types by default.
+
+    Field patterns are compiled and checked for catastrophic backtracking on
+    :meth:`register`; ``unsafe_patterns`` chooses whether a hazardous one
+    raises ``ValueError``, issues an :class:`UnsafePatternWarning` (the
+    default) or is accepted silently.  Hazardous patterns that are accepted
+    are matched under a time budget (see :mod:`minions.patterns`).
     """
 
-    def __init__(self, load_builtins: bool = True) -> None:
+    def __init__(self, load_builtins: bool = True, *, unsafe_patterns: PatternPolicy = "warn") -> None:
+        if unsafe_patterns not in ("error", "warn", "allow"):
+            raise ValueError(f'Unknown unsafe_patterns policy "{unsafe_patterns}"')
         self._types: dict[str, MinionType] = {}
         self._slug_index: dict[str, str] = {}
+        self._unsafe_patterns = unsafe_patterns
 
         if load_builtins:
             for t in builtin_types:
@@ -27,15 +40,37 @@ class TypeRegistry:
     def register(self, type: MinionType) -> None:
         """
         Register a MinionType in the registry.
-        Raises ValueError if a type with the same id or slug already exists.
+        Raises ValueError if a type with the same id or slug already exists,
+        if a field pattern does not compile, or if a pattern is prone to
+        catastrophic backtracking and the registry's policy is ``"error"``.
         """
         if type.id in self._types:
             raise ValueError(f'Type with id "{type.id}" is already registered')
         if type.slug in self._slug_index:
             raise ValueError(f'Type with slug "{type.slug}" is already registered')
+        self._check_patterns(type)
         self._types[type.id] = type
         self._slug_index[type.slug] = type.id
 
+    def _check_patterns(self, type: MinionType) -> None:
+        for f in type.schema:
+            pattern = f.validation.pattern if f.validation else None
+            if pattern is None:
+                continue
+            try:
+                hazards = analyze_pattern(pattern)
+            except re.error as e:
+                raise ValueError(f'Invalid pattern for field "{f.name}" of type "{type.slug}": {e}') from e
+            if hazards and self._unsafe_patterns != "allow":
+                message = (
+                    f'Pattern {pattern!r} for field "{f.name}" of type "{type.slug}" '
+                    f'is prone to catastrophic backtracking: {"; ".join(hazards)}'
+                )
+                if self._unsafe_patterns == "error":
+                    raise ValueError(message)
+                warnings.warn(message, UnsafePatternWarning, stacklevel=3)
+            pattern_search(pattern)  # compile now rather than on first validation
+
     def get_by_id(self, id: str) -> MinionType | None:
         """Get a type by its ID."""
         return self._types.get(id)
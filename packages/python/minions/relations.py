@@ -6,17 +6,73 @@ Mirrors: packages/core/src/relations/index.ts
 
 from __future__ import annotations
 
+import os
 import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Literal, NamedTuple, Optional
 
 from .types import Relation, RelationType
 
+if TYPE_CHECKING:
+    from .frozen_graph import FrozenRelationGraph
+    from .storage.relation_adapter import RelationStorageAdapter
+
+IfExists = Literal["return", "replace", "error", "allow"]
+"""What :meth:`RelationGraph.add` does when an identical edge already exists."""
+
+SCHEDULING_TYPES: tuple[RelationType, ...] = ("depends_on", "blocks")
+"""Relation types that order work: the defaults for :meth:`RelationGraph.topological_order`."""
+
+# ``a depends_on b`` means b comes first; every other type orders source first.
+_PRECEDENCE_REVERSED = frozenset({"depends_on"})
+
+TraversalDirection = Literal["out", "in", "both"]
+TraversalOrder = Literal["bfs", "dfs"]
+
+
+class TraversalStep(NamedTuple):
+    """A minion reached by :meth:`RelationGraph.traverse`."""
+    node: str
+    #: Number of hops from the start minion (1 for direct neighbours).
+    depth: int
+    #: The relation that was followed to reach ``node``.
+    via: Relation
+
+
+class CriticalPath(NamedTuple):
+    """The longest weighted chain through a dependency DAG."""
+    nodes: list[str]
+    length: float
+
+
+class CycleError(ValueError):
+    """Raised when a relation would close a cycle among acyclic relation types."""
+
+    def __init__(self, cycle: list[str]) -> None:
+        super().__init__("Relation would create a cycle: " + " -> ".join(cycle))
+        #: Minion ids along the cycle, in precedence order; first == last.
+        self.cycle = cycle
+
 
 def _generate_id() -> str:
     return str(uuid.uuid4())
 
 
+def _generate_ids(n: int) -> list[str]:
+    """*n* random version-4 UUID strings from a single ``os.urandom`` call."""
+    raw = os.urandom(16 * n).hex()
+    ids = []
+    for i in range(0, 32 * n, 32):
+        h = raw[i:i + 32]
+        # Version nibble 4; variant bits 10xx.
+        ids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_VARIANT[h[16]]}{h[17:20]}-{h[20:]}")
+    return ids
+
+
+_VARIANT = {c: "89ab"[int(c, 16) & 3] for c in "0123456789abcdef"}
+
+
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -25,13 +81,138 @@ class RelationGraph:
     """
     In-memory relation graph manager.
     Provides utilities to add, remove, query, and traverse relations.
+
+    Outgoing and incoming adjacency maps — keyed by minion id, and by
+    ``(minion id, relation type)`` — are maintained on every add/remove, so
+    neighbourhood queries cost O(degree) rather than O(total relations).
+
+    Edges are unique per ``(source, target, type)`` by default: adding an
+    edge that already exists returns the existing relation (see ``if_exists``
+    on :meth:`add`).
+
+    Pass a :class:`~minions.storage.RelationStorageAdapter` to persist the
+    graph: every mutation is written through to it.  By default all stored
+    relations are loaded up front; with ``lazy=True`` nothing is loaded until
+    a minion is first queried, at which point its incoming and outgoing
+    relations are fetched and cached, so large graphs never need to be fully
+    resident.  :meth:`list` and :meth:`dedupe` load the whole graph.
+
+    Relation types listed in ``acyclic_types`` (typically
+    :data:`SCHEDULING_TYPES`) may not form cycles: :meth:`add` raises
+    :class:`CycleError` instead.  A topological order of those relations is
+    maintained online (Pearce–Kelly), so an insert that already agrees with
+    the order is O(1) and any other only revisits the minions ranked between
+    its endpoints.  Precedence follows meaning: ``a blocks b`` and
+    ``b depends_on a`` both put ``a`` first.  A lazy graph loads in full the
+    first time an acyclic relation is added.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        storage: Optional[RelationStorageAdapter] = None,
+        *,
+        lazy: bool = False,
+        acyclic_types: Iterable[RelationType] = (),
+    ) -> None:
+        self._storage = storage
+        self._lazy = storage is not None and lazy
+        self._acyclic: tuple[RelationType, ...] = tuple(dict.fromkeys(acyclic_types))
+        self._reset()
+        if storage is not None and not lazy:
+            for relation in storage.list():
+                self._index(relation)
+
+    def _reset(self) -> None:
         self._relations: dict[str, Relation] = {}
+        self._out: dict[str, dict[str, Relation]] = {}
+        self._in: dict[str, dict[str, Relation]] = {}
+        self._out_by_type: dict[tuple[str, str], dict[str, Relation]] = {}
+        self._in_by_type: dict[tuple[str, str], dict[str, Relation]] = {}
+        self._edges: dict[tuple[str, str, str], dict[str, Relation]] = {}
+        self._loaded: set[str] = set()
+        self._all_loaded = not self._lazy
+        # Online topological order over ``_acyclic`` relations, built on first use.
+        self._rank: Optional[dict[str, int]] = None
+        self._rank_bounds = [0, 0]
+        # parent_of hierarchy labels, rebuilt lazily after a structural change.
+        self._labels: Optional[dict[str, tuple[int, int]]] = None
+        self._closure: dict[str, set[str]] = {}
+
+    # ── Index maintenance ─────────────────────────────────────────────────────
+
+    def _index(self, relation: Relation) -> None:
+        rid, source, target, type = relation.id, relation.source_id, relation.target_id, relation.type
+        self._relations[rid] = relation
+        self._out.setdefault(source, {})[rid] = relation
+        self._in.setdefault(target, {})[rid] = relation
+        self._out_by_type.setdefault((source, type), {})[rid] = relation
+        self._in_by_type.setdefault((target, type), {})[rid] = relation
+        self._edges.setdefault((source, target, type), {})[rid] = relation
+        if type == "parent_of":
+            self._hierarchy_changed()
+
+    def _unindex(self, relation: Relation) -> None:
+        rid = relation.id
+        del self._relations[rid]
+        _discard(self._out, relation.source_id, rid)
+        _discard(self._in, relation.target_id, rid)
+        _discard(self._out_by_type, (relation.source_id, relation.type), rid)
+        _discard(self._in_by_type, (relation.target_id, relation.type), rid)
+        _discard(self._edges, (relation.source_id, relation.target_id, relation.type), rid)
+        if relation.type == "parent_of":
+            self._hierarchy_changed()
+
+    def _hierarchy_changed(self) -> None:
+        if self._labels is not None or self._closure:
+            self._labels = None
+            self._closure = {}
+
+    # ── Lazy loading ──────────────────────────────────────────────────────────
 
-    def add(self, input: dict[str, Any]) -> Relation:
-        """Add a relation to the graph. Returns the created Relation."""
+    def _ensure(self, minion_id: str) -> None:
+        """Fetch and cache the adjacency of *minion_id* on first access."""
+        if self._all_loaded or minion_id in self._loaded:
+            return
+        self._loaded.add(minion_id)
+        for relation in self._storage.outgoing(minion_id):
+            self._cache(relation)
+        for relation in self._storage.incoming(minion_id):
+            self._cache(relation)
+
+    def _ensure_all(self) -> None:
+        if self._all_loaded:
+            return
+        for relation in self._storage.list():
+            self._cache(relation)
+        self._all_loaded = True
+
+    def _cache(self, relation: Relation) -> None:
+        if relation.id not in self._relations:
+            self._index(relation)
+
+    def clear_cache(self) -> None:
+        """
+        Drop every cached relation of a lazy graph; adjacency is fetched from
+        storage again on next access.  Does nothing for a non-lazy graph.
+        """
+        if self._lazy:
+            self._reset()
+
+    # ── Mutation ──────────────────────────────────────────────────────────────
+
+    def add(self, input: dict[str, Any], if_exists: IfExists = "return") -> Relation:
+        """
+        Add a relation to the graph. Returns the created Relation.
+
+        When an edge with the same source, target and type already exists,
+        *if_exists* decides the outcome:
+
+        - ``"return"`` (default): keep the graph unchanged and return the
+          existing relation.
+        - ``"replace"``: remove the existing edge and add the new one.
+        - ``"error"``: raise ``ValueError``.
+        - ``"allow"``: add a parallel duplicate edge.
+        """
         relation = Relation(
             id=_generate_id(),
             source_id=input.get("source_id") or input.get("sourceId", ""),
@@ -41,52 +222,372 @@ class RelationGraph:
             metadata=input.get("metadata"),
             created_by=input.get("created_by") or input.get("createdBy"),
         )
-        self._relations[relation.id] = relation
+        return self.insert(relation, if_exists)
+
+    def add_many(
+        self,
+        inputs: Iterable[dict[str, Any]],
+        if_exists: IfExists = "return",
+    ) -> list[Relation]:
+        """
+        Add many relations in one batch; see :meth:`insert_many`.
+
+        The whole batch shares one ``created_at`` timestamp, and relation ids
+        are generated together from a single block of random bytes.
+        """
+        inputs = list(inputs)
+        now = _now()
+        relations = [
+            Relation(
+                id=id,
+                source_id=input.get("source_id") or input.get("sourceId", ""),
+                target_id=input.get("target_id") or input.get("targetId", ""),
+                type=input["type"],
+                created_at=now,
+                metadata=input.get("metadata"),
+                created_by=input.get("created_by") or input.get("createdBy"),
+            )
+            for id, input in zip(_generate_ids(len(inputs)), inputs)
+        ]
+        return self.insert_many(relations, if_exists)
+
+    def insert(self, relation: Relation, if_exists: IfExists = "return") -> Relation:
+        """
+        Add an existing :class:`Relation` (keeping its id and timestamps),
+        e.g. when restoring a serialized graph.  *if_exists* behaves as in
+        :meth:`add`; a relation whose id is already present is replaced.
+        """
+        existing = self._admit(relation, if_exists)
+        if existing is not None:
+            return existing
+        if self._storage is not None:
+            self._storage.put(relation)
+        self._place(relation)
         return relation
 
+    def insert_many(
+        self,
+        relations: Iterable[Relation],
+        if_exists: IfExists = "return",
+    ) -> list[Relation]:
+        """
+        Insert many existing relations, returning what :meth:`insert` would
+        have returned for each, in order.  Relations are written to storage
+        with one ``put_many`` call.  If one is rejected (``if_exists="error"``
+        or a :class:`CycleError`), those before it stay added and the error
+        propagates.  A relation replaced by a later one in the same batch
+        (``if_exists="replace"`` or a repeated id) is not written.
+        """
+        result: list[Relation] = []
+        added: list[Relation] = []
+        admit, place = self._admit, self._place
+        try:
+            for relation in relations:
+                existing = admit(relation, if_exists)
+                if existing is not None:
+                    result.append(existing)
+                    continue
+                place(relation)
+                added.append(relation)
+                result.append(relation)
+        finally:
+            if self._storage is not None and added:
+                live = self._relations
+                self._storage.put_many([r for r in added if live.get(r.id) is r])
+        return result
+
+    def _admit(self, relation: Relation, if_exists: IfExists) -> Optional[Relation]:
+        """
+        Apply the uniqueness and acyclicity rules to a relation about to be
+        added.  Returns the existing relation when the add should be skipped.
+        """
+        self._ensure(relation.source_id)
+        if if_exists != "allow":
+            existing = self._edges.get((relation.source_id, relation.target_id, relation.type))
+            if existing:
+                if if_exists == "return":
+                    return next(iter(existing.values()))
+                if if_exists == "error":
+                    raise ValueError(
+                        f'Relation "{relation.type}" from "{relation.source_id}" '
+                        f'to "{relation.target_id}" already exists'
+                    )
+                for duplicate in list(existing.values()):
+                    self._delete(duplicate)
+
+        if relation.type in self._acyclic:
+            if relation.type in _PRECEDENCE_REVERSED:
+                self._order_before(relation.target_id, relation.source_id)
+            else:
+                self._order_before(relation.source_id, relation.target_id)
+        return None
+
+    def _place(self, relation: Relation) -> None:
+        previous = self._relations.get(relation.id)
+        if previous is not None:
+            self._unindex(previous)
+        self._index(relation)
+
+    # ── Dependency order ──────────────────────────────────────────────────────
+
+    def _order_before(self, first: str, then: str) -> None:
+        """
+        Update the online topological order for a new precedence edge
+        ``first -> then`` (Pearce–Kelly), raising :class:`CycleError`
+        without modifying the order if the edge would close a cycle.
+        """
+        if first == then:
+            raise CycleError([first, first])
+        rank = self._rank
+        if rank is None:
+            self._ensure_all()
+            rank = self._rank = {
+                node: i for i, node in enumerate(self.topological_order(self._acyclic))
+            }
+            self._rank_bounds = [0, len(rank)]
+        lo = rank.get(first)
+        hi = rank.get(then)
+        # Minions new to the order slot in at either end, where no edge can
+        # conflict with them.
+        if lo is None:
+            self._rank_bounds[0] -= 1
+            lo = rank[first] = self._rank_bounds[0]
+        if hi is None:
+            self._rank_bounds[1] += 1
+            hi = rank[then] = self._rank_bounds[1]
+        if lo < hi:
+            return
+
+        # Everything reachable from ``then`` that ranks at or below ``first``
+        # must move after it; reaching ``first`` itself means a cycle.
+        forward = {then: ""}
+        stack = [then]
+        while stack:
+            node = stack.pop()
+            for succ in self._successors(node, self._acyclic):
+                if succ == first:
+                    cycle = [first, node]
+                    while node != then:
+                        node = forward[node]
+                        cycle.append(node)
+                    cycle.reverse()
+                    raise CycleError([first, *cycle])
+                if succ not in forward and rank[succ] < lo:
+                    forward[succ] = node
+                    stack.append(succ)
+
+        backward = {first}
+        stack = [first]
+        while stack:
+            node = stack.pop()
+            for pred in self._predecessors(node, self._acyclic):
+                if pred not in backward and rank[pred] > hi:
+                    backward.add(pred)
+                    stack.append(pred)
+
+        moved = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        for node, slot in zip(moved, sorted(rank[n] for n in moved)):
+            rank[node] = slot
+
+    def _successors(self, node: str, types: Iterable[RelationType]) -> Iterator[str]:
+        """Minions that must come after *node* under the given relation types."""
+        for type in types:
+            if type in _PRECEDENCE_REVERSED:
+                bucket = self._in_by_type.get((node, type))
+                if bucket:
+                    yield from (r.source_id for r in bucket.values())
+            else:
+                bucket = self._out_by_type.get((node, type))
+                if bucket:
+                    yield from (r.target_id for r in bucket.values())
+
+    def _predecessors(self, node: str, types: Iterable[RelationType]) -> Iterator[str]:
+        """Minions that must come before *node* under the given relation types."""
+        for type in types:
+            if type in _PRECEDENCE_REVERSED:
+                bucket = self._out_by_type.get((node, type))
+                if bucket:
+                    yield from (r.target_id for r in bucket.values())
+            else:
+                bucket = self._in_by_type.get((node, type))
+                if bucket:
+                    yield from (r.source_id for r in bucket.values())
+
+    def _delete(self, relation: Relation) -> None:
+        if self._storage is not None:
+            self._storage.delete(relation.id)
+        self._unindex(relation)
+
     def remove(self, id: str) -> bool:
         """Remove a relation by ID. Returns True if removed."""
-        return self._relations.pop(id, None) is not None
+        relation = self._relations.get(id)
+        if relation is None:
+            if self._all_loaded or self._storage.get(id) is None:
+                return False
+            # Not cached, so neither endpoint has been loaded yet.
+            self._storage.delete(id)
+            return True
+        self._delete(relation)
+        return True
+
+    def remove_many(self, ids: Iterable[str]) -> int:
+        """
+        Remove relations by ID, deleting them from storage with one
+        ``delete_many`` call.  Returns the number removed.
+        """
+        doomed: list[str] = []
+        for id in dict.fromkeys(ids):
+            relation = self._relations.get(id)
+            if relation is not None:
+                self._unindex(relation)
+            elif self._all_loaded or self._storage.get(id) is None:
+                continue
+            doomed.append(id)
+        if self._storage is not None and doomed:
+            self._storage.delete_many(doomed)
+        return len(doomed)
 
     def remove_by_minion_id(self, minion_id: str) -> int:
         """Remove all relations involving a given minion. Returns count removed."""
-        to_remove = [
-            rid for rid, rel in self._relations.items()
-            if rel.source_id == minion_id or rel.target_id == minion_id
-        ]
-        for rid in to_remove:
-            del self._relations[rid]
+        self._ensure(minion_id)
+        to_remove = {
+            **self._out.get(minion_id, {}),
+            **self._in.get(minion_id, {}),
+        }
+        for relation in to_remove.values():
+            self._delete(relation)
         return len(to_remove)
 
+    def remove_by_minion_ids(self, minion_ids: Iterable[str]) -> int:
+        """
+        Remove all relations involving any of *minion_ids*, deleting them
+        from storage with one ``delete_many`` call.  Returns count removed.
+        """
+        doomed: dict[str, Relation] = {}
+        for minion_id in minion_ids:
+            self._ensure(minion_id)
+            doomed.update(self._out.get(minion_id, {}))
+            doomed.update(self._in.get(minion_id, {}))
+        for relation in doomed.values():
+            self._unindex(relation)
+        if self._storage is not None and doomed:
+            self._storage.delete_many(list(doomed))
+        return len(doomed)
+
+    def dedupe(self) -> int:
+        """
+        Collapse parallel edges so each ``(source, target, type)`` appears once,
+        keeping the earliest-added relation.  Returns the number removed.
+        """
+        self._ensure_all()
+        removed = 0
+        for bucket in [b for b in self._edges.values() if len(b) > 1]:
+            for duplicate in list(bucket.values())[1:]:
+                self._delete(duplicate)
+                removed += 1
+        return removed
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
     def get(self, id: str) -> Relation | None:
         """Get a relation by ID."""
-        return self._relations.get(id)
+        relation = self._relations.get(id)
+        if relation is None and not self._all_loaded:
+            relation = self._storage.get(id)
+        return relation
 
     def list(self) -> list[Relation]:
         """Get all relations."""
+        self._ensure_all()
         return list(self._relations.values())
 
+    def freeze(self) -> FrozenRelationGraph:
+        """
+        Return an immutable CSR snapshot of the current graph (see
+        :class:`~minions.frozen_graph.FrozenRelationGraph`) for memory-lean,
+        read-only analytics.  Later changes to this graph do not affect it.
+        """
+        from .frozen_graph import FrozenRelationGraph
+
+        self._ensure_all()
+        return FrozenRelationGraph(self._relations.values())
+
+    def has_edge(self, source_id: str, target_id: str, type: RelationType) -> bool:
+        """Check in O(1) whether a relation of *type* links source to target."""
+        self._ensure(source_id)
+        return (source_id, target_id, type) in self._edges
+
+    def get_edge(self, source_id: str, target_id: str, type: RelationType) -> Relation | None:
+        """Get the relation of *type* from source to target, if any."""
+        self._ensure(source_id)
+        bucket = self._edges.get((source_id, target_id, type))
+        return next(iter(bucket.values())) if bucket else None
+
     def get_from_source(self, source_id: str, type: Optional[RelationType] = None) -> list[Relation]:
         """Get all relations where the given minion is the source."""
-        return [
-            r for r in self._relations.values()
-            if r.source_id == source_id and (type is None or r.type == type)
-        ]
+        self._ensure(source_id)
+        if type is None:
+            return list(self._out.get(source_id, {}).values())
+        return list(self._out_by_type.get((source_id, type), {}).values())
 
     def get_to_target(self, target_id: str, type: Optional[RelationType] = None) -> list[Relation]:
         """Get all relations where the given minion is the target."""
-        return [
-            r for r in self._relations.values()
-            if r.target_id == target_id and (type is None or r.type == type)
-        ]
+        self._ensure(target_id)
+        if type is None:
+            return list(self._in.get(target_id, {}).values())
+        return list(self._in_by_type.get((target_id, type), {}).values())
+
+    def neighbors_many(
+        self,
+        ids: Iterable[str],
+        types: Optional[Iterable[RelationType]] = None,
+        direction: TraversalDirection = "out",
+    ) -> dict[str, list[str]]:
+        """
+        Answer adjacency for many minions at once: maps each id to the ids one
+        hop away along (``"out"``), against (``"in"``) or either way of
+        (``"both"``) relations of *types* (all when ``None``).
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f'Unknown traversal direction "{direction}"')
+        ids = list(dict.fromkeys(ids))
+        if not self._all_loaded:
+            for id in ids:
+                self._ensure(id)
+        type_list = None if types is None else tuple(dict.fromkeys(types))
+        result: dict[str, list[str]] = {}
+        empty: dict[str, Relation] = {}
+        if type_list is None:
+            out_get, in_get = self._out.get, self._in.get
+            for id in ids:
+                found: list[str] = []
+                if direction != "in":
+                    found.extend([r.target_id for r in out_get(id, empty).values()])
+                if direction != "out":
+                    found.extend([r.source_id for r in in_get(id, empty).values()])
+                result[id] = found
+            return result
+
+        out_get, in_get = self._out_by_type.get, self._in_by_type.get
+        for id in ids:
+            found = []
+            for type in type_list:
+                if direction != "in":
+                    found.extend([r.target_id for r in out_get((id, type), empty).values()])
+                if direction != "out":
+                    found.extend([r.source_id for r in in_get((id, type), empty).values()])
+            result[id] = found
+        return result
 
     def get_children(self, parent_id: str) -> list[str]:
         """Get children (targets of parent_of relations from this minion)."""
-        return [r.target_id for r in self.get_from_source(parent_id, "parent_of")]
+        self._ensure(parent_id)
+        return [r.target_id for r in self._out_by_type.get((parent_id, "parent_of"), {}).values()]
 
     def get_parents(self, child_id: str) -> list[str]:
         """Get parents (sources of parent_of relations to this minion)."""
-        return [r.source_id for r in self.get_to_target(child_id, "parent_of")]
+        self._ensure(child_id)
+        return [r.source_id for r in self._in_by_type.get((child_id, "parent_of"), {}).values()]
 
     def get_tree(self, root_id: str) -> list[str]:
         """
@@ -108,12 +609,346 @@ class RelationGraph:
 
         return result
 
+    def traverse(
+        self,
+        start: str,
+        types: Optional[Iterable[RelationType]] = None,
+        direction: TraversalDirection = "out",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        order: TraversalOrder = "bfs",
+    ) -> Iterator[TraversalStep]:
+        """
+        Lazily walk the graph from *start*, yielding a :class:`TraversalStep`
+        for every minion reached (the start itself is not yielded).
+
+        Only relations whose type is in *types* are followed (all types when
+        ``None``), along their direction (``"out"``), against it (``"in"``)
+        or both ways.  Each minion is yielded once, at the depth it was first
+        reached — its shortest distance in BFS order, not necessarily in DFS
+        order, though both reach the same minions within *max_depth*.  The walk stops after *max_depth* hops or *max_nodes* yielded
+        minions, and — being a generator — whenever the caller stops
+        iterating, so nothing beyond the current frontier is ever built::
+
+            for step in graph.traverse(task_id, types=["depends_on"], max_depth=3):
+                ...
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f'Unknown traversal direction "{direction}"')
+        if order not in ("bfs", "dfs"):
+            raise ValueError(f'Unknown traversal order "{order}"')
+        if (max_nodes is not None and max_nodes <= 0) or (max_depth is not None and max_depth <= 0):
+            return
+        type_set = None if types is None else tuple(dict.fromkeys(types))
+        yielded = 0
+
+        if order == "bfs":
+            visited = {start}
+            queue: deque[tuple[str, int]] = deque([(start, 0)])
+            while queue:
+                node, depth = queue.popleft()
+                if max_depth is not None and depth >= max_depth:
+                    continue
+                for relation, neighbor in self._steps(node, type_set, direction):
+                    if neighbor in visited:
+                        continue
+                    visited.add(neighbor)
+                    yield TraversalStep(neighbor, depth + 1, relation)
+                    yielded += 1
+                    if yielded == max_nodes:
+                        return
+                    queue.append((neighbor, depth + 1))
+            return
+
+        # With a depth limit, a minion first reached along a long path may
+        # later be reached along a shorter one; it is then expanded again
+        # (but not yielded again) so nothing within max_depth is missed.
+        best = {start: 0}
+        stack = [iter(self._steps(start, type_set, direction))]
+        while stack:
+            for relation, neighbor in stack[-1]:
+                depth = len(stack)
+                known = best.get(neighbor)
+                if known is not None and (max_depth is None or known <= depth):
+                    continue
+                best[neighbor] = depth
+                if known is None:
+                    yield TraversalStep(neighbor, depth, relation)
+                    yielded += 1
+                    if yielded == max_nodes:
+                        return
+                if max_depth is None or depth < max_depth:
+                    stack.append(iter(self._steps(neighbor, type_set, direction)))
+                break
+            else:
+                stack.pop()
+
+    def _steps(
+        self,
+        node: str,
+        types: Optional[tuple[RelationType, ...]],
+        direction: TraversalDirection,
+    ) -> list[tuple[Relation, str]]:
+        """Snapshot the ``(relation, neighbour)`` pairs one hop from *node*."""
+        self._ensure(node)
+        steps: list[tuple[Relation, str]] = []
+        if direction != "in":
+            buckets = [self._out.get(node)] if types is None else [
+                self._out_by_type.get((node, t)) for t in types
+            ]
+            for bucket in buckets:
+                if bucket:
+                    steps.extend((r, r.target_id) for r in bucket.values())
+        if direction != "out":
+            buckets = [self._in.get(node)] if types is None else [
+                self._in_by_type.get((node, t)) for t in types
+            ]
+            for bucket in buckets:
+                if bucket:
+                    steps.extend((r, r.source_id) for r in bucket.values())
+        return steps
+
+    def shortest_path(
+        self,
+        a: str,
+        b: str,
+        types: Optional[Iterable[RelationType]] = None,
+        max_depth: Optional[int] = None,
+        direction: TraversalDirection = "out",
+    ) -> Optional[list[str]]:
+        """
+        Return the minion ids along a shortest path from *a* to *b* (both
+        included), or ``None`` if *b* is unreachable within *max_depth* hops.
+
+        *types* and *direction* restrict which relations are followed, as in
+        :meth:`traverse`; ``direction="both"`` treats relations as undirected.
+        The search is a bidirectional BFS that always grows the smaller
+        frontier, so it touches roughly the square root of the nodes a
+        one-sided BFS would.
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f'Unknown traversal direction "{direction}"')
+        if a == b:
+            return [a]
+        if max_depth is not None and max_depth <= 0:
+            return None
+        type_set = None if types is None else tuple(dict.fromkeys(types))
+        reverse: TraversalDirection = {"out": "in", "in": "out", "both": "both"}[direction]
+
+        # Per side: parent pointers (doubling as the visited set) and frontier.
+        parents: tuple[dict[str, Optional[str]], ...] = ({a: None}, {b: None})
+        frontiers = ([a], [b])
+        directions = (direction, reverse)
+        depths = [0, 0]
+        while frontiers[0] and frontiers[1]:
+            if max_depth is not None and depths[0] + depths[1] >= max_depth:
+                return None
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, theirs = parents[side], parents[1 - side]
+            next_frontier: list[str] = []
+            for node in frontiers[side]:
+                for _, neighbor in self._steps(node, type_set, directions[side]):
+                    if neighbor in mine:
+                        continue
+                    mine[neighbor] = node
+                    if neighbor in theirs:
+                        # No path shorter than depths[0] + depths[1] + 1 exists
+                        # (it would have met earlier), so this one is shortest.
+                        return self._join_path(parents, neighbor)
+                    next_frontier.append(neighbor)
+            frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+            depths[side] += 1
+        return None
+
+    @staticmethod
+    def _join_path(parents: tuple[dict[str, Optional[str]], ...], meet: str) -> list[str]:
+        path: list[str] = []
+        node: Optional[str] = meet
+        while node is not None:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+        node = parents[1][meet]
+        while node is not None:
+            path.append(node)
+            node = parents[1][node]
+        return path
+
+    def reachable(
+        self,
+        a: str,
+        b: str,
+        types: Optional[Iterable[RelationType]] = None,
+        max_depth: Optional[int] = None,
+        direction: TraversalDirection = "out",
+    ) -> bool:
+        """
+        Check whether *b* can be reached from *a* (within *max_depth* hops).
+        Stops as soon as the two search frontiers meet; see :meth:`shortest_path`.
+        """
+        return self.shortest_path(a, b, types, max_depth, direction) is not None
+
+    def topological_order(self, types: Iterable[RelationType] = SCHEDULING_TYPES) -> list[str]:
+        """
+        Order every minion linked by relations of *types* so that each comes
+        after everything it depends on (``a blocks b`` / ``b depends_on a``
+        put ``a`` first; other types order source before target).
+
+        Runs in O(V + E) (Kahn's algorithm); ties keep relation insertion
+        order.  Raises :class:`CycleError` if the relations contain a cycle.
+        """
+        types = tuple(dict.fromkeys(types))
+        self._ensure_all()
+        indegree: dict[str, int] = {}
+        type_set = set(types)
+        for relation in self._relations.values():
+            if relation.type not in type_set:
+                continue
+            if relation.type in _PRECEDENCE_REVERSED:
+                first, then = relation.target_id, relation.source_id
+            else:
+                first, then = relation.source_id, relation.target_id
+            indegree.setdefault(first, 0)
+            indegree[then] = indegree.get(then, 0) + 1
+
+        order = [node for node, degree in indegree.items() if degree == 0]
+        for node in order:  # ``order`` doubles as the Kahn queue
+            for succ in self._successors(node, types):
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    order.append(succ)
+
+        if len(order) < len(indegree):
+            raise CycleError(self._find_cycle({n for n, d in indegree.items() if d > 0}, types))
+        return order
+
+    def _find_cycle(self, candidates: set[str], types: tuple[RelationType, ...]) -> list[str]:
+        """Walk predecessors inside *candidates* (all on or behind a cycle) until one repeats."""
+        node = next(iter(candidates))
+        seen: dict[str, int] = {}
+        path: list[str] = []
+        while node not in seen:
+            seen[node] = len(path)
+            path.append(node)
+            node = next(p for p in self._predecessors(node, types) if p in candidates)
+        cycle = path[seen[node]:] + [node]
+        cycle.reverse()
+        return cycle
+
+    def critical_path(
+        self,
+        types: Iterable[RelationType] = SCHEDULING_TYPES,
+        weight: Optional[Callable[[str], float]] = None,
+    ) -> CriticalPath:
+        """
+        Find the heaviest chain of dependencies among relations of *types*.
+
+        Each minion on the chain contributes ``weight(minion_id)`` (1 by
+        default, giving the longest chain by count), e.g. an estimated
+        duration.  Runs in O(V + E) over :meth:`topological_order`.
+        """
+        types = tuple(dict.fromkeys(types))
+        best: dict[str, float] = {}
+        via: dict[str, str] = {}
+        for node in self.topological_order(types):
+            prior = 0.0
+            chosen = None
+            for pred in self._predecessors(node, types):
+                if chosen is None or best[pred] > prior:
+                    prior, chosen = best[pred], pred
+            if chosen is not None:
+                via[node] = chosen
+            best[node] = prior + (1 if weight is None else weight(node))
+
+        if not best:
+            return CriticalPath([], 0)
+        node = max(best, key=best.__getitem__)
+        length = best[node]
+        nodes = [node]
+        while node in via:
+            node = via[node]
+            nodes.append(node)
+        nodes.reverse()
+        return CriticalPath(nodes, length)
+
+    def is_descendant(self, x: str, y: str) -> bool:
+        """
+        Check whether *x* lies strictly below *y* in the ``parent_of``
+        hierarchy (``y`` is a parent, grandparent, … of ``x``).
+
+        While the hierarchy is a forest (every minion has at most one parent)
+        each minion carries pre/post-order interval labels and the check is
+        O(1).  Labels are rebuilt in O(V + E) on the first check after a
+        ``parent_of`` relation was added or removed.  A hierarchy with
+        multiple parents (a DAG) or a cycle falls back to a transitive
+        closure that is cached per ancestor *y*.
+        """
+        if self._labels is None:
+            self._label_hierarchy()
+        if self._labels:
+            lx = self._labels.get(x)
+            ly = self._labels.get(y)
+            return lx is not None and ly is not None and ly[0] < lx[0] and lx[1] < ly[1]
+        descendants = self._closure.get(y)
+        if descendants is None:
+            descendants = self._closure[y] = set(self.get_tree(y))
+        return x in descendants
+
+    def _label_hierarchy(self) -> None:
+        """Assign pre/post-order labels to a parent_of forest, or ``{}`` if it is not one."""
+        self._ensure_all()
+        roots: list[str] = []
+        nodes = 0
+        for node, type in self._out_by_type:
+            if type == "parent_of" and (node, "parent_of") not in self._in_by_type:
+                roots.append(node)
+        for (node, type), bucket in self._in_by_type.items():
+            if type != "parent_of":
+                continue
+            nodes += 1
+            if len(bucket) > 1 and len({r.source_id for r in bucket.values()}) > 1:
+                self._labels = {}
+                return
+
+        labels: dict[str, tuple[int, int]] = {}
+        pre: dict[str, int] = {}
+        clock = 0
+        for root in roots:
+            pre[root] = clock
+            clock += 1
+            stack = [(root, iter(self.get_children(root)))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child not in pre:
+                        pre[child] = clock
+                        clock += 1
+                        stack.append((child, iter(self.get_children(child))))
+                        break
+                else:
+                    stack.pop()
+                    labels[node] = (pre[node], clock)
+                    clock += 1
+
+        # Every child has a single parent, so unlabelled children sit on a cycle.
+        self._labels = labels if len(labels) == nodes + len(roots) else {}
+
     def get_network(self, minion_id: str) -> list[str]:
         """Get all minions connected to the given minion (any direction/type)."""
+        self._ensure(minion_id)
         connected: set[str] = set()
-        for rel in self._relations.values():
-            if rel.source_id == minion_id:
-                connected.add(rel.target_id)
-            if rel.target_id == minion_id:
-                connected.add(rel.source_id)
+        for rel in self._out.get(minion_id, {}).values():
+            connected.add(rel.target_id)
+        for rel in self._in.get(minion_id, {}).values():
+            connected.add(rel.source_id)
         return list(connected)
+
+
+def _discard(index: dict[Any, dict[str, Relation]], key: Any, relation_id: str) -> None:
+    """Remove *relation_id* from an adjacency bucket, dropping the bucket when empty."""
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(relation_id, None)
+    if not bucket:
+        del index[key]
@@ -0,0 +1,494 @@
+"""
+Minions SDK — Search Index
+Inverted token index over ``searchable_text`` used by the built-in storage
+adapters for exact and typo-tolerant (fuzzy) full-text search.
+
+Exact search keeps the substring semantics of the original scan: a query
+token matches a minion when it occurs anywhere inside its searchable text.
+Because query tokens never contain whitespace, that is equivalent to the
+token occurring inside one of the minion's whitespace-separated terms, so
+the index only has to scan the (much smaller) vocabulary instead of every
+document.
+
+Fuzzy search additionally expands each query token to vocabulary terms
+within a small edit distance using a symmetric-deletion dictionary
+(SymSpell): every term is registered under all strings obtainable by
+deleting up to ``max_distance`` characters from its first ``prefix_length``
+characters.  A lookup generates the same deletions for the query token and
+only verifies the handful of terms that share one of them.
+
+The same token data backs "more like this" queries (:meth:`SearchIndex.similar`):
+minions are compared as sparse TF-IDF vectors by cosine similarity, scoring
+only candidates that share one of the source minion's rarer terms.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import sys
+from collections import Counter
+from typing import Any, Iterable, Iterator, Optional
+
+from .types import Minion
+
+try:  # Optional acceleration for similarity scoring — never required.
+    import numpy as _np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    _np = None
+
+
+# ─── Tokenisation ─────────────────────────────────────────────────────────────
+
+def tokenize(text: str) -> tuple[str, ...]:
+    """Lowercase *text* and split it into interned whitespace-separated tokens."""
+    return tuple(sys.intern(t) for t in text.lower().split())
+
+
+def _minion_tokens(minion: Minion) -> tuple[str, ...]:
+    """Return the minion's stored search tokens, tokenizing only when absent."""
+    if minion.search_tokens is not None:
+        return minion.search_tokens
+    return tokenize(minion.searchable_text or minion.title)
+
+
+# ─── JSON String Leaves ───────────────────────────────────────────────────────
+
+JSON_SEARCH_MAX_CHARS = 2000
+"""Default cap on characters a ``search_paths`` field contributes."""
+
+
+def _compile_path(path: str) -> tuple[str, ...]:
+    if path in ("", "$"):
+        return ()
+    if path.startswith("$."):
+        path = path[2:]
+    return tuple(path.split("."))
+
+
+def iter_json_strings(
+    value: Any,
+    paths: Iterable[str] = ("$",),
+    max_chars: int = JSON_SEARCH_MAX_CHARS,
+) -> Iterator[str]:
+    """
+    Yield the string leaves of a JSON-like *value* selected by *paths*.
+
+    Paths are dotted key sequences relative to *value*; ``*`` matches any
+    single key or list index and ``$`` selects *value* itself.  A path that
+    ends on a container selects every string leaf beneath it.  The walk is
+    iterative, only descends into subtrees some path can still reach, and
+    stops once *max_chars* characters have been yielded (the last string is
+    truncated to fit) — the payload is never serialized.
+    """
+    patterns = [_compile_path(p) for p in paths]
+    remaining = max_chars
+    # Stack of (node, selected, states); states are (pattern, position) pairs
+    # still being matched on the way down.
+    root_states = tuple((i, 0) for i, p in enumerate(patterns) if p)
+    stack: list[tuple[Any, bool, tuple[tuple[int, int], ...]]] = [
+        (value, any(not p for p in patterns), root_states),
+    ]
+
+    while stack and remaining > 0:
+        node, selected, states = stack.pop()
+
+        if isinstance(node, str):
+            if selected and node:
+                chunk = node[:remaining]
+                remaining -= len(chunk)
+                yield chunk
+            continue
+
+        if isinstance(node, dict):
+            children = list(node.items())
+        elif isinstance(node, (list, tuple)):
+            children = list(enumerate(node))
+        else:
+            continue
+
+        # Push in reverse so children are visited in document order.
+        for key, child in reversed(children):
+            if selected:
+                stack.append((child, True, ()))
+                continue
+            key_str = str(key)
+            next_states = tuple(
+                (i, pos + 1) for i, pos in states
+                if patterns[i][pos] == "*" or patterns[i][pos] == key_str
+            )
+            if not next_states:
+                continue
+            child_selected = any(pos == len(patterns[i]) for i, pos in next_states)
+            stack.append((
+                child,
+                child_selected,
+                () if child_selected else next_states,
+            ))
+
+
+# ─── Edit Distance ────────────────────────────────────────────────────────────
+
+def _deletes(word: str, max_distance: int) -> set[str]:
+    """Return *word* plus every string reachable by up to *max_distance* deletions."""
+    out = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier: set[str] = set()
+        for w in frontier:
+            for i in range(len(w)):
+                next_frontier.add(w[:i] + w[i + 1:])
+        out |= next_frontier
+        frontier = next_frontier
+    return out
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal-string-alignment distance between *a* and *b*.
+
+    Counts insertions, deletions, substitutions and adjacent transpositions.
+    Stops early and returns ``limit + 1`` once the distance is known to
+    exceed *limit*.
+    """
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    if abs(la - lb) > limit:
+        return limit + 1
+
+    prev2: list[int] = []
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        ca = a[i - 1]
+        cur = [i] + [0] * lb
+        row_min = i
+        for j in range(1, lb + 1):
+            cb = b[j - 1]
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+
+    return prev[lb]
+
+
+def _auto_distance(token: str) -> int:
+    """Default typo budget for a query token: longer tokens tolerate more edits."""
+    if len(token) <= 2:
+        return 0
+    if len(token) <= 5:
+        return 1
+    return 2
+
+
+# ─── Index ────────────────────────────────────────────────────────────────────
+
+class SearchIndex:
+    """
+    Incrementally maintained inverted index over minion search tokens.
+
+    Soft-deleted minions are never indexed, matching the behaviour of
+    :meth:`StorageAdapter.search`.  Results are returned in insertion order.
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7) -> None:
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._postings: dict[str, set[str]] = {}
+        self._doc_terms: dict[str, tuple[str, ...]] = {}
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        # Built lazily on the first fuzzy lookup, then maintained incrementally.
+        self._deletes_map: Optional[dict[str, set[str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, id: object) -> bool:
+        return id in self._doc_terms
+
+    @property
+    def vocabulary_size(self) -> int:
+        """Number of distinct terms currently indexed."""
+        return len(self._postings)
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+
+    def add(self, minion: Minion) -> None:
+        """Index (or re-index) a minion. Soft-deleted minions are removed instead."""
+        if minion.deleted_at:
+            self.remove(minion.id)
+            return
+
+        terms = _minion_tokens(minion)
+        old_terms = self._doc_terms.get(minion.id)
+        if old_terms is not None:
+            if old_terms == terms:
+                return
+            self._unlink(minion.id, old_terms)
+        else:
+            self._seq[minion.id] = self._next_seq
+            self._next_seq += 1
+
+        self._doc_terms[minion.id] = terms
+        for term in set(terms):
+            ids = self._postings.get(term)
+            if ids is None:
+                self._postings[term] = {minion.id}
+                self._register_term(term)
+            else:
+                ids.add(minion.id)
+
+    def remove(self, id: str) -> None:
+        """Drop a minion from the index. Does nothing if it is not indexed."""
+        terms = self._doc_terms.pop(id, None)
+        if terms is None:
+            return
+        self._seq.pop(id, None)
+        self._unlink(id, terms)
+
+    def clear(self) -> None:
+        """Remove every entry from the index."""
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._seq.clear()
+        self._deletes_map = None
+
+    def _unlink(self, id: str, terms: Iterable[str]) -> None:
+        for term in set(terms):
+            ids = self._postings.get(term)
+            if ids is None:
+                continue
+            ids.discard(id)
+            if not ids:
+                del self._postings[term]
+                self._unregister_term(term)
+
+    def _register_term(self, term: str) -> None:
+        if self._deletes_map is None:
+            return
+        for variant in _deletes(term[:self.prefix_length], self.max_distance):
+            bucket = self._deletes_map.get(variant)
+            if bucket is None:
+                self._deletes_map[variant] = {term}
+            else:
+                bucket.add(term)
+
+    def _unregister_term(self, term: str) -> None:
+        if self._deletes_map is None:
+            return
+        for variant in _deletes(term[:self.prefix_length], self.max_distance):
+            bucket = self._deletes_map.get(variant)
+            if bucket is None:
+                continue
+            bucket.discard(term)
+            if not bucket:
+                del self._deletes_map[variant]
+
+    def _ensure_deletes_map(self) -> dict[str, set[str]]:
+        if self._deletes_map is None:
+            self._deletes_map = {}
+            for term in self._postings:
+                self._register_term(term)
+        return self._deletes_map
+
+    # ── Term expansion ────────────────────────────────────────────────────────
+
+    def substring_terms(self, token: str) -> set[str]:
+        """Return every vocabulary term that contains *token*."""
+        return {term for term in self._postings if token in term}
+
+    def fuzzy_terms(self, token: str, max_distance: Optional[int] = None) -> set[str]:
+        """
+        Return every vocabulary term within *max_distance* edits of *token*.
+
+        When *max_distance* is ``None`` the budget scales with token length
+        (0 for 1–2 characters, 1 up to 5 characters, 2 beyond), capped at the
+        index's ``max_distance``.
+        """
+        d = _auto_distance(token) if max_distance is None else max_distance
+        d = min(d, self.max_distance)
+        if d <= 0:
+            return {token} if token in self._postings else set()
+
+        deletes_map = self._ensure_deletes_map()
+        candidates: set[str] = set()
+        for variant in _deletes(token[:self.prefix_length], d):
+            bucket = deletes_map.get(variant)
+            if bucket:
+                candidates |= bucket
+
+        return {
+            term for term in candidates
+            if edit_distance(token, term, d) <= d
+        }
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: str,
+        fuzzy: bool = False,
+        max_distance: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Return the ids of indexed minions matching every token in *query*.
+
+        With ``fuzzy=True`` each token also matches terms within
+        *max_distance* edits (see :meth:`fuzzy_terms`).  An empty query
+        returns every indexed id.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return sorted(self._doc_terms, key=self._seq.__getitem__)
+
+        matched: Optional[set[str]] = None
+        # Most selective tokens first so the running intersection stays small.
+        for token in sorted(set(tokens), key=len, reverse=True):
+            terms = self.substring_terms(token)
+            if fuzzy:
+                terms |= self.fuzzy_terms(token, max_distance)
+
+            ids: set[str] = set()
+            for term in terms:
+                ids |= self._postings[term]
+
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return []
+
+        return sorted(matched or (), key=self._seq.__getitem__)
+
+    # ── Similarity ────────────────────────────────────────────────────────────
+
+    def similar(
+        self,
+        id: str,
+        k: int = 10,
+        max_terms: int = 32,
+        max_candidates: int = 2048,
+        use_numpy: Optional[bool] = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Return up to *k* ``(id, score)`` pairs most similar to minion *id*.
+
+        Minions are compared by cosine similarity of their TF-IDF token
+        vectors.  Only minions sharing one of the source's rarest terms are
+        scored: terms are taken rarest first, up to *max_terms* of them, until
+        about *max_candidates* minions have been collected.  Terms that appear
+        in more than half of the index carry almost no signal and are skipped
+        when rarer ones exist.  The source minion itself is never returned.
+
+        *use_numpy* selects the vectorised scorer; by default it is used when
+        NumPy is importable and there are enough candidates to benefit.
+        """
+        terms = self._doc_terms.get(id)
+        if not terms or k <= 0:
+            return []
+
+        n_docs = len(self._doc_terms)
+        postings = self._postings
+        idf = {t: self._idf(t, n_docs) for t in set(terms)}
+
+        # Candidate pruning: rarest shared terms first, common terms only as a fallback.
+        shared = sorted((t for t in idf if len(postings[t]) > 1), key=lambda t: len(postings[t]))
+        rare = [t for t in shared if len(postings[t]) * 2 <= n_docs] or shared
+        candidates: set[str] = set()
+        for t in rare[:max_terms]:
+            if candidates and len(candidates) + len(postings[t]) > max_candidates:
+                break
+            candidates |= postings[t]
+        candidates.discard(id)
+        if not candidates:
+            return []
+
+        query = {t: tf * idf[t] for t, tf in Counter(terms).items()}
+        q_norm = math.sqrt(sum(w * w for w in query.values()))
+
+        if use_numpy is None:
+            use_numpy = _np is not None and len(candidates) >= 256
+        if use_numpy and _np is None:
+            raise RuntimeError("use_numpy=True requires NumPy to be installed")
+
+        ordered = list(candidates)
+        if use_numpy:
+            scores = self._score_numpy(ordered, query, n_docs)
+        else:
+            scores = self._score_python(ordered, query, n_docs)
+
+        top = heapq.nlargest(
+            k,
+            ((s / q_norm, cid) for cid, s in zip(ordered, scores) if s > 0),
+            key=lambda pair: (pair[0], -self._seq[pair[1]]),
+        )
+        return [(cid, score) for score, cid in top]
+
+    def _idf(self, term: str, n_docs: int) -> float:
+        return math.log((1 + n_docs) / (1 + len(self._postings[term]))) + 1
+
+    def _score_python(
+        self,
+        candidates: list[str],
+        query: dict[str, float],
+        n_docs: int,
+    ) -> list[float]:
+        """Return ``dot(q, d) / |d|`` for each candidate (pure Python)."""
+        idf_cache: dict[str, float] = {}
+        out: list[float] = []
+        for cid in candidates:
+            dot = 0.0
+            norm = 0.0
+            for t, tf in Counter(self._doc_terms[cid]).items():
+                w = idf_cache.get(t)
+                if w is None:
+                    w = idf_cache[t] = self._idf(t, n_docs)
+                w *= tf
+                norm += w * w
+                q = query.get(t)
+                if q is not None:
+                    dot += q * w
+            out.append(dot / math.sqrt(norm) if norm else 0.0)
+        return out
+
+    def _score_numpy(
+        self,
+        candidates: list[str],
+        query: dict[str, float],
+        n_docs: int,
+    ) -> list[float]:
+        """Vectorised equivalent of :meth:`_score_python`."""
+        np = _np
+        term_ids: dict[str, int] = {}
+        rows: list[int] = []
+        cols: list[int] = []
+        for r, cid in enumerate(candidates):
+            for t in self._doc_terms[cid]:
+                c = term_ids.get(t)
+                if c is None:
+                    c = term_ids[t] = len(term_ids)
+                rows.append(r)
+                cols.append(c)
+
+        terms = list(term_ids)
+        idf = np.fromiter((self._idf(t, n_docs) for t in terms), dtype=np.float64, count=len(terms))
+        q = np.fromiter((query.get(t, 0.0) for t in terms), dtype=np.float64, count=len(terms))
+
+        # Collapse repeated (row, term) pairs into term frequencies.
+        keys, tf = np.unique(
+            np.asarray(rows, dtype=np.int64) * len(terms) + np.asarray(cols, dtype=np.int64),
+            return_counts=True,
+        )
+        row_idx = keys // len(terms)
+        col_idx = keys % len(terms)
+        w = tf * idf[col_idx]
+        norm = np.sqrt(np.bincount(row_idx, weights=w * w, minlength=len(candidates)))
+        dot = np.bincount(row_idx, weights=w * q[col_idx], minlength=len(candidates))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norm > 0, dot / norm, 0.0)
+        return scores.tolist()
@@ -16,6 +16,10 @@ from .filter_utils import apply_filter
 from .memory_storage_adapter import MemoryStorageAdapter
 from .json_file_storage_adapter import JsonFileStorageAdapter
 from .with_hooks import with_hooks, StorageHooks
+from .relation_adapter import RelationStorageAdapter
+from .memory_relation_storage_adapter import MemoryRelationStorageAdapter
+from .json_file_relation_storage_adapter import JsonFileRelationStorageAdapter
+from .sqlite_relation_storage_adapter import SqliteRelationStorageAdapter
 
 __all__ = [
     "StorageAdapter",
@@ -25,4 +29,8 @@ __all__ = [
     "JsonFileStorageAdapter",
     "with_hooks",
     "StorageHooks",
+    "RelationStorageAdapter",
+    "MemoryRelationStorageAdapter",
+    "JsonFileRelationStorageAdapter",
+    "SqliteRelationStorageAdapter",
 ]
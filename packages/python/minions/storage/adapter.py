@@ -7,9 +7,10 @@ Abstract base class and filter type for Minions storage adapters.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Iterable, Optional
 from dataclasses import dataclass, field
 
+from ..autocomplete import Completion, CompletionRank
 from ..types import Minion
 
 
@@ -74,7 +75,7 @@ class StorageAdapter(ABC):
         ...
 
     @abstractmethod
-    async def search(self, query: str) -> list[Minion]:
+    async def search(self, query: str, *, fuzzy: bool = False) -> list[Minion]:
         """
         Full-text search across stored minions.
 
@@ -82,5 +83,90 @@ class StorageAdapter(ABC):
         ``searchable_text`` field (title + description + string-like fields).
         Returns minions where ``searchable_text`` contains every token in the
         query.
+
+        With ``fuzzy=True`` a token also matches words within a small edit
+        distance (1–2 depending on token length), so misspelled queries still
+        find results.  Adapters without typo tolerance may ignore the flag.
         """
         ...
+
+    async def get_many(self, ids: Iterable[str]) -> list[Minion]:
+        """
+        Retrieve several minions in one call, in the order of *ids*.
+        Unknown ids are skipped.
+
+        This default implementation awaits :meth:`get` per id; adapters
+        backed by disk or a network should override it with a batched read.
+        """
+        found: list[Minion] = []
+        for id in ids:
+            minion = await self.get(id)
+            if minion is not None:
+                found.append(minion)
+        return found
+
+    async def set_many(self, minions: Iterable[Minion]) -> None:
+        """
+        Persist several minions in one call.  This default implementation
+        awaits :meth:`set` per minion; adapters should override it to batch.
+        """
+        for minion in minions:
+            await self.set(minion)
+
+    async def delete_many(self, ids: Iterable[str]) -> None:
+        """
+        Remove several minions in one call; unknown ids are ignored.  This
+        default implementation awaits :meth:`delete` per id; adapters should
+        override it to batch.
+        """
+        for id in ids:
+            await self.delete(id)
+
+    async def similar(self, id: str, k: int = 10) -> list[Minion]:
+        """
+        Return up to *k* stored minions most similar to the minion *id*.
+
+        Similarity is the cosine of TF-IDF vectors over search tokens (see
+        :meth:`minions.search.SearchIndex.similar`).  Soft-deleted minions and
+        the source minion itself are excluded.
+
+        This default implementation builds a throwaway index from
+        :meth:`list`; adapters that maintain a search index should override it.
+        """
+        from ..search import SearchIndex
+
+        minions = await self.list()
+        index = SearchIndex()
+        by_id: dict[str, Minion] = {}
+        for m in minions:
+            index.add(m)
+            by_id[m.id] = m
+        return [by_id[mid] for mid, _ in index.similar(id, k)]
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+    ) -> list[Completion]:
+        """
+        Return up to *k* title and tag completions for *prefix*.
+
+        Ranked by recency (``updated_at``) or usage (see :meth:`record_use`
+        and :class:`minions.autocomplete.AutocompleteIndex`).
+
+        This default implementation builds a throwaway index from
+        :meth:`list`; adapters that maintain an autocomplete index should
+        override it.
+        """
+        from ..autocomplete import AutocompleteIndex
+
+        index = AutocompleteIndex()
+        index.add_many(await self.list())
+        return index.suggest(prefix, k, rank)
+
+    async def record_use(self, id: str) -> None:
+        """
+        Record that the minion *id* was picked (e.g. from autocomplete), so
+        usage-ranked completions can favour it.  The default does nothing.
+        """
@@ -0,0 +1,103 @@
+"""
+minions.storage.json_codec
+==========================
+JSON encoding for the file-backed storage adapters.
+
+``orjson`` is used when it is importable and the standard library ``json``
+module otherwise; :data:`JSON_BACKEND` names the one in use.  Both write
+the same bytes, so installing or removing ``orjson`` does not rewrite
+stored files: ``orjson`` only encodes documents it renders byte for byte
+as ``json`` does, and the compact form uses ``orjson``'s ``,``/``:``
+separators with either backend.  Everything else goes to ``json`` — non-ASCII
+text (which ``json`` writes as ``\\u`` escapes), floats written in exponent
+form, non-finite floats (which ``orjson`` would write as ``null``), integers
+wider than 64 bits, and types ``json`` rejects with ``TypeError``
+(``datetime``, ``UUID``, dataclasses, …).  Documents ``orjson`` cannot
+decode (e.g. ``NaN`` tokens written by ``json``) are decoded by ``json``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _orjson = None
+
+JSON_BACKEND = "orjson" if _orjson is not None else "json"
+
+
+_ORJSON_MAX_DEPTH = 254
+_INT_RANGE = range(-(2 ** 63), 2 ** 64)
+_KEY_TYPES = frozenset([str, int, float, bool, type(None)])
+_CONTAINERS = frozenset([dict, list, tuple])
+
+
+def _orjson_exact(obj: Any) -> bool:
+    """
+    Whether *obj* holds only values ``orjson`` encodes byte for byte as
+    ``json`` does: exact ``dict``/``list``/``tuple`` containers (no deeper
+    than ``orjson`` allows, which also bounds cycles) of exact ``bool``,
+    ``None``, 64-bit ``int``, ``float`` that ``repr`` writes without an
+    exponent and ``str`` that ``json`` writes without ``\\u`` escapes, with
+    scalar keys.
+    """
+    stack = [(obj, 0)] if type(obj) in _CONTAINERS else []
+    if not stack:
+        return _scalar_exact(obj)
+    while stack:
+        container, depth = stack.pop()
+        if depth >= _ORJSON_MAX_DEPTH:
+            return False
+        if type(container) is dict:
+            for key in container:
+                if type(key) not in _KEY_TYPES or not _scalar_exact(key):
+                    return False
+            items = container.values()
+        else:
+            items = container
+        for item in items:
+            kind = type(item)
+            if kind is str:
+                if not item.isascii() or "\x7f" in item:
+                    return False
+            elif kind in _CONTAINERS:
+                stack.append((item, depth + 1))
+            elif not _scalar_exact(item):
+                return False
+    return True
+
+
+def _scalar_exact(value: Any) -> bool:
+    kind = type(value)
+    if kind is str:
+        return value.isascii() and "\x7f" not in value
+    if kind is int:
+        return value in _INT_RANGE
+    if kind is float:
+        # ``repr`` switches to exponent form outside this range; ``orjson``
+        # formats those differently (``1e16`` for ``1e+16``).
+        return value == 0.0 or 1e-4 <= abs(value) < 1e16
+    return kind is bool or value is None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Encode *obj* on one line, or pretty-printed with two-space indents."""
+    if _orjson is not None and _orjson_exact(obj):
+        option = _orjson.OPT_NON_STR_KEYS | (_orjson.OPT_INDENT_2 if indent else 0)
+        return _orjson.dumps(obj, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document; raises ``json.JSONDecodeError`` when it is invalid."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -0,0 +1,127 @@
+"""
+minions.storage.json_file_relation_storage_adapter
+===================================================
+Append-only JSON-lines relation storage adapter.
+
+File format
+-----------
+Every mutation appends one JSON object per line::
+
+    {"op": "put", "relation": {"id": "...", "sourceId": "...", ...}}
+    {"op": "delete", "id": "..."}
+
+Opening the adapter replays the log into an in-memory index, so writes cost a
+single appended line and never rewrite earlier data.  A truncated or corrupt
+line (e.g. from a crash mid-write) is skipped.  Deletes and overwrites leave
+dead lines behind; :meth:`JsonFileRelationStorageAdapter.compact` rewrites
+the log with only the live relations, using the same write-to-tmp-then-rename
+pattern as :class:`~minions.storage.JsonFileStorageAdapter`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from ..types import Relation
+from . import json_codec
+from .memory_relation_storage_adapter import MemoryRelationStorageAdapter
+
+
+class JsonFileRelationStorageAdapter(MemoryRelationStorageAdapter):
+    """
+    Disk-backed relation adapter using an append-only JSON-lines log.
+
+    The file and its parent directory are created if missing::
+
+        relations = JsonFileRelationStorageAdapter("./data/relations.jsonl")
+
+    Pass ``fsync=True`` to flush every append to disk before returning.
+    """
+
+    def __init__(self, path: str | os.PathLike, fsync: bool = False) -> None:
+        super().__init__()
+        self._path = Path(path)
+        self._fsync = fsync
+        self._records = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._replay()
+        self._file: IO[str] = self._path.open("a", encoding="utf-8")
+
+    # ── Initialisation ────────────────────────────────────────────────────────
+
+    def _replay(self) -> None:
+        if not self._path.exists():
+            return
+        with self._path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json_codec.loads(line)
+                    if entry["op"] == "put":
+                        super().put(Relation.from_dict(entry["relation"], key_style="camel"))
+                    elif entry["op"] == "delete":
+                        super().delete(entry["id"])
+                    else:
+                        continue
+                except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+                    # Silently skip truncated / corrupt lines
+                    continue
+                self._records += 1
+
+    # ── RelationStorageAdapter implementation ─────────────────────────────────
+
+    def put(self, relation: Relation) -> None:
+        self._append({"op": "put", "relation": relation.to_dict()})
+        super().put(relation)
+
+    def delete(self, id: str) -> None:
+        if id not in self._store:
+            return
+        self._append({"op": "delete", "id": id})
+        super().delete(id)
+
+    def put_many(self, relations: Iterable[Relation]) -> None:
+        relations = list(relations)
+        self._append(*({"op": "put", "relation": r.to_dict()} for r in relations))
+        for relation in relations:
+            super().put(relation)
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        ids = [id for id in dict.fromkeys(ids) if id in self._store]
+        self._append(*({"op": "delete", "id": id} for id in ids))
+        for id in ids:
+            super().delete(id)
+
+    def close(self) -> None:
+        self._file.close()
+
+    # ── Log maintenance ───────────────────────────────────────────────────────
+
+    @property
+    def dead_records(self) -> int:
+        """Number of log lines superseded by later overwrites or deletes."""
+        return self._records - len(self._store)
+
+    def compact(self) -> None:
+        """Rewrite the log so it holds exactly one line per live relation."""
+        self._file.close()
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for relation in self._store.values():
+                f.write(json_codec.dumps({"op": "put", "relation": relation.to_dict()}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp), str(self._path))
+        self._records = len(self._store)
+        self._file = self._path.open("a", encoding="utf-8")
+
+    def _append(self, *entries: dict[str, Any]) -> None:
+        if not entries:
+            return
+        self._file.write("".join(json_codec.dumps(entry) + "\n" for entry in entries))
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._records += len(entries)
@@ -17,7 +17,9 @@ git-friendly.
 Index
 -----
 An in-memory ``dict[str, Minion]`` is populated at construction time by
-scanning the root directory.  All subsequent reads hit the index first
+scanning the root directory, together with a :class:`~minions.search.SearchIndex`
+over each minion's search tokens and an
+:class:`~minions.autocomplete.AutocompleteIndex` over titles and tags.  All subsequent reads hit the index first
 (O(1)), falling back to disk only when the entry is missing (which should
 not happen in normal usage).  Writes update both disk and the index
 atomically (from the caller's perspective).
@@ -32,9 +34,12 @@ import asyncio
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+from ..autocomplete import AutocompleteIndex, Completion, CompletionRank
+from ..search import SearchIndex
 from ..types import Minion
+from . import json_codec
 from .adapter import StorageAdapter, StorageFilter
 from .filter_utils import apply_filter
 
@@ -65,6 +70,8 @@ class JsonFileStorageAdapter(StorageAdapter):
     def __init__(self, root_dir: Path) -> None:
         self._root_dir = root_dir
         self._index: dict[str, Minion] = {}
+        self._search_index = SearchIndex()
+        self._autocomplete = AutocompleteIndex()
 
     @classmethod
     async def create(cls, root_dir: str | os.PathLike) -> "JsonFileStorageAdapter":
@@ -92,6 +99,7 @@ class JsonFileStorageAdapter(StorageAdapter):
     def _build_index_sync(self) -> None:
         if not self._root_dir.exists():
             return
+        loaded: list[Minion] = []
         for l1 in self._root_dir.iterdir():
             if not l1.is_dir():
                 continue
@@ -102,13 +110,14 @@ class JsonFileStorageAdapter(StorageAdapter):
                     if f.suffix != ".json":
                         continue
                     try:
-                        raw = f.read_text(encoding="utf-8")
-                        data = json.loads(raw)
-                        minion = Minion.from_dict(data)
+                        minion = Minion.from_dict(json_codec.loads(f.read_bytes()))
                         self._index[minion.id] = minion
+                        self._search_index.add(minion)
+                        loaded.append(minion)
                     except (json.JSONDecodeError, IOError, ValueError, KeyError):
                         # Silently skip unreadable / corrupt files
                         pass
+        self._autocomplete.add_many(loaded)
 
     # ── StorageAdapter implementation ─────────────────────────────────────────
 
@@ -119,17 +128,21 @@ class JsonFileStorageAdapter(StorageAdapter):
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._write_sync, minion)
         self._index[minion.id] = minion
+        self._search_index.add(minion)
+        self._autocomplete.add(minion)
 
     def _write_sync(self, minion: Minion) -> None:
         directory = _shard_dir(self._root_dir, minion.id)
         directory.mkdir(parents=True, exist_ok=True)
         target = _file_path(self._root_dir, minion.id)
         tmp = target.with_suffix(".json.tmp")
-        tmp.write_text(json.dumps(minion.to_dict(), indent=2), encoding="utf-8")
+        tmp.write_text(json_codec.dumps(minion.to_dict(), indent=True), encoding="utf-8")
         os.replace(str(tmp), str(target))
 
     async def delete(self, id: str) -> None:
         self._index.pop(id, None)
+        self._search_index.remove(id)
+        self._autocomplete.remove(id)
         path = _file_path(self._root_dir, id)
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._unlink_sync, path)
@@ -141,20 +154,60 @@ class JsonFileStorageAdapter(StorageAdapter):
         except FileNotFoundError:
             pass
 
+    async def get_many(self, ids: Iterable[str]) -> list[Minion]:
+        index = self._index
+        return [index[id] for id in ids if id in index]
+
+    async def set_many(self, minions: Iterable[Minion]) -> None:
+        minions = list(minions)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_many_sync, minions)
+        for minion in minions:
+            self._index[minion.id] = minion
+            self._search_index.add(minion)
+            self._autocomplete.add(minion)
+
+    def _write_many_sync(self, minions: list[Minion]) -> None:
+        for minion in minions:
+            self._write_sync(minion)
+
+    async def delete_many(self, ids: Iterable[str]) -> None:
+        paths = []
+        for id in dict.fromkeys(ids):
+            self._index.pop(id, None)
+            self._search_index.remove(id)
+            self._autocomplete.remove(id)
+            paths.append(_file_path(self._root_dir, id))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._unlink_many_sync, paths)
+
+    @classmethod
+    def _unlink_many_sync(cls, paths: list[Path]) -> None:
+        for path in paths:
+            cls._unlink_sync(path)
+
     async def list(self, filter: Optional[StorageFilter] = None) -> list[Minion]:
         all_minions = list(self._index.values())
         if filter is None:
             return [m for m in all_minions if not m.deleted_at]
         return apply_filter(all_minions, filter)
 
-    async def search(self, query: str) -> list[Minion]:
+    async def search(self, query: str, *, fuzzy: bool = False) -> list[Minion]:
         if not query.strip():
             return await self.list()
 
-        tokens = query.lower().split()
-        all_minions = [m for m in self._index.values() if not m.deleted_at]
+        return [self._index[id] for id in self._search_index.search(query, fuzzy=fuzzy)]
+
+    async def similar(self, id: str, k: int = 10) -> list[Minion]:
+        return [self._index[mid] for mid, _ in self._search_index.similar(id, k)]
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+    ) -> list[Completion]:
+        return self._autocomplete.suggest(prefix, k, rank)
 
-        return [
-            m for m in all_minions
-            if all(token in (m.searchable_text or m.title).lower() for token in tokens)
-        ]
+    async def record_use(self, id: str) -> None:
+        self._autocomplete.record_use(id)
@@ -0,0 +1,63 @@
+"""
+minions.storage.memory_relation_storage_adapter
+================================================
+In-memory relation storage adapter — useful for testing and ephemeral graphs.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from ..types import Relation
+from .relation_adapter import RelationStorageAdapter
+
+
+class MemoryRelationStorageAdapter(RelationStorageAdapter):
+    """
+    Simple in-memory relation storage adapter.
+
+    Relations are kept in a ``dict`` with per-minion adjacency sets and are
+    lost when the process exits.
+    """
+
+    def __init__(self) -> None:
+        self._store: dict[str, Relation] = {}
+        self._out: dict[str, dict[str, None]] = {}
+        self._in: dict[str, dict[str, None]] = {}
+
+    def get(self, id: str) -> Optional[Relation]:
+        return self._store.get(id)
+
+    def put(self, relation: Relation) -> None:
+        self._forget(relation.id)
+        self._store[relation.id] = relation
+        self._out.setdefault(relation.source_id, {})[relation.id] = None
+        self._in.setdefault(relation.target_id, {})[relation.id] = None
+
+    def delete(self, id: str) -> None:
+        self._forget(id)
+
+    def outgoing(self, minion_id: str) -> list[Relation]:
+        return [self._store[rid] for rid in self._out.get(minion_id, ())]
+
+    def incoming(self, minion_id: str) -> list[Relation]:
+        return [self._store[rid] for rid in self._in.get(minion_id, ())]
+
+    def list(self) -> list[Relation]:
+        return list(self._store.values())
+
+    def _forget(self, id: str) -> None:
+        relation = self._store.pop(id, None)
+        if relation is None:
+            return
+        _discard(self._out, relation.source_id, id)
+        _discard(self._in, relation.target_id, id)
+
+
+def _discard(index: dict[str, dict[str, None]], key: str, relation_id: str) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        return
+    bucket.pop(relation_id, None)
+    if not bucket:
+        del index[key]
@@ -6,8 +6,10 @@ In-memory storage adapter — useful for testing and ephemeral workloads.
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Iterable, Optional
 
+from ..autocomplete import AutocompleteIndex, Completion, CompletionRank
+from ..search import SearchIndex
 from ..types import Minion
 from .adapter import StorageAdapter, StorageFilter
 from .filter_utils import apply_filter
@@ -24,15 +26,37 @@ class MemoryStorageAdapter(StorageAdapter):
 
     def __init__(self) -> None:
         self._store: dict[str, Minion] = {}
+        self._search_index = SearchIndex()
+        self._autocomplete = AutocompleteIndex()
 
     async def get(self, id: str) -> Optional[Minion]:
         return self._store.get(id)
 
     async def set(self, minion: Minion) -> None:
         self._store[minion.id] = minion
+        self._search_index.add(minion)
+        self._autocomplete.add(minion)
 
     async def delete(self, id: str) -> None:
         self._store.pop(id, None)
+        self._search_index.remove(id)
+        self._autocomplete.remove(id)
+
+    async def get_many(self, ids: Iterable[str]) -> list[Minion]:
+        store = self._store
+        return [store[id] for id in ids if id in store]
+
+    async def set_many(self, minions: Iterable[Minion]) -> None:
+        for minion in minions:
+            self._store[minion.id] = minion
+            self._search_index.add(minion)
+            self._autocomplete.add(minion)
+
+    async def delete_many(self, ids: Iterable[str]) -> None:
+        for id in ids:
+            self._store.pop(id, None)
+            self._search_index.remove(id)
+            self._autocomplete.remove(id)
 
     async def list(self, filter: Optional[StorageFilter] = None) -> list[Minion]:
         all_minions = list(self._store.values())
@@ -40,14 +64,22 @@ class MemoryStorageAdapter(StorageAdapter):
             return [m for m in all_minions if not m.deleted_at]
         return apply_filter(all_minions, filter)
 
-    async def search(self, query: str) -> list[Minion]:
+    async def search(self, query: str, *, fuzzy: bool = False) -> list[Minion]:
         if not query.strip():
             return await self.list()
 
-        tokens = query.lower().split()
-        all_minions = [m for m in self._store.values() if not m.deleted_at]
+        return [self._store[id] for id in self._search_index.search(query, fuzzy=fuzzy)]
+
+    async def similar(self, id: str, k: int = 10) -> list[Minion]:
+        return [self._store[mid] for mid, _ in self._search_index.similar(id, k)]
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+    ) -> list[Completion]:
+        return self._autocomplete.suggest(prefix, k, rank)
 
-        return [
-            m for m in all_minions
-            if all(token in (m.searchable_text or m.title).lower() for token in tokens)
-        ]
+    async def record_use(self, id: str) -> None:
+        self._autocomplete.record_use(id)
@@ -0,0 +1,85 @@
+"""
+minions.storage.relation_adapter
+================================
+Abstract base class for relation storage adapters.
+
+Unlike :class:`~minions.storage.adapter.StorageAdapter`, relation adapters
+are *synchronous*: :class:`~minions.relations.RelationGraph` queries are
+synchronous and, in lazy mode, fetch a minion's adjacency from the adapter
+the first time it is touched.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from ..types import Relation
+
+
+class RelationStorageAdapter(ABC):
+    """
+    Relation storage adapter abstract base class.
+
+    Adapters persist :class:`~minions.types.Relation` records by ``id`` and
+    must answer adjacency lookups (relations leaving or entering a minion)
+    without scanning every stored relation.
+    """
+
+    @abstractmethod
+    def get(self, id: str) -> Optional[Relation]:
+        """
+        Retrieve a single relation by its ID.
+        Returns ``None`` when no matching relation exists.
+        """
+        ...
+
+    @abstractmethod
+    def put(self, relation: Relation) -> None:
+        """
+        Persist a relation.
+        If a relation with the same ``id`` already exists it is overwritten.
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, id: str) -> None:
+        """
+        Remove a relation by its ID.
+        Returns silently even if no matching relation exists.
+        """
+        ...
+
+    @abstractmethod
+    def outgoing(self, minion_id: str) -> list[Relation]:
+        """Return all relations whose source is *minion_id*."""
+        ...
+
+    @abstractmethod
+    def incoming(self, minion_id: str) -> list[Relation]:
+        """Return all relations whose target is *minion_id*."""
+        ...
+
+    @abstractmethod
+    def list(self) -> list[Relation]:
+        """Return every stored relation."""
+        ...
+
+    def put_many(self, relations: Iterable[Relation]) -> None:
+        """
+        Persist many relations.  The default calls :meth:`put` per relation;
+        adapters should override it to batch the write.
+        """
+        for relation in relations:
+            self.put(relation)
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        """
+        Remove many relations by ID.  The default calls :meth:`delete` per id;
+        adapters should override it to batch the write.
+        """
+        for id in ids:
+            self.delete(id)
+
+    def close(self) -> None:
+        """Release any file handles or connections. The default does nothing."""
@@ -0,0 +1,138 @@
+"""
+minions.storage.sqlite_relation_storage_adapter
+================================================
+SQLite relation storage adapter built on the standard-library ``sqlite3``.
+
+Relations live in a single ``relations`` table indexed by source and target,
+so adjacency lookups read only the rows they need and the graph never has
+to be resident in memory.  This is the adapter to pair with a lazy
+:class:`~minions.relations.RelationGraph` for large graphs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+from ..types import Relation
+from .relation_adapter import RelationStorageAdapter
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS relations (
+    id TEXT PRIMARY KEY,
+    source_id TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    metadata TEXT,
+    created_by TEXT
+);
+CREATE INDEX IF NOT EXISTS relations_source ON relations (source_id, type);
+CREATE INDEX IF NOT EXISTS relations_target ON relations (target_id, type);
+"""
+
+_COLUMNS = "id, source_id, target_id, type, created_at, metadata, created_by"
+
+
+class SqliteRelationStorageAdapter(RelationStorageAdapter):
+    """
+    SQLite-backed relation storage adapter.
+
+    Pass a database file path, or ``":memory:"`` for a throwaway database::
+
+        relations = SqliteRelationStorageAdapter("./data/relations.db")
+
+    Every write commits immediately.  File databases use write-ahead logging.
+    """
+
+    def __init__(self, path: str | os.PathLike = ":memory:") -> None:
+        self._conn = sqlite3.connect(str(path), isolation_level=None)
+        if str(path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, id: str) -> Optional[Relation]:
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM relations WHERE id = ?", (id,)
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def put(self, relation: Relation) -> None:
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO relations ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _to_row(relation),
+        )
+
+    def delete(self, id: str) -> None:
+        self._conn.execute("DELETE FROM relations WHERE id = ?", (id,))
+
+    def put_many(self, relations: Iterable[Relation]) -> None:
+        with self._transaction():
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO relations ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                map(_to_row, relations),
+            )
+
+    def delete_many(self, ids: Iterable[str]) -> None:
+        with self._transaction():
+            self._conn.executemany("DELETE FROM relations WHERE id = ?", ((id,) for id in ids))
+
+    def outgoing(self, minion_id: str) -> list[Relation]:
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM relations WHERE source_id = ? ORDER BY rowid", (minion_id,)
+        )
+        return [_from_row(row) for row in rows]
+
+    def incoming(self, minion_id: str) -> list[Relation]:
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM relations WHERE target_id = ? ORDER BY rowid", (minion_id,)
+        )
+        return [_from_row(row) for row in rows]
+
+    def list(self) -> list[Relation]:
+        rows = self._conn.execute(f"SELECT {_COLUMNS} FROM relations ORDER BY rowid")
+        return [_from_row(row) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Group statements into one commit (the connection otherwise autocommits)."""
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+def _to_row(relation: Relation) -> tuple:
+    metadata = None if relation.metadata is None else json.dumps(relation.metadata)
+    return (
+        relation.id,
+        relation.source_id,
+        relation.target_id,
+        relation.type,
+        relation.created_at,
+        metadata,
+        relation.created_by,
+    )
+
+
+def _from_row(row: tuple) -> Relation:
+    id, source_id, target_id, type, created_at, metadata, created_by = row
+    return Relation(
+        id=id,
+        source_id=source_id,
+        target_id=target_id,
+        type=type,
+        created_at=created_at,
+        metadata=None if metadata is None else json.loads(metadata),
+        created_by=created_by,
+    )
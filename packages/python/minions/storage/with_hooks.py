@@ -20,8 +20,9 @@ Example::
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Iterable, Optional
 
+from ..autocomplete import Completion, CompletionRank
 from ..types import Minion
 from .adapter import StorageAdapter, StorageFilter
 
@@ -88,6 +89,42 @@ class _HookedStorageAdapter(StorageAdapter):
         if self._hooks.after_delete:
             await self._hooks.after_delete(id)
 
+    # Batch operations fire the per-item hooks around a single inner call.
+
+    async def get_many(self, ids: Iterable[str]) -> list[Minion]:
+        ids = list(ids)
+        if self._hooks.before_get:
+            for id in ids:
+                await self._hooks.before_get(id)
+        results = await self._inner.get_many(ids)
+        if self._hooks.after_get:
+            found = {m.id: m for m in results}
+            for id in ids:
+                await self._hooks.after_get(id, found.get(id))
+        return results
+
+    async def set_many(self, minions: Iterable[Minion]) -> None:
+        to_store = list(minions)
+        if self._hooks.before_set:
+            for i, minion in enumerate(to_store):
+                transformed = await self._hooks.before_set(minion)
+                if transformed is not None:
+                    to_store[i] = transformed
+        await self._inner.set_many(to_store)
+        if self._hooks.after_set:
+            for minion in to_store:
+                await self._hooks.after_set(minion)
+
+    async def delete_many(self, ids: Iterable[str]) -> None:
+        ids = list(ids)
+        if self._hooks.before_delete:
+            for id in ids:
+                await self._hooks.before_delete(id)
+        await self._inner.delete_many(ids)
+        if self._hooks.after_delete:
+            for id in ids:
+                await self._hooks.after_delete(id)
+
     async def list(self, filter: Optional[StorageFilter] = None) -> list[Minion]:
         if self._hooks.before_list:
             await self._hooks.before_list(filter)
@@ -96,14 +133,31 @@ class _HookedStorageAdapter(StorageAdapter):
             await self._hooks.after_list(results, filter)
         return results
 
-    async def search(self, query: str) -> list[Minion]:
+    async def search(self, query: str, *, fuzzy: bool = False) -> list[Minion]:
         if self._hooks.before_search:
             await self._hooks.before_search(query)
-        results = await self._inner.search(query)
+        if fuzzy:
+            results = await self._inner.search(query, fuzzy=True)
+        else:
+            results = await self._inner.search(query)
         if self._hooks.after_search:
             await self._hooks.after_search(results, query)
         return results
 
+    async def similar(self, id: str, k: int = 10) -> list[Minion]:
+        return await self._inner.similar(id, k)
+
+    async def autocomplete(
+        self,
+        prefix: str,
+        k: int = 10,
+        rank: CompletionRank = "recency",
+    ) -> list[Completion]:
+        return await self._inner.autocomplete(prefix, k, rank)
+
+    async def record_use(self, id: str) -> None:
+        await self._inner.record_use(id)
+
 
 def with_hooks(adapter: StorageAdapter, hooks: StorageHooks) -> StorageAdapter:
     """Wrap a :class:`StorageAdapter` with before/after hooks.
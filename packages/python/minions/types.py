@@ -6,8 +6,14 @@ Mirrors: packages/core/src/types/index.ts
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Literal, Optional, Protocol, runtime_checkable
+import hashlib
+import json
+import re
+import sys
+from dataclasses import MISSING, dataclass, field
+from dataclasses import fields as dataclass_fields
+from functools import lru_cache
+from typing import Any, Callable, Literal, Optional, Protocol, TypeVar, runtime_checkable
 
 # ─── Literal Types ────────────────────────────────────────────────────────────
 
@@ -25,19 +31,39 @@ RelationType = Literal[
 MinionStatus = Literal["active", "todo", "in_progress", "completed", "cancelled"]
 MinionPriority = Literal["low", "medium", "high", "urgent"]
 
+_T = TypeVar("_T")
+
+
+def _interned(value: Any) -> Any:
+    """
+    Return the canonical copy of a low-cardinality string.
+
+    Type ids, statuses, priorities, tags and relation types repeat across
+    every minion; interning them at construction lets a million resident
+    minions share a handful of string objects instead of holding their own
+    copies (JSON decoding produces a fresh string per document).
+    """
+    return sys.intern(value) if type(value) is str else value
+
 
 # ─── Serialisation Helpers ────────────────────────────────────────────────────
 
+KeyStyle = Literal["camel", "snake"]
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])([A-Z])")
+
+
+@lru_cache(maxsize=4096)
 def _to_camel(name: str) -> str:
     """Convert snake_case to camelCase."""
     parts = name.split("_")
     return parts[0] + "".join(p.capitalize() for p in parts[1:])
 
 
+@lru_cache(maxsize=4096)
 def _to_snake(name: str) -> str:
     """Convert camelCase to snake_case."""
-    import re
-    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+    return _CAMEL_BOUNDARY.sub(r"_\1", name).lower()
 
 
 def _dict_to_camel(d: dict[str, Any]) -> dict[str, Any]:
@@ -68,6 +94,84 @@ def _dict_to_snake(d: dict[str, Any]) -> dict[str, Any]:
     return out
 
 
+class _Codec:
+    """
+    ``to_dict``/``from_dict`` generated once from a dataclass's fields.
+
+    Keys are camelCase (or a field's ``alias`` metadata).  ``to_dict`` always
+    emits the fields without a default and the others only when not None.
+    ``from_dict`` reads the fields named in *required* with ``d[key]`` and
+    the rest with ``get``, falling back to the source expression in
+    *defaults* (``None`` otherwise).  Without a ``key_style`` each key is
+    looked up as camelCase, then snake_case; with one, only that spelling
+    is read.  Instances of the class itself are built by filling its slots
+    and calling ``__post_init__``, skipping the keyword-argument
+    ``__init__``; subclasses go through their constructor.
+    """
+
+    __slots__ = ("to_dict", "from_dict", "source")
+
+    def __init__(self, cls: type, required: tuple[str, ...] = (), defaults: Optional[dict[str, str]] = None) -> None:
+        defaults = defaults or {}
+        fields = dataclass_fields(cls)
+        specs = [
+            (f.name, f.metadata.get("alias") or _to_camel(f.name), f.default is MISSING and f.default_factory is MISSING)
+            for f in fields if f.init
+        ]
+        namespace: dict[str, Any] = {"_cls": cls, "_new": object.__new__}
+
+        lines = ["def to_dict(self):", "    d = {"]
+        lines += [f"        {key!r}: self.{name}," for name, key, always in specs if always]
+        lines.append("    }")
+        for name, key, always in specs:
+            if not always:
+                lines += [f"    v = self.{name}", "    if v is not None:", f"        d[{key!r}] = v"]
+        lines += ["    return d", ""]
+
+        def read(name: str, key: str, style: Optional[str]) -> str:
+            default = defaults.get(name)
+            if name in required:
+                if key == name or style == "camel":
+                    return f"d[{key!r}]"
+                return f"d[{name!r}]" if style == "snake" else f"(d[{key!r}] if {key!r} in d else d[{name!r}])"
+            if key == name or style == "snake":
+                return f"get({name!r}, {default})" if default else f"get({name!r})"
+            # A falsy camelCase value falls through to the snake_case key and
+            # then the default, as the hand-written ``d.get(camel) or
+            # d.get(snake, default)`` lookups did.
+            if style == "camel":
+                return f"get({key!r}) or {default or 'None'}"
+            fallback = f"get({name!r}, {default})" if default else f"get({name!r})"
+            return f"get({key!r}) or {fallback}"
+
+        lines += ["def from_dict(cls, d, key_style=None):", "    get = d.get"]
+        for branch, style in (("if key_style is None", None), ("elif key_style == 'camel'", "camel"),
+                              ("elif key_style == 'snake'", "snake")):
+            lines.append(f"    {branch}:")
+            lines += [f"        v_{name} = {read(name, key, style)}" for name, key, _ in specs]
+        lines += [
+            "    else:",
+            "        raise ValueError(f'Unknown key style: {key_style!r}')",
+            "    if cls is not _cls:",
+            f"        return cls({', '.join(f'v_{name}' for name, _, _ in specs)})",
+            "    o = _new(cls)",
+        ]
+        lines += [f"    o.{name} = v_{name}" for name, _, _ in specs]
+        for f in fields:
+            if not f.init:
+                namespace[f"_default_{f.name}"] = f.default if f.default is not MISSING else f.default_factory
+                call = "" if f.default is not MISSING else "()"
+                lines.append(f"    o.{f.name} = _default_{f.name}{call}")
+        if hasattr(cls, "__post_init__"):
+            lines.append("    o.__post_init__()")
+        lines.append("    return o")
+
+        self.source = "\n".join(lines) + "\n"
+        exec(compile(self.source, f"<{cls.__name__} codec>", "exec"), namespace)
+        self.to_dict: Callable[[Any], dict[str, Any]] = namespace["to_dict"]
+        self.from_dict: Callable[..., Any] = namespace["from_dict"]
+
+
 # ─── Field Definitions ───────────────────────────────────────────────────────
 
 @dataclass
@@ -78,6 +182,10 @@ class FieldValidation:
     min: Optional[float] = None
     max: Optional[float] = None
     pattern: Optional[str] = None
+    #: ``json`` fields: deepest allowed container nesting (default 1000).
+    max_depth: Optional[int] = None
+    #: ``json`` fields: most values (containers and scalars) allowed in total.
+    max_nodes: Optional[int] = None
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {}
@@ -91,6 +199,10 @@ class FieldValidation:
             d["max"] = self.max
         if self.pattern is not None:
             d["pattern"] = self.pattern
+        if self.max_depth is not None:
+            d["maxDepth"] = self.max_depth
+        if self.max_nodes is not None:
+            d["maxNodes"] = self.max_nodes
         return d
 
     @classmethod
@@ -101,6 +213,8 @@ class FieldValidation:
             min=d.get("min"),
             max=d.get("max"),
             pattern=d.get("pattern"),
+            max_depth=d.get("maxDepth") or d.get("max_depth"),
+            max_nodes=d.get("maxNodes") or d.get("max_nodes"),
         )
 
 
@@ -115,6 +229,12 @@ class FieldDefinition:
     default_value: Any = None
     options: Optional[list[str]] = None
     validation: Optional[FieldValidation] = None
+    #: Opt-in full-text indexing for ``json`` / ``array`` fields: dotted paths
+    #: (``*`` matches any key or index, ``$`` the whole value) whose string
+    #: leaves are added to ``searchable_text``.
+    search_paths: Optional[list[str]] = None
+    #: Cap on characters contributed by ``search_paths`` (default 2000).
+    search_max_chars: Optional[int] = None
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {"name": self.name, "type": self.type}
@@ -130,6 +250,10 @@ class FieldDefinition:
             d["options"] = self.options
         if self.validation is not None:
             d["validation"] = self.validation.to_dict()
+        if self.search_paths is not None:
+            d["searchPaths"] = self.search_paths
+        if self.search_max_chars is not None:
+            d["searchMaxChars"] = self.search_max_chars
         return d
 
     @classmethod
@@ -144,14 +268,22 @@ class FieldDefinition:
             default_value=d.get("defaultValue") or d.get("default_value"),
             options=d.get("options"),
             validation=FieldValidation.from_dict(v) if v else None,
+            search_paths=d.get("searchPaths") or d.get("search_paths"),
+            search_max_chars=d.get("searchMaxChars") or d.get("search_max_chars"),
         )
 
 
 # ─── Core Primitives ─────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Minion:
-    """A structured object instance — the fundamental unit of the system."""
+    """
+    A structured object instance — the fundamental unit of the system.
+
+    Slotted, with its low-cardinality strings interned (see ``_interned``):
+    instances carry no ``__dict__`` and accept no attributes beyond the
+    declared ones.
+    """
     id: str
     title: str
     minion_type_id: str
@@ -171,69 +303,52 @@ class Minion:
     deleted_by: Optional[str] = None
     searchable_text: Optional[str] = None
     _legacy: Optional[dict[str, Any]] = field(default=None, metadata={"alias": "_legacy"})
+    #: Interned, lowercased tokens of ``searchable_text``. Derived data: never
+    #: serialized, and dropped by ``dataclasses.replace`` so it cannot go stale.
+    search_tokens: Optional[tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.minion_type_id = _interned(self.minion_type_id)
+        self.status = _interned(self.status)
+        self.priority = _interned(self.priority)
+        if self.tags:
+            self.tags = [_interned(t) for t in self.tags]
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A stable hash of the minion's content, computed on each access.
+
+        Two minions with the same ``to_dict()`` (ignoring the derived
+        ``searchableText``) have the same fingerprint, across processes and
+        key orders.  It is not cached, so in-place changes to attributes,
+        ``fields`` or ``tags`` are always reflected.
+        """
+        d = self.to_dict()
+        d.pop("searchableText", None)
+        canonical = json.dumps(d, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=repr)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a camelCase dict compatible with the TS SDK."""
-        d: dict[str, Any] = {
-            "id": self.id,
-            "title": self.title,
-            "minionTypeId": self.minion_type_id,
-            "fields": self.fields,
-            "createdAt": self.created_at,
-            "updatedAt": self.updated_at,
-        }
-        if self.tags is not None:
-            d["tags"] = self.tags
-        if self.status is not None:
-            d["status"] = self.status
-        if self.priority is not None:
-            d["priority"] = self.priority
-        if self.description is not None:
-            d["description"] = self.description
-        if self.due_date is not None:
-            d["dueDate"] = self.due_date
-        if self.category_id is not None:
-            d["categoryId"] = self.category_id
-        if self.folder_id is not None:
-            d["folderId"] = self.folder_id
-        if self.created_by is not None:
-            d["createdBy"] = self.created_by
-        if self.updated_by is not None:
-            d["updatedBy"] = self.updated_by
-        if self.deleted_at is not None:
-            d["deletedAt"] = self.deleted_at
-        if self.deleted_by is not None:
-            d["deletedBy"] = self.deleted_by
-        if self.searchable_text is not None:
-            d["searchableText"] = self.searchable_text
-        if self._legacy is not None:
-            d["_legacy"] = self._legacy
-        return d
+        return _MINION_CODEC.to_dict(self)
 
     @classmethod
-    def from_dict(cls, d: dict[str, Any]) -> Minion:
-        """Deserialize from a camelCase dict (e.g. JSON from the TS SDK)."""
-        return cls(
-            id=d["id"],
-            title=d["title"],
-            minion_type_id=d.get("minionTypeId") or d.get("minion_type_id", ""),
-            fields=d.get("fields", {}),
-            created_at=d.get("createdAt") or d.get("created_at", ""),
-            updated_at=d.get("updatedAt") or d.get("updated_at", ""),
-            tags=d.get("tags"),
-            status=d.get("status"),
-            priority=d.get("priority"),
-            description=d.get("description"),
-            due_date=d.get("dueDate") or d.get("due_date"),
-            category_id=d.get("categoryId") or d.get("category_id"),
-            folder_id=d.get("folderId") or d.get("folder_id"),
-            created_by=d.get("createdBy") or d.get("created_by"),
-            updated_by=d.get("updatedBy") or d.get("updated_by"),
-            deleted_at=d.get("deletedAt") or d.get("deleted_at"),
-            deleted_by=d.get("deletedBy") or d.get("deleted_by"),
-            searchable_text=d.get("searchableText") or d.get("searchable_text"),
-            _legacy=d.get("_legacy"),
-        )
+    def from_dict(cls, d: dict[str, Any], key_style: Optional[KeyStyle] = None) -> Minion:
+        """
+        Deserialize from a camelCase dict (e.g. JSON from the TS SDK).
+
+        snake_case keys are accepted too.  Pass ``key_style`` when the style
+        is known to read only that spelling of each key.
+        """
+        return _MINION_CODEC.from_dict(cls, d, key_style)
+
+
+_MINION_CODEC = _Codec(
+    Minion,
+    required=("id", "title"),
+    defaults={"minion_type_id": '""', "fields": "{}", "created_at": '""', "updated_at": '""'},
+)
 
 
 @dataclass
@@ -254,6 +369,25 @@ class MinionType:
     available_views: Optional[list[str]] = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    _compiled: dict[str, tuple[tuple[FieldDefinition, ...], Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+
+    def _compiled_for(self, key: str, build: Callable[[list[FieldDefinition]], _T]) -> _T:
+        """
+        Return a schema-specialised helper, building it on first use.
+
+        Helpers are cached per *key* and rebuilt whenever ``schema`` is
+        reassigned or its field definitions are replaced.  Mutating a
+        FieldDefinition in place is not detected.
+        """
+        schema_key = tuple(self.schema)
+        cached = self._compiled.get(key)
+        if cached is not None and cached[0] == schema_key:
+            return cached[1]
+        value = build(self.schema)
+        self._compiled[key] = (schema_key, value)
+        return value
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
@@ -312,9 +446,9 @@ class MinionType:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Relation:
-    """A typed, directional link between two minions."""
+    """A typed, directional link between two minions (slotted, like Minion)."""
     id: str
     source_id: str
     target_id: str
@@ -323,31 +457,22 @@ class Relation:
     metadata: Any = None
     created_by: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.type = _interned(self.type)
+
     def to_dict(self) -> dict[str, Any]:
-        d: dict[str, Any] = {
-            "id": self.id,
-            "sourceId": self.source_id,
-            "targetId": self.target_id,
-            "type": self.type,
-            "createdAt": self.created_at,
-        }
-        if self.metadata is not None:
-            d["metadata"] = self.metadata
-        if self.created_by is not None:
-            d["createdBy"] = self.created_by
-        return d
+        return _RELATION_CODEC.to_dict(self)
 
     @classmethod
-    def from_dict(cls, d: dict[str, Any]) -> Relation:
-        return cls(
-            id=d["id"],
-            source_id=d.get("sourceId") or d.get("source_id", ""),
-            target_id=d.get("targetId") or d.get("target_id", ""),
-            type=d["type"],
-            created_at=d.get("createdAt") or d.get("created_at", ""),
-            metadata=d.get("metadata"),
-            created_by=d.get("createdBy") or d.get("created_by"),
-        )
+    def from_dict(cls, d: dict[str, Any], key_style: Optional[KeyStyle] = None) -> Relation:
+        return _RELATION_CODEC.from_dict(cls, d, key_style)
+
+
+_RELATION_CODEC = _Codec(
+    Relation,
+    required=("id", "type"),
+    defaults={"source_id": '""', "target_id": '""', "created_at": '""'},
+)
 
 
 # ─── Input Types ──────────────────────────────────────────────────────────────
@@ -6,11 +6,18 @@ Mirrors: packages/core/src/validation/index.ts
 
 from __future__ import annotations
 
+import asyncio
+import math
 import re
+import reprlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Collection, Iterable, Iterator, NamedTuple, Optional
 from urllib.parse import urlparse
 
+from .patterns import pattern_search
 from .types import FieldDefinition, FieldType
 
 
@@ -38,6 +45,14 @@ class ValidationResult:
         }
 
 
+class RecordValidation(NamedTuple):
+    """One record's outcome from :func:`validate_many`."""
+    #: Position of the record in the input.
+    index: int
+    record: dict[str, Any]
+    result: ValidationResult
+
+
 # ─── Regex Constants ───────────────────────────────────────────────────────────
 
 _EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
@@ -105,22 +120,7 @@ def validate_fields(
 
 def _validate_by_type(value: Any, field_def: FieldDefinition) -> list[ValidationError]:
     """Dispatch to the correct type validator."""
-    validators: dict[FieldType, Any] = {
-        "string":       _validate_string,
-        "textarea":     _validate_string,
-        "number":       _validate_number,
-        "boolean":      _validate_boolean,
-        "date":         _validate_date,
-        "select":       _validate_select,
-        "multi-select": _validate_multi_select,
-        "url":          _validate_url,
-        "email":        _validate_email,
-        "tags":         _validate_tags,
-        "json":         _validate_json,
-        "array":        _validate_array,
-    }
-
-    validator = validators.get(field_def.type)
+    validator = _VALIDATORS.get(field_def.type)
     if validator is None:
         return [ValidationError(
             field=field_def.name,
@@ -158,7 +158,6 @@ def _validate_number(value: Any, field_def: FieldDefinition) -> list[ValidationE
         ))
         return errors
 
-    import math
     if math.isnan(value):
         errors.append(ValidationError(
             field=field_def.name,
@@ -307,16 +306,16 @@ def _validate_tags(value: Any, field_def: FieldDefinition) -> list[ValidationErr
 def _validate_json(value: Any, field_def: FieldDefinition) -> list[ValidationError]:
     # JSON accepts any value that is serializable — dicts, lists,
     # strings, numbers, booleans, None. Reject only non-serializable types.
-    try:
-        import json
-        json.dumps(value)
-    except (TypeError, ValueError):
-        return [ValidationError(
-            field=field_def.name,
-            message="Expected JSON-serializable value",
-            value=repr(value),
-        )]
-    return []
+    v = field_def.validation
+    max_depth = v.max_depth if v and v.max_depth is not None else JSON_MAX_DEPTH
+    problem = _json_problem(value, max_depth, v.max_nodes if v else None)
+    if problem is None:
+        return []
+    return [ValidationError(
+        field=field_def.name,
+        message=problem,
+        value=repr(value) if problem == _NOT_JSON else reprlib.repr(value),
+    )]
 
 
 def _validate_array(value: Any, field_def: FieldDefinition) -> list[ValidationError]:
@@ -329,6 +328,83 @@ def _validate_array(value: Any, field_def: FieldDefinition) -> list[ValidationEr
     return []
 
 
+_VALIDATORS: dict[FieldType, Callable[[Any, FieldDefinition], list[ValidationError]]] = {
+    "string":       _validate_string,
+    "textarea":     _validate_string,
+    "number":       _validate_number,
+    "boolean":      _validate_boolean,
+    "date":         _validate_date,
+    "select":       _validate_select,
+    "multi-select": _validate_multi_select,
+    "url":          _validate_url,
+    "email":        _validate_email,
+    "tags":         _validate_tags,
+    "json":         _validate_json,
+    "array":        _validate_array,
+}
+
+
+# ─── JSON Compatibility ───────────────────────────────────────────────────────
+
+JSON_MAX_DEPTH = 1000
+"""Default nesting limit for ``json`` fields — about where ``json.dumps`` hits the recursion limit."""
+
+_NOT_JSON = "Expected JSON-serializable value"
+_JSON_SCALARS = (str, int, float)
+_DONE = object()
+
+
+def _json_problem(value: Any, max_depth: int, max_nodes: Optional[int]) -> Optional[str]:
+    """
+    Return why *value* is not ``json.dumps``-able — or exceeds the nesting or
+    size limits — or ``None`` if it is fine.
+
+    Walks the structure iteratively without building any output, holding one
+    iterator per open container.  Accepts exactly what ``json.dumps`` does
+    with default arguments: str/int/float/bool/None scalars, lists and tuples,
+    and dicts keyed by str/int/float/bool/None, with no container nested
+    inside itself.
+    """
+    stack: list[Iterator[Any]] = []
+    open_ids: list[int] = []
+    ancestors: set[int] = set()
+    nodes = 0
+    item = value
+    while True:
+        nodes += 1
+        if max_nodes is not None and nodes > max_nodes:
+            return f"JSON value has more than {max_nodes} values"
+        cls = type(item)
+        if cls is str or cls is int or cls is float or cls is bool or item is None:
+            pass
+        elif isinstance(item, (dict, list, tuple)):
+            if len(stack) >= max_depth:
+                return f"JSON value is nested deeper than {max_depth} levels"
+            if id(item) in ancestors:
+                return _NOT_JSON  # circular reference
+            if isinstance(item, dict):
+                for key in item:
+                    if not (key is None or isinstance(key, _JSON_SCALARS)):
+                        return _NOT_JSON
+                children = iter(item.values())
+            else:
+                children = iter(item)
+            stack.append(children)
+            open_ids.append(id(item))
+            ancestors.add(id(item))
+        elif not isinstance(item, _JSON_SCALARS):
+            return _NOT_JSON
+
+        while stack:
+            item = next(stack[-1], _DONE)
+            if item is not _DONE:
+                break
+            stack.pop()
+            ancestors.discard(open_ids.pop())
+        else:
+            return None
+
+
 # ─── String Constraint Helpers ────────────────────────────────────────────────
 
 def _apply_string_constraints(
@@ -355,9 +431,482 @@ def _apply_string_constraints(
             value=value,
         ))
 
-    if v.pattern is not None and not re.search(v.pattern, value):
+    if v.pattern is not None and not pattern_search(v.pattern)(value):
         errors.append(ValidationError(
             field=field_def.name,
             message=f"Must match pattern: {v.pattern}",
             value=value,
         ))
+
+
+# ─── Compiled Validators ──────────────────────────────────────────────────────
+
+_Check = Callable[[Any, list[ValidationError]], None]
+
+_URL_SCHEMES = frozenset(("http", "https", "ws", "wss"))
+
+
+class CompiledValidator:
+    """
+    ``validate_fields`` specialised for one schema; see :func:`compile_validator`.
+
+    Calling it with a fields dict returns the same :class:`ValidationResult`
+    as ``validate_fields(fields, schema)``.  ``source`` holds the generated
+    Python source when built with ``codegen=True``, else ``None``.
+    """
+
+    __slots__ = ("schema", "source", "_checks", "_validate")
+
+    def __init__(self, schema: list[FieldDefinition], *, codegen: bool = False) -> None:
+        self.schema = tuple(schema)
+        #: ``(field_name, required_message, check)`` in schema order; the
+        #: message is ``None`` for optional fields.
+        self._checks: tuple[tuple[str, Optional[str], _Check], ...] = tuple(
+            (f.name, f'Field "{f.name}" is required' if f.required else None, _compile_check(f))
+            for f in schema
+        )
+        if codegen:
+            self.source, self._validate = _generate(self.schema, self._checks)
+        else:
+            self.source = None
+            self._validate = self._run_checks
+
+    def __call__(self, fields: dict[str, Any]) -> ValidationResult:
+        return self._validate(fields)
+
+    def validate_subset(self, fields: dict[str, Any], names: Collection[str]) -> ValidationResult:
+        """
+        Type-check only the fields in *names*; every required field is still
+        checked for presence.  When the other fields already passed validation
+        against this schema, the result equals a full validation.
+        """
+        return self._run_checks(fields, names)
+
+    def _run_checks(
+        self,
+        fields: dict[str, Any],
+        names: Optional[Collection[str]] = None,
+    ) -> ValidationResult:
+        errors: list[ValidationError] = []
+        get = fields.get
+        for name, required_message, check in self._checks:
+            value = get(name)
+            if value is None or value == "":
+                if required_message is not None:
+                    errors.append(ValidationError(name, required_message, value))
+            elif names is None or name in names:
+                check(value, errors)
+        return ValidationResult(valid=not errors, errors=errors)
+
+
+def compile_validator(
+    schema: list[FieldDefinition],
+    *,
+    codegen: bool = False,
+) -> CompiledValidator:
+    """
+    Build a validator specialised for *schema*.
+
+    Patterns are compiled, option sets and error messages precomputed and each
+    field bound to its type check once, so validating a minion does no
+    per-field dispatch.  With ``codegen=True`` the checks for the common types
+    are emitted as one straight-line Python function instead (kept in
+    ``.source``), which removes the per-field call overhead as well.
+
+    The result is output-equivalent to :func:`validate_fields`.  Mutating a
+    FieldDefinition after compiling is not reflected; compile again.
+    """
+    return CompiledValidator(schema, codegen=codegen)
+
+
+def _options(options: list[Any]) -> Any:
+    """A set for membership tests when the options are hashable, else the list."""
+    try:
+        return frozenset(options)
+    except TypeError:
+        return options
+
+
+def _one_of(options: list[Any]) -> Optional[str]:
+    """The joined option list for error messages, or ``None`` if it cannot be
+    built up front (non-string options), in which case ``validate_fields``
+    raises on the first invalid value and so must the compiled check."""
+    try:
+        return ", ".join(options)
+    except TypeError:
+        return None
+
+
+def _compile_check(f: FieldDefinition) -> _Check:
+    """Bind the type check for *f*; it appends to ``errors`` like ``_validate_by_type``."""
+    name, kind, v = f.name, f.type, f.validation
+
+    if kind in ("string", "textarea"):
+        min_length = v.min_length if v else None
+        max_length = v.max_length if v else None
+        search = pattern_search(v.pattern) if v and v.pattern is not None else None
+        pattern_message = f"Must match pattern: {v.pattern}" if search else ""
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, str):
+                errors.append(ValidationError(name, f"Expected string, got {type(value).__name__}", value))
+                return
+            if min_length is not None and len(value) < min_length:
+                errors.append(ValidationError(name, f"Must be at least {min_length} characters", value))
+            if max_length is not None and len(value) > max_length:
+                errors.append(ValidationError(name, f"Must be at most {max_length} characters", value))
+            if search is not None and not search(value):
+                errors.append(ValidationError(name, pattern_message, value))
+
+    elif kind == "number":
+        lo = v.min if v else None
+        hi = v.max if v else None
+        isnan = math.isnan
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                errors.append(ValidationError(name, f"Expected number, got {type(value).__name__}", value))
+            elif isnan(value):
+                errors.append(ValidationError(name, "Expected number, got NaN", value))
+            else:
+                if lo is not None and value < lo:
+                    errors.append(ValidationError(name, f"Value must be >= {lo}", value))
+                if hi is not None and value > hi:
+                    errors.append(ValidationError(name, f"Value must be <= {hi}", value))
+
+    elif kind == "boolean":
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, bool):
+                errors.append(ValidationError(name, f"Expected boolean, got {type(value).__name__}", value))
+
+    elif kind in ("date", "email"):
+        match = (_ISO8601_RE if kind == "date" else _EMAIL_RE).match
+        message = "Expected valid ISO 8601 date string" if kind == "date" else "Expected valid email address"
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, str) or not match(value):
+                errors.append(ValidationError(name, message, value))
+
+    elif kind == "select":
+        listed = f.options
+        options = _options(listed) if listed else None
+        joined = _one_of(listed) if listed else ""
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, str):
+                errors.append(ValidationError(
+                    name, f"Expected string for select, got {type(value).__name__}", value,
+                ))
+            elif options is not None and value not in options:
+                one_of = joined if joined is not None else ", ".join(listed)
+                errors.append(ValidationError(name, f"Value must be one of: {one_of}", value))
+
+    elif kind == "multi-select":
+        listed = f.options
+        options = _options(listed) if listed else None
+        joined = _one_of(listed) if listed else ""
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, list):
+                errors.append(ValidationError(
+                    name, f"Expected list for multi-select, got {type(value).__name__}", value,
+                ))
+                return
+            if options is None:
+                return
+            for item in value:
+                try:
+                    found = item in options
+                except TypeError:  # unhashable item against a set
+                    found = item in listed
+                if not found:
+                    one_of = joined if joined is not None else ", ".join(listed)
+                    errors.append(ValidationError(
+                        name, f"Invalid option: {item!r}. Must be one of: {one_of}", item,
+                    ))
+
+    elif kind == "url":
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if isinstance(value, str):
+                try:
+                    parsed = urlparse(value)
+                    if parsed.scheme in _URL_SCHEMES and parsed.netloc:
+                        return
+                except Exception:
+                    pass
+            errors.append(ValidationError(name, "Expected valid URL (http/https/ws/wss)", value))
+
+    elif kind == "tags":
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, list):
+                errors.append(ValidationError(name, f"Expected list for tags, got {type(value).__name__}", value))
+                return
+            for tag in value:
+                if not isinstance(tag, str):
+                    errors.append(ValidationError(name, "Tag values must be strings", tag))
+
+    elif kind == "json":
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            errors.extend(_validate_json(value, f))
+
+    elif kind == "array":
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            if not isinstance(value, list):
+                errors.append(ValidationError(name, f"Expected list, got {type(value).__name__}", value))
+
+    else:
+        message = f"Unknown field type: {kind}"
+
+        def check(value: Any, errors: list[ValidationError]) -> None:
+            errors.append(ValidationError(name, message, value))
+
+    return check
+
+
+def _generate(
+    schema: tuple[FieldDefinition, ...],
+    checks: tuple[tuple[str, Optional[str], _Check], ...],
+) -> tuple[str, Callable[[dict[str, Any]], ValidationResult]]:
+    """
+    Emit one Python function validating *schema* field by field.  Common types
+    are inlined; the rest call their bound check.  Returns ``(source, fn)``.
+    """
+    namespace: dict[str, Any] = {
+        "_VE": ValidationError, "_VR": ValidationResult, "_isnan": math.isnan,
+        "_iso": _ISO8601_RE.match, "_email": _EMAIL_RE.match,
+        # Builtins as module globals skip the fallback lookup in ``__builtins__``.
+        "isinstance": isinstance, "type": type, "len": len,
+        "str": str, "int": int, "float": float, "bool": bool, "list": list,
+    }
+
+    def const(value: Any) -> str:
+        key = f"_k{len(namespace)}"
+        namespace[key] = value
+        return key
+
+    def error(n: str, message: str, value: str = "value") -> str:
+        return f"errors.append(_VE({n}, {message}, {value}))"
+
+    def got(prefix: str) -> str:
+        return f"{prefix!r} + type(value).__name__"
+
+    lines = ["def validate(fields):", "    errors = []", "    get = fields.get"]
+    for f, (name, required_message, check) in zip(schema, checks):
+        n = repr(name)
+        v = f.validation
+        lines += [
+            f"    # {n}: {f.type!r}",
+            f"    value = get({n})",
+            '    if value is None or value == "":',
+            f"        {error(n, repr(required_message))}" if required_message else "        pass",
+            "    else:",
+        ]
+        body: list[str]
+        if f.type in ("string", "textarea"):
+            body = [f"if not isinstance(value, str):", f"    {error(n, got('Expected string, got '))}"]
+            constraints: list[str] = []
+            if v and v.min_length is not None:
+                constraints += [
+                    f"if len(value) < {const(v.min_length)}:",
+                    f"    {error(n, repr(f'Must be at least {v.min_length} characters'))}",
+                ]
+            if v and v.max_length is not None:
+                constraints += [
+                    f"if len(value) > {const(v.max_length)}:",
+                    f"    {error(n, repr(f'Must be at most {v.max_length} characters'))}",
+                ]
+            if v and v.pattern is not None:
+                constraints += [
+                    f"if not {const(pattern_search(v.pattern))}(value):",
+                    f"    {error(n, repr(f'Must match pattern: {v.pattern}'))}",
+                ]
+            if constraints:
+                body += ["else:"] + ["    " + line for line in constraints]
+        elif f.type == "number":
+            body = [
+                "if isinstance(value, bool) or not isinstance(value, (int, float)):",
+                f"    {error(n, got('Expected number, got '))}",
+                "elif _isnan(value):",
+                f"    {error(n, repr('Expected number, got NaN'))}",
+            ]
+            bounds: list[str] = []
+            if v and v.min is not None:
+                bounds += [f"if value < {const(v.min)}:", f"    {error(n, repr(f'Value must be >= {v.min}'))}"]
+            if v and v.max is not None:
+                bounds += [f"if value > {const(v.max)}:", f"    {error(n, repr(f'Value must be <= {v.max}'))}"]
+            if bounds:
+                body += ["else:"] + ["    " + line for line in bounds]
+        elif f.type == "boolean":
+            body = ["if not isinstance(value, bool):", f"    {error(n, got('Expected boolean, got '))}"]
+        elif f.type == "date":
+            body = [
+                "if not isinstance(value, str) or not _iso(value):",
+                f"    {error(n, repr('Expected valid ISO 8601 date string'))}",
+            ]
+        elif f.type == "email":
+            body = [
+                "if not isinstance(value, str) or not _email(value):",
+                f"    {error(n, repr('Expected valid email address'))}",
+            ]
+        elif f.type == "select" and (not f.options or _one_of(f.options) is not None):
+            body = ["if not isinstance(value, str):", f"    {error(n, got('Expected string for select, got '))}"]
+            if f.options:
+                body += [
+                    f"elif value not in {const(_options(f.options))}:",
+                    f"    {error(n, repr(f'Value must be one of: {_one_of(f.options)}'))}",
+                ]
+        elif f.type == "array":
+            body = ["if not isinstance(value, list):", f"    {error(n, got('Expected list, got '))}"]
+        else:
+            body = [f"{const(check)}(value, errors)"]
+        lines += ["        " + line for line in body]
+    lines.append("    return _VR(valid=not errors, errors=errors)")
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, "<minions compiled validator>", "exec"), namespace)
+    return source, namespace["validate"]
+
+
+# ─── Batch Validation ─────────────────────────────────────────────────────────
+
+# Set in each pool worker by ``_init_worker`` so the schema crosses the
+# process boundary once per worker rather than once per chunk.
+_worker_validator: Optional[CompiledValidator] = None
+
+
+def _init_worker(schema: list[FieldDefinition]) -> None:
+    global _worker_validator
+    _worker_validator = compile_validator(schema, codegen=True)
+
+
+def _validate_chunk(records: list[dict[str, Any]]) -> list[ValidationResult]:
+    return [_worker_validator(r) for r in records]
+
+
+def _chunks(records: Iterable[dict[str, Any]], chunk_size: int) -> Iterator[list[dict[str, Any]]]:
+    it = iter(records)
+    return iter(lambda: list(islice(it, chunk_size)), [])
+
+
+def validate_many(
+    records: Iterable[dict[str, Any]],
+    schema: list[FieldDefinition],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    fail_fast: bool = False,
+) -> Iterator[RecordValidation]:
+    """
+    Validate many field dicts against one schema, yielding a
+    :class:`RecordValidation` per record in input order as soon as it is
+    known — so valid rows can be persisted while the rest are still being
+    checked.  *records* is consumed lazily.
+
+    By default validation runs in-process with the compiled validator.  With
+    ``workers`` > 1, chunks of *chunk_size* records are validated across a
+    :class:`~concurrent.futures.ProcessPoolExecutor` instead; the schema is
+    sent to each worker once and compiled there, and at most ``2 * workers``
+    chunks are in flight.  Either way results equal ``validate_fields``.
+
+    With ``fail_fast=True`` iteration stops after the first invalid record
+    (which is yielded) and any outstanding chunks are cancelled.
+
+    This is a blocking iterator: it validates, or waits on the pool, in the
+    calling thread.  From coroutine code use :func:`validate_many_async`,
+    which keeps the event loop running.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if workers is None or workers <= 1:
+        validate = compile_validator(schema, codegen=True)
+        for index, record in enumerate(records):
+            result = validate(record)
+            yield RecordValidation(index, record, result)
+            if fail_fast and not result.valid:
+                return
+        return
+
+    chunks = _chunks(records, chunk_size)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(list(schema),)) as pool:
+        pending: deque[tuple[list[dict[str, Any]], Future]] = deque()
+        index = 0
+        try:
+            while True:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append((chunk, pool.submit(_validate_chunk, chunk)))
+                    if len(pending) < 2 * workers:
+                        continue
+                if not pending:
+                    return
+                chunk, future = pending.popleft()
+                for record, result in zip(chunk, future.result()):
+                    yield RecordValidation(index, record, result)
+                    index += 1
+                    if fail_fast and not result.valid:
+                        return
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+async def validate_many_async(
+    records: Iterable[dict[str, Any]],
+    schema: list[FieldDefinition],
+    *,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    fail_fast: bool = False,
+) -> AsyncIterator[RecordValidation]:
+    """
+    :func:`validate_many` for coroutine code, as an async iterator::
+
+        async for step in validate_many_async(rows, note_type.schema, workers=4):
+            if step.result.valid:
+                await storage.set(...)
+
+    Validation never runs on the event-loop thread: in-process, each chunk
+    of *chunk_size* records is validated in the loop's default executor;
+    with ``workers`` > 1, chunks go to a process pool as in
+    :func:`validate_many` and are awaited.  Results, ordering and
+    ``fail_fast`` match :func:`validate_many`.  Leaving the loop early
+    cancels outstanding chunks without waiting for running ones.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    loop = asyncio.get_running_loop()
+    chunks = _chunks(records, chunk_size)
+    index = 0
+
+    if workers is None or workers <= 1:
+        validate = compile_validator(schema, codegen=True)
+        for chunk in chunks:
+            results = await loop.run_in_executor(None, lambda c=chunk: [validate(r) for r in c])
+            for record, result in zip(chunk, results):
+                yield RecordValidation(index, record, result)
+                index += 1
+                if fail_fast and not result.valid:
+                    return
+        return
+
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(list(schema),))
+    pending: deque[tuple[list[dict[str, Any]], Future]] = deque()
+    try:
+        while True:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append((chunk, pool.submit(_validate_chunk, chunk)))
+                if len(pending) < 2 * workers:
+                    continue
+            if not pending:
+                return
+            chunk, future = pending.popleft()
+            for record, result in zip(chunk, await asyncio.wrap_future(future)):
+                yield RecordValidation(index, record, result)
+                index += 1
+                if fail_fast and not result.valid:
+                    return
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
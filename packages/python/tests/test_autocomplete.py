@@ -0,0 +1,159 @@
+"""
+Tests for the Minions Python AutocompleteIndex.
+"""
+
+import dataclasses
+import random
+
+from minions import AutocompleteIndex, Minion
+
+
+def make_minion(id: str, title: str, updated_at: str, tags=None) -> Minion:
+    return Minion(
+        id=id, title=title, minion_type_id="builtin-note", fields={},
+        created_at=updated_at, updated_at=updated_at, tags=tags,
+    )
+
+
+def texts(completions):
+    return [c.text for c in completions]
+
+
+class TestAutocompleteIndex:
+    def test_prefix_match_is_case_insensitive(self):
+        index = AutocompleteIndex()
+        index.add(make_minion("1", "Project Plan", "2024-01-01"))
+        index.add(make_minion("2", "Prototype", "2024-01-02"))
+        index.add(make_minion("3", "Budget", "2024-01-03"))
+
+        assert texts(index.suggest("PRO")) == ["Prototype", "Project Plan"]
+        assert texts(index.suggest("proj")) == ["Project Plan"]
+        assert index.suggest("zzz") == []
+
+    def test_title_completion_carries_minion_id(self):
+        index = AutocompleteIndex()
+        index.add(make_minion("m1", "Roadmap", "2024-01-01"))
+        (c,) = index.suggest("road")
+        assert (c.kind, c.minion_id) == ("title", "m1")
+
+    def test_tags_rank_by_recency_and_usage(self):
+        index = AutocompleteIndex()
+        index.add(make_minion("1", "A", "2024-01-01", tags=["python", "pytest"]))
+        index.add(make_minion("2", "B", "2024-01-02", tags=["python"]))
+        index.add(make_minion("3", "C", "2024-01-03", tags=["pytorch"]))
+
+        assert texts(index.suggest("py", kinds=["tag"])) == ["pytorch", "python", "pytest"]
+        assert texts(index.suggest("py", kinds=["tag"], rank="usage")) == ["python", "pytorch", "pytest"]
+
+    def test_record_use_promotes_title(self):
+        index = AutocompleteIndex()
+        index.add(make_minion("old", "Meeting notes", "2024-01-01"))
+        index.add(make_minion("new", "Meeting agenda", "2024-02-01"))
+        assert texts(index.suggest("meet", rank="usage")) == ["Meeting agenda", "Meeting notes"]
+
+        index.record_use("old")
+        assert texts(index.suggest("meet", rank="usage")) == ["Meeting notes", "Meeting agenda"]
+
+    def test_updates_and_removals_are_incremental(self):
+        index = AutocompleteIndex()
+        m = make_minion("1", "Alpha", "2024-01-01", tags=["red"])
+        index.add(make_minion("2", "Alps", "2024-01-02"))
+        index.add(m)
+        assert texts(index.suggest("al")) == ["Alps", "Alpha"]
+
+        index.add(dataclasses.replace(m, title="Almanac", updated_at="2024-03-01", tags=["blue"]))
+        assert texts(index.suggest("al")) == ["Almanac", "Alps"]
+        assert index.suggest("red") == []
+        assert texts(index.suggest("blu")) == ["blue"]
+
+        index.remove("1")
+        assert texts(index.suggest("al")) == ["Alps"]
+        assert index.suggest("blu") == []
+
+    def test_soft_deleted_minions_are_dropped(self):
+        index = AutocompleteIndex()
+        m = make_minion("1", "Archive", "2024-01-01")
+        index.add(m)
+        index.add(dataclasses.replace(m, deleted_at="2024-02-01"))
+        assert "1" not in index
+        assert index.suggest("arc") == []
+
+    def test_add_many_matches_incremental_adds(self):
+        minions = [
+            make_minion(str(i), f"Item {i}", f"2024-01-{i + 1:02d}", tags=[f"t{i % 3}"])
+            for i in range(20)
+        ]
+        bulk = AutocompleteIndex()
+        bulk.add_many(minions)
+        one_by_one = AutocompleteIndex()
+        for m in minions:
+            one_by_one.add(m)
+
+        for prefix in ["", "i", "item 1", "t"]:
+            for rank in ("recency", "usage"):
+                assert bulk.suggest(prefix, rank=rank) == one_by_one.suggest(prefix, rank=rank)
+
+    def test_cached_results_match_full_ranking_under_churn(self):
+        rng = random.Random(42)
+        index = AutocompleteIndex(cache_prefix_length=2, cache_size=5)
+        live: dict[str, Minion] = {}
+        words = ["ant", "anchor", "apple", "apply", "bat", "batch", "bee", "cat"]
+        tags = ["ai", "api", "art", "bio"]
+
+        for step in range(400):
+            op = rng.random()
+            if op < 0.6 or not live:
+                id = str(rng.randrange(60))
+                m = make_minion(
+                    id, rng.choice(words), f"2024-{rng.randrange(1, 13):02d}-{rng.randrange(1, 28):02d}",
+                    tags=rng.sample(tags, rng.randrange(3)),
+                )
+                index.add(m)
+                live[id] = m
+            elif op < 0.8:
+                id = rng.choice(list(live))
+                index.remove(id)
+                del live[id]
+            else:
+                index.record_use(rng.choice(list(live)))
+
+            for prefix in ["", "a", "ap", "b"]:
+                for rank in ("recency", "usage"):
+                    cached = index.suggest(prefix, k=5, rank=rank)
+                    fresh = AutocompleteIndex(cache_prefix_length=0)
+                    fresh.add_many(live.values())
+                    fresh._uses = dict(index._uses)
+                    expected = fresh.suggest(prefix, k=5, rank=rank)
+                    assert cached == expected, (step, prefix, rank)
+
+    def test_removals_shrink_cached_lists_without_rescanning(self, monkeypatch):
+        from minions.autocomplete import _CACHE_SLACK, _PrefixRanking
+
+        capacity = 4 * _CACHE_SLACK
+        index = AutocompleteIndex(cache_prefix_length=1, cache_size=4)
+        minions = [
+            make_minion(f"m{i:03d}", f"item {i:03d}", f"2024-01-01T00:00:{i:03d}")
+            for i in range(capacity + 8)
+        ]
+        index.add_many(minions)
+        top = len(minions) - 1
+        assert texts(index.suggest("i", k=1)) == [f"item {top:03d}"]
+
+        scans = []
+        compute = _PrefixRanking._compute
+        monkeypatch.setattr(
+            _PrefixRanking, "_compute", lambda self, *args: scans.append(args) or compute(self, *args),
+        )
+        # The cached list holds `capacity` entries, so all but four can drop
+        # out before k=4 needs a rescan.
+        for m in minions[top:top - capacity + 5:-1]:
+            index.remove(m.id)
+        index.add(dataclasses.replace(minions[top - capacity + 4], updated_at="2023-01-01"))
+        survivors = [f"item {i:03d}" for i in (top - capacity + 5, *range(top - capacity + 3, top - capacity, -1))]
+        for k in range(1, 5):
+            assert texts(index.suggest("i", k=k)) == survivors[:k]
+        assert scans == []
+
+        index.remove(minions[top - capacity + 5].id)
+        assert texts(index.suggest("i", k=4)) == survivors[1:] + [f"item {top - capacity:03d}"]
+        assert len(scans) == 1
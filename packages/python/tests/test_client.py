@@ -31,6 +31,17 @@ async def test_client_links_minions():
     assert len(children) == 1
     assert children[0] == skill.data.id
 
+
+@pytest.mark.asyncio
+async def test_client_link_to_is_idempotent():
+    minions = Minions()
+    agent = await minions.create("agent", {"title": "Agent", "fields": {"role": "tester"}})
+    skill = await minions.create("note", {"title": "Note", "fields": {"content": "hello"}})
+
+    agent.link_to(skill.data.id, "parent_of").link_to(skill.data.id, "parent_of")
+
+    assert minions.graph.get_children(agent.data.id) == [skill.data.id]
+
 class MockPlugin(MinionPlugin):
     @property
     def namespace(self) -> str:
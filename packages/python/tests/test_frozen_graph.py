@@ -0,0 +1,84 @@
+"""
+Tests for the Minions Python FrozenRelationGraph (CSR snapshot).
+"""
+
+import random
+
+import pytest
+
+from minions import FrozenRelationGraph, RelationGraph
+
+
+def _graph() -> RelationGraph:
+    graph = RelationGraph()
+    for s, t, type in [
+        ("a", "b", "parent_of"),
+        ("a", "c", "depends_on"),
+        ("b", "d", "parent_of"),
+        ("c", "d", "relates_to"),
+        ("d", "a", "references"),
+    ]:
+        graph.add({"source_id": s, "target_id": t, "type": type})
+    return graph
+
+
+class TestFrozenRelationGraph:
+    def test_interns_ids_and_types(self):
+        frozen = _graph().freeze()
+        assert isinstance(frozen, FrozenRelationGraph)
+        assert frozen.ids == ["a", "b", "c", "d"]
+        assert frozen.index["c"] == 2
+        assert frozen.types == ("parent_of", "depends_on", "relates_to", "references")
+        assert len(frozen) == 4
+        assert frozen.edge_count == 5
+
+    def test_csr_layout(self):
+        frozen = _graph().freeze()
+        assert list(frozen.out_offsets) == [0, 2, 3, 4, 5]
+        assert list(frozen.successors(0)) == [1, 2]
+        assert list(frozen.predecessors(3)) == [1, 2]
+        assert frozen.out_degree(0) == 2
+        assert frozen.in_degree(0) == 1
+
+    def test_neighbors(self):
+        frozen = _graph().freeze()
+        assert frozen.neighbors("a") == ["b", "c"]
+        assert frozen.neighbors("a", types=["depends_on"]) == ["c"]
+        assert frozen.neighbors("d", direction="in") == ["b", "c"]
+        assert frozen.neighbors("a", direction="both") == ["b", "c", "d"]
+        assert frozen.neighbors("a", types=["blocks"]) == []
+        assert frozen.neighbors("missing") == []
+
+    def test_snapshot_is_independent_of_live_graph(self):
+        graph = _graph()
+        frozen = graph.freeze()
+        graph.add({"source_id": "a", "target_id": "z", "type": "parent_of"})
+        assert frozen.neighbors("a") == ["b", "c"]
+        assert "z" not in frozen.index
+
+    def test_empty_graph(self):
+        frozen = RelationGraph().freeze()
+        assert len(frozen) == 0
+        assert list(frozen.traverse("a")) == []
+
+    def test_traverse_matches_live_graph(self):
+        rng = random.Random(4)
+        graph = RelationGraph()
+        nodes = [f"n{i}" for i in range(50)]
+        for _ in range(150):
+            graph.add({
+                "source_id": rng.choice(nodes),
+                "target_id": rng.choice(nodes),
+                "type": rng.choice(("depends_on", "relates_to", "parent_of")),
+            })
+        frozen = graph.freeze()
+        for start in nodes[:10]:
+            for types in (None, ["depends_on"], ["relates_to", "parent_of"]):
+                for direction in ("out", "in", "both"):
+                    live = [(s.node, s.depth) for s in graph.traverse(start, types, direction, max_depth=3)]
+                    snap = list(frozen.traverse(start, types, direction, max_depth=3))
+                    assert sorted(snap) == sorted(live)
+
+    def test_rejects_unknown_direction(self):
+        with pytest.raises(ValueError):
+            next(_graph().freeze().traverse("a", direction="up"))
@@ -0,0 +1,97 @@
+"""
+Tests for minions.graph_analytics.
+"""
+
+import random
+
+import pytest
+
+from minions import RelationGraph
+from minions.graph_analytics import connected_components, degree_histogram, pagerank
+
+
+def _graph() -> RelationGraph:
+    #   a -> b -> c     d -> e     f -relates_to-> a
+    graph = RelationGraph()
+    for s, t, type in [
+        ("a", "b", "depends_on"),
+        ("b", "c", "depends_on"),
+        ("d", "e", "depends_on"),
+        ("f", "a", "relates_to"),
+    ]:
+        graph.add({"source_id": s, "target_id": t, "type": type})
+    return graph
+
+
+def _random_graph(seed: int, nodes: int = 300, edges: int = 500) -> RelationGraph:
+    rng = random.Random(seed)
+    graph = RelationGraph()
+    for _ in range(edges):
+        graph.add({
+            "source_id": f"n{rng.randrange(nodes)}",
+            "target_id": f"n{rng.randrange(nodes)}",
+            "type": rng.choice(("depends_on", "relates_to")),
+        })
+    return graph
+
+
+class TestConnectedComponents:
+    def test_groups_weakly_connected_minions(self):
+        assert connected_components(_graph(), use_numpy=False) == [["a", "b", "c", "f"], ["d", "e"]]
+
+    def test_filters_by_type(self):
+        components = connected_components(_graph(), types=["depends_on"], use_numpy=False)
+        assert components == [["a", "b", "c"], ["d", "e"]]
+
+    def test_accepts_frozen_graph(self):
+        frozen = _graph().freeze()
+        assert connected_components(frozen, types=["relates_to"], use_numpy=False) == [["f", "a"]]
+
+    def test_empty_graph(self):
+        assert connected_components(RelationGraph()) == []
+
+
+class TestDegreeHistogram:
+    def test_out_in_and_both(self):
+        graph = _graph()
+        assert degree_histogram(graph, "out", use_numpy=False) == {0: 2, 1: 4}
+        assert degree_histogram(graph, "in", use_numpy=False) == {0: 2, 1: 4}
+        assert degree_histogram(graph, "both", use_numpy=False) == {1: 4, 2: 2}
+
+    def test_rejects_unknown_direction(self):
+        with pytest.raises(ValueError):
+            degree_histogram(_graph(), "sideways")
+
+
+class TestPageRank:
+    def test_scores_sum_to_one_and_rank_sinks_high(self):
+        ranks = pagerank(_graph(), use_numpy=False)
+        assert sum(ranks.values()) == pytest.approx(1.0)
+        assert max(ranks, key=ranks.get) == "c"
+        assert ranks["f"] == pytest.approx(min(ranks.values()))
+
+    def test_symmetric_cycle_is_uniform(self):
+        graph = RelationGraph()
+        for s, t in [("a", "b"), ("b", "c"), ("c", "a")]:
+            graph.add({"source_id": s, "target_id": t, "type": "follows"})
+        ranks = pagerank(graph, use_numpy=False)
+        assert all(r == pytest.approx(1 / 3) for r in ranks.values())
+
+    def test_rejects_bad_damping(self):
+        with pytest.raises(ValueError):
+            pagerank(_graph(), damping=1.5)
+
+
+class TestNumpyPath:
+    def test_matches_pure_python(self):
+        pytest.importorskip("numpy")
+        for seed in range(3):
+            frozen = _random_graph(seed).freeze()
+            assert connected_components(frozen, use_numpy=True) == connected_components(frozen, use_numpy=False)
+            for direction in ("out", "in", "both"):
+                assert degree_histogram(frozen, direction, use_numpy=True) == \
+                    degree_histogram(frozen, direction, use_numpy=False)
+            fast = pagerank(frozen, use_numpy=True)
+            slow = pagerank(frozen, use_numpy=False)
+            assert fast.keys() == slow.keys()
+            assert all(fast[k] == pytest.approx(slow[k], rel=1e-9) for k in slow)
@@ -3,10 +3,13 @@ Tests for the Minions Python lifecycle utilities.
 Mirrors: packages/core/src/__tests__/lifecycle.test.ts
 """
 
+import random
+
 from minions import create_minion, update_minion, soft_delete, hard_delete, restore_minion
 from minions import RelationGraph
 from minions.schemas import note_type, agent_type
-from minions.types import MinionType, FieldDefinition
+from minions.types import MinionType, FieldDefinition, FieldValidation
+from minions.validation import validate_fields
 
 
 # ─── createMinion ─────────────────────────────────────────────────────────────
@@ -150,6 +153,163 @@ class TestUpdateMinion:
         assert "original" not in updated.searchable_text
 
 
+    def test_noop_update_returns_original(self):
+        minion, _ = create_minion(
+            {"title": "Note", "fields": {"content": "hello"}, "tags": ["a"]},
+            note_type,
+        )
+        for input in ({}, {"title": "Note"}, {"fields": {"content": "hello"}, "tags": ["a"]}):
+            updated, validation = update_minion(minion, input, note_type)
+            assert updated is minion
+            assert validation.valid
+
+        updated, _ = update_minion(minion, {"fields": {"content": "hello", "extra": None}}, note_type)
+        assert updated is minion
+        updated, _ = update_minion(minion, {"fields": {"content": "changed"}}, note_type)
+        assert updated is not minion
+        assert updated.fields["content"] == "changed"
+
+    def test_noop_update_still_checks_required_fields(self):
+        minion, _ = create_minion({"title": "Note", "fields": {}}, note_type)
+        updated, validation = update_minion(minion, {}, note_type)
+        assert updated is minion
+        assert not validation.valid
+        assert [e.field for e in validation.errors] == ["content"]
+
+    def test_full_update_is_never_a_noop(self):
+        minion, _ = create_minion({"title": "Note", "fields": {}}, note_type)
+        updated, validation = update_minion(minion, {}, note_type, incremental=False)
+        assert updated is not minion
+        assert not validation.valid
+
+# ─── Incremental update validation ────────────────────────────────────────────
+
+_INCREMENTAL_TYPE = MinionType(
+    id="test-incremental",
+    name="Test Incremental",
+    slug="test-incremental",
+    schema=[
+        FieldDefinition(name="name", type="string", required=True, validation=FieldValidation(pattern="^[a-z]+$")),
+        FieldDefinition(name="size", type="number", validation=FieldValidation(min=0, max=9)),
+        FieldDefinition(name="kind", type="select", required=True, options=["a", "b"]),
+        FieldDefinition(name="payload", type="json"),
+        FieldDefinition(name="labels", type="tags"),
+    ],
+)
+
+
+class TestIncrementalUpdate:
+    def _valid_minion(self):
+        minion, validation = create_minion(
+            {"title": "T", "fields": {"name": "abc", "size": 3, "kind": "a", "payload": {"x": [1]}}},
+            _INCREMENTAL_TYPE,
+        )
+        assert validation.valid
+        return minion
+
+    def test_matches_full_validation_for_valid_minions(self):
+        rng = random.Random(45)
+        pool = {
+            "name": ["xyz", "ABC", "", None, 5],
+            "size": [0, 9, 10, -1, "7", None],
+            "kind": ["a", "b", "c", None],
+            "payload": [{"y": 2}, object(), None],
+            "labels": [["q"], "q", None],
+        }
+        minion = self._valid_minion()
+        for _ in range(500):
+            changes = {k: rng.choice(v) for k, v in pool.items() if rng.random() < 0.4}
+            updated, validation = update_minion(minion, {"fields": changes}, _INCREMENTAL_TYPE)
+            full = validate_fields(updated.fields, _INCREMENTAL_TYPE.schema)
+            assert validation.valid == full.valid
+            assert [(e.field, e.message) for e in validation.errors] == [(e.field, e.message) for e in full.errors]
+
+    def test_only_changed_fields_are_type_checked(self):
+        minion = self._valid_minion()
+        minion.fields["size"] = "not a number"  # stale, already-invalid data
+        _, validation = update_minion(minion, {"fields": {"name": "def"}}, _INCREMENTAL_TYPE)
+        assert validation.valid
+        _, validation = update_minion(minion, {"fields": {"name": "def"}}, _INCREMENTAL_TYPE, incremental=False)
+        assert [e.field for e in validation.errors] == ["size"]
+
+    def test_required_presence_always_checked(self):
+        minion = self._valid_minion()
+        del minion.fields["kind"]
+        _, validation = update_minion(minion, {"title": "Renamed"}, _INCREMENTAL_TYPE)
+        assert [e.field for e in validation.errors] == ["kind"]
+
+
+# ─── Searchable text extraction ───────────────────────────────────────────────
+
+class TestSearchableTextExtraction:
+    def test_stores_interned_search_tokens(self):
+        minion, _ = create_minion(
+            {"title": "Token Test", "fields": {"content": "Alpha BETA"}},
+            note_type,
+        )
+        assert minion.search_tokens == tuple(minion.searchable_text.split())
+        assert minion.search_tokens == ("token", "test", "alpha", "beta")
+
+    def test_tokens_follow_updates(self):
+        minion, _ = create_minion({"title": "Old", "fields": {"content": "x"}}, note_type)
+        updated, _ = update_minion(minion, {"title": "New"}, note_type)
+        assert "new" in updated.search_tokens
+        assert "old" not in updated.search_tokens
+
+    def test_replace_drops_derived_tokens(self):
+        import dataclasses
+        minion, _ = create_minion({"title": "Note", "fields": {"content": "x"}}, note_type)
+        copy = dataclasses.replace(minion, searchable_text="something else")
+        assert copy.search_tokens is None
+
+    def test_extractor_is_cached_per_type(self):
+        from minions.lifecycle import _searchable_text_extractor
+        assert _searchable_text_extractor(note_type) is _searchable_text_extractor(note_type)
+
+    def test_extractor_rebuilt_when_schema_changes(self):
+        from minions.lifecycle import _searchable_text_extractor
+        t = MinionType(
+            id="test-extract",
+            name="Test Extract",
+            slug="test-extract",
+            schema=[FieldDefinition(name="a", type="string")],
+        )
+        minion, _ = create_minion({"title": "T", "fields": {"a": "first", "b": "second"}}, t)
+        assert "second" not in minion.searchable_text
+
+        before = _searchable_text_extractor(t)
+        t.schema = [*t.schema, FieldDefinition(name="b", type="textarea")]
+        assert _searchable_text_extractor(t) is not before
+
+        updated, _ = update_minion(minion, {}, t)
+        assert "second" in updated.searchable_text
+
+    def test_json_fields_excluded_unless_opted_in(self):
+        payload = {"query": "Weather in Paris", "debug": {"trace": "xyz123"}}
+        plain = MinionType(
+            id="test-json-plain", name="Plain", slug="test-json-plain",
+            schema=[FieldDefinition(name="input", type="json")],
+        )
+        minion, _ = create_minion({"title": "Task", "fields": {"input": payload}}, plain)
+        assert "paris" not in minion.searchable_text
+
+        opted = MinionType(
+            id="test-json-opted", name="Opted", slug="test-json-opted",
+            schema=[FieldDefinition(name="input", type="json", search_paths=["query"])],
+        )
+        minion, _ = create_minion({"title": "Task", "fields": {"input": payload}}, opted)
+        assert "weather in paris" in minion.searchable_text
+        assert "xyz123" not in minion.searchable_text
+
+    def test_json_search_respects_character_cap(self):
+        t = MinionType(
+            id="test-json-cap", name="Cap", slug="test-json-cap",
+            schema=[FieldDefinition(name="output", type="json", search_paths=["$"], search_max_chars=5)],
+        )
+        minion, _ = create_minion({"title": "Task", "fields": {"output": ["abcdefgh", "tail"]}}, t)
+        assert minion.searchable_text == "task abcde"
+
+
 # ─── softDelete ───────────────────────────────────────────────────────────────
 
 class TestSoftDelete:
@@ -0,0 +1,112 @@
+"""
+Tests for the Minions Python pattern-safety analysis and bounded matching.
+"""
+
+import re
+import time
+import warnings
+
+import pytest
+from minions import TypeRegistry, UnsafePatternWarning, analyze_pattern, pattern_search
+from minions.types import FieldDefinition, FieldValidation, MinionType
+from minions.validation import validate_field
+
+
+def pattern_type(pattern: str, slug: str = "patterned") -> MinionType:
+    return MinionType(
+        id=f"test-{slug}", name=slug, slug=slug,
+        schema=[FieldDefinition(name="code", type="string", validation=FieldValidation(pattern=pattern))],
+    )
+
+
+# ─── analyze_pattern ──────────────────────────────────────────────────────────
+
+class TestAnalyzePattern:
+    @pytest.mark.parametrize("pattern", [
+        r"(a+)+$",
+        r"^(\w+\s?)*$",
+        r"(a*b*)*c",
+        r"(\d\d?)*x",
+        r"^(\d|\d\d)*$",
+        r"^(.*a){12}$",
+        r"^(\w|ab)*$",
+    ])
+    def test_flags_catastrophic_shapes(self, pattern):
+        assert analyze_pattern(pattern)
+
+    @pytest.mark.parametrize("pattern", [
+        r"^[A-Z]",
+        r"^\d{4}-\d{2}-\d{2}$",
+        r"^[^\s@]+@[^\s@]+\.[^\s@]+$",
+        r"^([a-z0-9-]+\.)+[a-z]{2,}$",
+        r"(\d{1,3}\.){3}\d{1,3}",
+        r"^(a|ab)*$",
+        r"^(x|\d+y)*$",
+        r"(?:a++)*b",
+        r"(?>a+)+",
+    ])
+    def test_accepts_safe_patterns(self, pattern):
+        assert analyze_pattern(pattern) == ()
+
+    def test_invalid_pattern_raises(self):
+        with pytest.raises(re.error):
+            analyze_pattern("(unclosed")
+
+
+# ─── pattern_search ───────────────────────────────────────────────────────────
+
+class TestPatternSearch:
+    def test_safe_pattern_uses_compiled_search(self):
+        assert pattern_search(r"^\d+$") == re.compile(r"^\d+$").search
+
+    def test_hazardous_pattern_matches_in_sandbox(self):
+        search = pattern_search(r"^(a+)+$", timeout=2.0)
+        assert search("aaaa") is True
+        assert search("aaab") is False
+
+    def test_hazardous_pattern_times_out_as_non_match(self):
+        search = pattern_search(r"^(a+)+$", timeout=0.05)
+        start = time.perf_counter()
+        assert search("a" * 40 + "!") is False
+        assert time.perf_counter() - start < 2
+        assert search("aa") is True  # the helper is restarted after a kill
+
+    def test_validation_fails_closed_on_timeout(self):
+        f = FieldDefinition(name="code", type="string", validation=FieldValidation(pattern=r"^(a+)+$"))
+        errors = validate_field("a" * 40 + "!", f)
+        assert [e.message for e in errors] == ["Must match pattern: ^(a+)+$"]
+
+
+# ─── TypeRegistry integration ─────────────────────────────────────────────────
+
+class TestRegistryPatternPolicy:
+    def test_warns_by_default(self):
+        registry = TypeRegistry(load_builtins=False)
+        with pytest.warns(UnsafePatternWarning, match="catastrophic backtracking"):
+            registry.register(pattern_type(r"(a+)+$"))
+        assert registry.get_by_slug("patterned") is not None
+
+    def test_error_policy_rejects(self):
+        registry = TypeRegistry(load_builtins=False, unsafe_patterns="error")
+        with pytest.raises(ValueError, match='field "code"'):
+            registry.register(pattern_type(r"(a+)+$"))
+        assert registry.get_by_slug("patterned") is None
+
+    def test_allow_policy_is_silent(self):
+        registry = TypeRegistry(load_builtins=False, unsafe_patterns="allow")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            registry.register(pattern_type(r"(a+)+$"))
+
+    def test_safe_pattern_registers_silently(self):
+        registry = TypeRegistry(load_builtins=False, unsafe_patterns="error")
+        registry.register(pattern_type(r"^[A-Z]{3}-\d+$"))
+
+    def test_invalid_pattern_rejected(self):
+        registry = TypeRegistry(load_builtins=False)
+        with pytest.raises(ValueError, match="Invalid pattern"):
+            registry.register(pattern_type("(unclosed"))
+
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            TypeRegistry(unsafe_patterns="sometimes")
@@ -0,0 +1,256 @@
+"""
+Tests for relation storage adapters and the persistent / lazy RelationGraph.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from minions import (
+    JsonFileRelationStorageAdapter,
+    MemoryRelationStorageAdapter,
+    Minions,
+    Relation,
+    RelationGraph,
+    RelationStorageAdapter,
+    SqliteRelationStorageAdapter,
+)
+
+
+def make_relation(id: str, source: str, target: str, type: str = "parent_of", **kw) -> Relation:
+    return Relation(id=id, source_id=source, target_id=target, type=type, created_at="t", **kw)
+
+
+# ─── Shared adapter tests ─────────────────────────────────────────────────────
+
+class SharedRelationAdapterTests:
+    """Mixin providing the shared contract tests for all relation adapters."""
+
+    adapter: RelationStorageAdapter
+
+    def test_returns_none_for_unknown_id(self):
+        assert self.adapter.get("missing") is None
+
+    def test_put_and_get(self):
+        rel = make_relation("r1", "a", "b", metadata={"w": 1}, created_by="u")
+        self.adapter.put(rel)
+        assert self.adapter.get("r1") == rel
+
+    def test_overwrite_moves_adjacency(self):
+        self.adapter.put(make_relation("r1", "a", "b"))
+        self.adapter.put(make_relation("r1", "a", "c"))
+        assert [r.target_id for r in self.adapter.outgoing("a")] == ["c"]
+        assert self.adapter.incoming("b") == []
+        assert len(self.adapter.list()) == 1
+
+    def test_outgoing_and_incoming(self):
+        self.adapter.put(make_relation("r1", "a", "b"))
+        self.adapter.put(make_relation("r2", "a", "c", "depends_on"))
+        self.adapter.put(make_relation("r3", "c", "a"))
+        assert [r.id for r in self.adapter.outgoing("a")] == ["r1", "r2"]
+        assert [r.id for r in self.adapter.incoming("a")] == ["r3"]
+        assert self.adapter.outgoing("zzz") == []
+
+    def test_delete(self):
+        self.adapter.put(make_relation("r1", "a", "b"))
+        self.adapter.delete("r1")
+        self.adapter.delete("r1")  # should not raise
+        assert self.adapter.get("r1") is None
+        assert self.adapter.outgoing("a") == []
+        assert self.adapter.list() == []
+
+
+    def test_put_many_and_delete_many(self):
+        self.adapter.put_many([make_relation(f"r{i}", "a", f"t{i}") for i in range(4)])
+        assert [r.id for r in self.adapter.outgoing("a")] == ["r0", "r1", "r2", "r3"]
+        self.adapter.delete_many(["r1", "r3", "missing"])
+        assert [r.id for r in self.adapter.list()] == ["r0", "r2"]
+        self.adapter.put_many([])
+        self.adapter.delete_many([])
+
+
+class TestMemoryRelationStorageAdapter(SharedRelationAdapterTests):
+    def setup_method(self):
+        self.adapter = MemoryRelationStorageAdapter()
+
+
+class TestJsonFileRelationStorageAdapter(SharedRelationAdapterTests):
+    @pytest.fixture(autouse=True)
+    def _adapter(self, tmp_path):
+        self.path = tmp_path / "rel" / "relations.jsonl"
+        self.adapter = JsonFileRelationStorageAdapter(self.path)
+        yield
+        self.adapter.close()
+
+    def test_replays_log_on_open(self):
+        self.adapter.put(make_relation("r1", "a", "b"))
+        self.adapter.put(make_relation("r2", "a", "c"))
+        self.adapter.delete("r1")
+        self.adapter.close()
+
+        reopened = JsonFileRelationStorageAdapter(self.path)
+        assert [r.id for r in reopened.list()] == ["r2"]
+        assert reopened.dead_records == 2
+        reopened.close()
+
+    def test_skips_truncated_line(self):
+        self.adapter.put(make_relation("r1", "a", "b"))
+        self.adapter.close()
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write('{"op": "put", "relation": {"id": "r2"')
+
+        reopened = JsonFileRelationStorageAdapter(self.path)
+        assert [r.id for r in reopened.list()] == ["r1"]
+        reopened.close()
+
+    def test_compact_drops_dead_records(self):
+        for i in range(5):
+            self.adapter.put(make_relation("r1", "a", f"t{i}"))
+        assert self.adapter.dead_records == 4
+
+        self.adapter.compact()
+        assert self.adapter.dead_records == 0
+        assert len(self.path.read_text(encoding="utf-8").splitlines()) == 1
+
+        self.adapter.put(make_relation("r2", "a", "b"))
+        self.adapter.close()
+        reopened = JsonFileRelationStorageAdapter(self.path)
+        assert {r.id for r in reopened.list()} == {"r1", "r2"}
+        reopened.close()
+
+
+class TestSqliteRelationStorageAdapter(SharedRelationAdapterTests):
+    @pytest.fixture(autouse=True)
+    def _adapter(self, tmp_path):
+        self.path = tmp_path / "relations.db"
+        self.adapter = SqliteRelationStorageAdapter(self.path)
+        yield
+        self.adapter.close()
+
+    def test_persists_across_connections(self):
+        self.adapter.put(make_relation("r1", "a", "b", metadata={"nested": [1, 2]}))
+        self.adapter.close()
+
+        reopened = SqliteRelationStorageAdapter(self.path)
+        assert reopened.get("r1").metadata == {"nested": [1, 2]}
+        reopened.close()
+
+
+# ─── RelationGraph with storage ───────────────────────────────────────────────
+
+class CountingAdapter(MemoryRelationStorageAdapter):
+    """Memory adapter that records which adjacency lookups were made."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups: list[str] = []
+
+    def outgoing(self, minion_id: str) -> list[Relation]:
+        self.lookups.append(minion_id)
+        return super().outgoing(minion_id)
+
+
+class TestPersistentRelationGraph:
+    def test_writes_through_and_reloads(self, tmp_path):
+        storage = SqliteRelationStorageAdapter(tmp_path / "g.db")
+        graph = RelationGraph(storage)
+        rel = graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        graph.add({"source_id": "b", "target_id": "c", "type": "parent_of"})
+        graph.remove(rel.id)
+
+        reloaded = RelationGraph(storage)
+        assert [r.source_id for r in reloaded.list()] == ["b"]
+        assert reloaded.get_children("b") == ["c"]
+        storage.close()
+
+    def test_bulk_operations_write_through(self, tmp_path):
+        storage = SqliteRelationStorageAdapter(tmp_path / "bulk.db")
+        graph = RelationGraph(storage)
+        rels = graph.add_many(
+            {"source_id": "a", "target_id": f"t{i}", "type": "references"} for i in range(10)
+        )
+        graph.remove_many(r.id for r in rels[:4])
+
+        reloaded = RelationGraph(storage, lazy=True)
+        assert reloaded.neighbors_many(["a"]) == {"a": [f"t{i}" for i in range(4, 10)]}
+        assert reloaded.remove_many([rels[5].id]) == 1
+        assert len(storage.list()) == 5
+        storage.close()
+
+    def test_replace_within_batch_reloads_consistently(self, tmp_path):
+        storage = SqliteRelationStorageAdapter(tmp_path / "replace.db")
+        graph = RelationGraph(storage)
+        first, second = graph.add_many(
+            [{"source_id": "a", "target_id": "b", "type": "parent_of", "metadata": {"n": i}} for i in range(2)],
+            if_exists="replace",
+        )
+        assert [r.id for r in graph.list()] == [second.id]
+        assert [r.id for r in storage.list()] == [second.id]
+        assert [r.metadata for r in RelationGraph(storage).list()] == [{"n": 1}]
+        storage.close()
+
+    def test_lazy_graph_loads_only_touched_neighbourhoods(self):
+        storage = CountingAdapter()
+        eager = RelationGraph(storage)
+        for i in range(10):
+            eager.add({"source_id": f"n{i}", "target_id": f"n{i + 1}", "type": "depends_on"})
+
+        lazy = RelationGraph(storage, lazy=True)
+        assert storage.lookups == []
+        assert [r.target_id for r in lazy.get_from_source("n3")] == ["n4"]
+        assert [r.source_id for r in lazy.get_to_target("n3")] == ["n2"]
+        assert lazy.get_from_source("n3")[0] is lazy.get_from_source("n3")[0]
+        assert storage.lookups == ["n3"]
+        assert len(lazy._relations) == 2
+
+    def test_lazy_graph_keeps_edges_unique(self):
+        storage = MemoryRelationStorageAdapter()
+        RelationGraph(storage).add({"source_id": "a", "target_id": "b", "type": "blocks"})
+
+        lazy = RelationGraph(storage, lazy=True)
+        lazy.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        assert len(storage.list()) == 1
+        assert lazy.has_edge("a", "b", "blocks")
+
+    def test_lazy_remove_of_uncached_relation(self):
+        storage = MemoryRelationStorageAdapter()
+        rel = RelationGraph(storage).add({"source_id": "a", "target_id": "b", "type": "blocks"})
+
+        lazy = RelationGraph(storage, lazy=True)
+        assert lazy.get(rel.id) == rel
+        assert lazy.remove(rel.id) is True
+        assert lazy.remove(rel.id) is False
+        assert storage.list() == []
+        assert lazy.get_from_source("a") == []
+
+    def test_lazy_remove_by_minion_id(self):
+        storage = MemoryRelationStorageAdapter()
+        eager = RelationGraph(storage)
+        eager.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        eager.add({"source_id": "c", "target_id": "a", "type": "parent_of"})
+        eager.add({"source_id": "b", "target_id": "c", "type": "parent_of"})
+
+        lazy = RelationGraph(storage, lazy=True)
+        assert lazy.remove_by_minion_id("a") == 2
+        assert [(r.source_id, r.target_id) for r in storage.list()] == [("b", "c")]
+
+    def test_clear_cache_refetches(self):
+        storage = CountingAdapter()
+        lazy = RelationGraph(storage, lazy=True)
+        lazy.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        lazy.clear_cache()
+        assert lazy._relations == {}
+        assert lazy.get_children("a") == ["b"]
+        assert storage.lookups == ["a", "a"]
+
+    def test_client_with_relation_storage(self, tmp_path):
+        path = tmp_path / "relations.jsonl"
+        storage = JsonFileRelationStorageAdapter(path)
+        Minions(relation_storage=storage).graph.add(
+            {"source_id": "x", "target_id": "y", "type": "references"}
+        )
+        storage.close()
+
+        reopened = JsonFileRelationStorageAdapter(path)
+        assert Minions(relation_storage=reopened).graph.has_edge("x", "y", "references")
+        reopened.close()
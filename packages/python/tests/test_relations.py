@@ -3,7 +3,11 @@ Tests for the Minions Python RelationGraph.
 Mirrors: packages/core/src/__tests__/relations.test.ts
 """
 
-from minions import RelationGraph
+import random
+
+import pytest
+
+from minions import CycleError, Relation, RelationGraph, SCHEDULING_TYPES
 
 
 class TestRelationGraph:
@@ -90,3 +94,484 @@ class TestRelationGraph:
         assert "b" in tree
         assert "c" in tree
         assert "a" in tree
+
+    def test_queries_reflect_removals(self):
+        graph = RelationGraph()
+        keep = graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        drop = graph.add({"source_id": "a", "target_id": "c", "type": "parent_of"})
+        graph.remove(drop.id)
+
+        assert graph.get_children("a") == ["b"]
+        assert graph.get_parents("c") == []
+        assert graph.get_from_source("a") == [keep]
+        assert graph.get_to_target("c", "parent_of") == []
+
+    def test_preserves_insertion_order_per_minion(self):
+        graph = RelationGraph()
+        r1 = graph.add({"source_id": "a", "target_id": "b", "type": "depends_on"})
+        graph.add({"source_id": "x", "target_id": "y", "type": "depends_on"})
+        r2 = graph.add({"source_id": "a", "target_id": "c", "type": "relates_to"})
+        r3 = graph.add({"source_id": "a", "target_id": "d", "type": "depends_on"})
+
+        assert graph.get_from_source("a") == [r1, r2, r3]
+        assert graph.get_from_source("a", "depends_on") == [r1, r3]
+
+    def test_remove_by_minion_id_counts_self_loops_once(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "a", "target_id": "a", "type": "relates_to"})
+        graph.add({"source_id": "a", "target_id": "b", "type": "relates_to"})
+
+        assert graph.remove_by_minion_id("a") == 2
+        assert graph.list() == []
+        assert graph.get_network("b") == []
+
+
+class TestEdgeUniqueness:
+    def test_add_returns_existing_edge_by_default(self):
+        graph = RelationGraph()
+        first = graph.add({"source_id": "a", "target_id": "b", "type": "depends_on"})
+        again = graph.add({"source_id": "a", "target_id": "b", "type": "depends_on"})
+
+        assert again is first
+        assert len(graph.list()) == 1
+        # Different type or direction is a different edge.
+        graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "depends_on"})
+        assert len(graph.list()) == 3
+
+    def test_has_edge_and_get_edge(self):
+        graph = RelationGraph()
+        rel = graph.add({"source_id": "a", "target_id": "b", "type": "references"})
+
+        assert graph.has_edge("a", "b", "references") is True
+        assert graph.has_edge("b", "a", "references") is False
+        assert graph.get_edge("a", "b", "references") is rel
+
+        graph.remove(rel.id)
+        assert graph.has_edge("a", "b", "references") is False
+        assert graph.get_edge("a", "b", "references") is None
+
+    def test_if_exists_replace(self):
+        graph = RelationGraph()
+        old = graph.add({"source_id": "a", "target_id": "b", "type": "relates_to", "metadata": {"w": 1}})
+        new = graph.add(
+            {"source_id": "a", "target_id": "b", "type": "relates_to", "metadata": {"w": 2}},
+            if_exists="replace",
+        )
+
+        assert new.id != old.id
+        assert graph.get(old.id) is None
+        assert graph.get_edge("a", "b", "relates_to").metadata == {"w": 2}
+        assert len(graph.get_from_source("a")) == 1
+
+    def test_if_exists_error(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        with pytest.raises(ValueError, match="already exists"):
+            graph.add({"source_id": "a", "target_id": "b", "type": "blocks"}, if_exists="error")
+
+    def test_dedupe_keeps_earliest_edge(self):
+        graph = RelationGraph()
+        first = graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"}, if_exists="allow")
+        graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"}, if_exists="allow")
+        graph.add({"source_id": "a", "target_id": "c", "type": "parent_of"})
+        assert graph.get_children("a") == ["b", "b", "b", "c"]
+
+        assert graph.dedupe() == 2
+        assert graph.get_children("a") == ["b", "c"]
+        assert graph.get_edge("a", "b", "parent_of") is first
+        assert graph.dedupe() == 0
+
+    def test_insert_keeps_relation_identity(self):
+        graph = RelationGraph()
+        rel = Relation(id="r1", source_id="a", target_id="b", type="triggers", created_at="2024-01-01T00:00:00Z")
+        assert graph.insert(rel) is rel
+        assert graph.get("r1") is rel
+        assert graph.has_edge("a", "b", "triggers")
+
+
+class TestTraverse:
+    def _chain_graph(self) -> RelationGraph:
+        #   a -> b -> d
+        #   a -> c -> d -> e      (all depends_on)
+        #   a -parent_of-> p
+        graph = RelationGraph()
+        for s, t in [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"), ("d", "e")]:
+            graph.add({"source_id": s, "target_id": t, "type": "depends_on"})
+        graph.add({"source_id": "a", "target_id": "p", "type": "parent_of"})
+        return graph
+
+    def test_bfs_yields_nodes_with_depth_and_relation(self):
+        graph = self._chain_graph()
+        steps = list(graph.traverse("a", types=["depends_on"]))
+        assert [(s.node, s.depth) for s in steps] == [("b", 1), ("c", 1), ("d", 2), ("e", 3)]
+        assert steps[2].via.source_id == "b" and steps[2].via.target_id == "d"
+
+    def test_dfs_order(self):
+        graph = self._chain_graph()
+        steps = list(graph.traverse("a", types=["depends_on"], order="dfs"))
+        assert [(s.node, s.depth) for s in steps] == [("b", 1), ("d", 2), ("e", 3), ("c", 1)]
+
+    def test_all_types_by_default(self):
+        graph = self._chain_graph()
+        assert {s.node for s in graph.traverse("a")} == {"b", "c", "d", "e", "p"}
+
+    def test_max_depth_and_max_nodes(self):
+        graph = self._chain_graph()
+        assert [s.node for s in graph.traverse("a", ["depends_on"], max_depth=1)] == ["b", "c"]
+        assert [s.node for s in graph.traverse("a", ["depends_on"], max_depth=2, order="dfs")] == ["b", "d", "c"]
+        assert [s.node for s in graph.traverse("a", max_nodes=2)] == ["b", "c"]
+        assert list(graph.traverse("a", max_nodes=0)) == []
+
+    def test_bfs_and_dfs_reach_the_same_nodes_within_max_depth(self):
+        shortcut = RelationGraph()
+        for s, t in [("a", "b"), ("b", "c"), ("a", "c"), ("c", "d"), ("d", "e")]:
+            shortcut.add({"source_id": s, "target_id": t, "type": "depends_on"})
+        assert [(s.node, s.depth) for s in shortcut.traverse("a", max_depth=2, order="dfs")] == [
+            ("b", 1), ("c", 2), ("d", 2),
+        ]
+        for graph in (self._chain_graph(), shortcut):
+            for max_depth in (-1, 0, 1, 2, 3, 4, None):
+                bfs = [s.node for s in graph.traverse("a", max_depth=max_depth)]
+                dfs = [s.node for s in graph.traverse("a", max_depth=max_depth, order="dfs")]
+                assert sorted(bfs) == sorted(dfs)
+
+    def test_bounded_dfs_matches_bfs_on_random_graphs(self):
+        rng = random.Random(34)
+        for _ in range(200):
+            graph = RelationGraph()
+            for _ in range(rng.randint(0, 14)):
+                s, t = rng.sample("abcdefg", 2)
+                graph.add({"source_id": s, "target_id": t, "type": "relates_to"})
+            for max_depth in (1, 2, 3):
+                for direction in ("out", "both"):
+                    bfs = {s.node for s in graph.traverse("a", direction=direction, max_depth=max_depth)}
+                    dfs = [s.node for s in graph.traverse("a", direction=direction, max_depth=max_depth, order="dfs")]
+                    assert len(dfs) == len(set(dfs)) and set(dfs) == bfs
+
+        assert list(graph.traverse("a", max_depth=0, order="dfs")) == []
+
+    def test_incoming_and_both_directions(self):
+        graph = self._chain_graph()
+        assert [(s.node, s.depth) for s in graph.traverse("e", direction="in")] == [
+            ("d", 1), ("b", 2), ("c", 2), ("a", 3),
+        ]
+        assert {s.node for s in graph.traverse("b", ["depends_on"], direction="both", max_depth=1)} == {"a", "d"}
+
+    def test_is_lazy(self):
+        graph = RelationGraph()
+        for i in range(1000):
+            graph.add({"source_id": "hub", "target_id": f"n{i}", "type": "references"})
+            graph.add({"source_id": f"n{i}", "target_id": f"m{i}", "type": "references"})
+        steps = graph.traverse("hub")
+        first = next(steps)
+        assert first.node == "n0"
+        # Mutating the graph between steps does not break the walk.
+        graph.add({"source_id": "n0", "target_id": "late", "type": "references"})
+        assert sum(1 for _ in steps) == 1000 + 999 + 1
+
+    def test_handles_cycles(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "a", "target_id": "b", "type": "relates_to"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "relates_to"})
+        assert [s.node for s in graph.traverse("a", order="dfs")] == ["b"]
+
+    def test_rejects_unknown_direction(self):
+        with pytest.raises(ValueError, match="direction"):
+            next(RelationGraph().traverse("a", direction="sideways"))
+
+
+class TestDependencyOrder:
+    def _dag(self) -> RelationGraph:
+        return RelationGraph(acyclic_types=SCHEDULING_TYPES)
+
+    def test_rejects_cycle_and_leaves_graph_unchanged(self):
+        graph = self._dag()
+        graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        graph.add({"source_id": "b", "target_id": "c", "type": "blocks"})
+        with pytest.raises(CycleError) as exc:
+            graph.add({"source_id": "c", "target_id": "a", "type": "blocks"})
+        assert exc.value.cycle == ["c", "a", "b", "c"]
+        assert len(graph.list()) == 2
+        assert graph.topological_order() == ["a", "b", "c"]
+
+    def test_rejects_self_dependency(self):
+        with pytest.raises(CycleError):
+            self._dag().add({"source_id": "a", "target_id": "a", "type": "depends_on"})
+
+    def test_precedence_follows_relation_meaning(self):
+        graph = self._dag()
+        # "a depends_on b" and "b blocks a" agree: b comes first.
+        graph.add({"source_id": "a", "target_id": "b", "type": "depends_on"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "blocks"})
+        assert graph.topological_order() == ["b", "a"]
+        # "a blocks b" contradicts them.
+        with pytest.raises(CycleError):
+            graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+
+    def test_other_types_may_cycle(self):
+        graph = self._dag()
+        graph.add({"source_id": "a", "target_id": "b", "type": "relates_to"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "relates_to"})
+        assert len(graph.list()) == 2
+
+    def test_cycles_allowed_without_acyclic_types(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "blocks"})
+        with pytest.raises(CycleError):
+            graph.topological_order()
+
+    def test_removal_reopens_edge(self):
+        graph = self._dag()
+        rel = graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        graph.remove(rel.id)
+        graph.add({"source_id": "b", "target_id": "a", "type": "blocks"})
+        assert graph.topological_order() == ["b", "a"]
+
+    def test_online_order_matches_full_cycle_check(self):
+        rng = random.Random(7)
+        graph = self._dag()
+        reference = RelationGraph()
+        nodes = [f"n{i}" for i in range(40)]
+        for _ in range(400):
+            a, b = rng.sample(nodes, 2)
+            type = rng.choice(SCHEDULING_TYPES)
+            edge = {"source_id": a, "target_id": b, "type": type}
+            reference.add(edge, if_exists="allow")
+            try:
+                reference.topological_order()
+                creates_cycle = False
+            except CycleError:
+                creates_cycle = True
+                reference.remove(reference.list()[-1].id)
+            if creates_cycle:
+                with pytest.raises(CycleError):
+                    graph.add(edge)
+            else:
+                graph.add(edge)
+            rank = graph._rank
+            for r in graph.list():
+                first, then = (r.target_id, r.source_id) if r.type == "depends_on" else (r.source_id, r.target_id)
+                assert rank[first] < rank[then]
+
+    def test_order_built_from_stored_relations(self):
+        from minions import MemoryRelationStorageAdapter
+        storage = MemoryRelationStorageAdapter()
+        RelationGraph(storage).add({"source_id": "a", "target_id": "b", "type": "blocks"})
+
+        graph = RelationGraph(storage, lazy=True, acyclic_types=["blocks"])
+        with pytest.raises(CycleError):
+            graph.add({"source_id": "b", "target_id": "a", "type": "blocks"})
+
+    def test_topological_order_types(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "x", "target_id": "y", "type": "parent_of"})
+        graph.add({"source_id": "y", "target_id": "z", "type": "blocks"})
+        assert graph.topological_order() == ["y", "z"]
+        assert graph.topological_order(["parent_of", "blocks"]) == ["x", "y", "z"]
+
+    def test_critical_path(self):
+        graph = self._dag()
+        #   design -> build -> ship
+        #   design -> docs  -> ship
+        for first, then in [("design", "build"), ("build", "ship"), ("design", "docs"), ("docs", "ship")]:
+            graph.add({"source_id": then, "target_id": first, "type": "depends_on"})
+        durations = {"design": 2, "build": 5, "docs": 1, "ship": 1}
+
+        path = graph.critical_path(weight=durations.__getitem__)
+        assert path.nodes == ["design", "build", "ship"]
+        assert path.length == 8
+        assert graph.critical_path().length == 3
+        assert RelationGraph().critical_path() == ([], 0)
+
+
+class TestShortestPath:
+    def _graph(self) -> RelationGraph:
+        #   a -> b -> c -> d -> e
+        #   a -> x -> e            (references)
+        graph = RelationGraph()
+        for s, t in [("a", "b"), ("b", "c"), ("c", "d"), ("d", "e")]:
+            graph.add({"source_id": s, "target_id": t, "type": "depends_on"})
+        graph.add({"source_id": "a", "target_id": "x", "type": "references"})
+        graph.add({"source_id": "x", "target_id": "e", "type": "references"})
+        return graph
+
+    def test_finds_shortest_path(self):
+        graph = self._graph()
+        assert graph.shortest_path("a", "e") == ["a", "x", "e"]
+        assert graph.shortest_path("a", "e", types=["depends_on"]) == ["a", "b", "c", "d", "e"]
+        assert graph.shortest_path("a", "a") == ["a"]
+
+    def test_respects_direction(self):
+        graph = self._graph()
+        assert graph.shortest_path("e", "a") is None
+        assert graph.shortest_path("e", "a", direction="in") == ["e", "x", "a"]
+        assert graph.shortest_path("d", "x", direction="both") == ["d", "e", "x"]
+
+    def test_max_depth(self):
+        graph = self._graph()
+        assert graph.shortest_path("a", "e", types=["depends_on"], max_depth=3) is None
+        assert graph.shortest_path("a", "e", types=["depends_on"], max_depth=4) is not None
+        assert graph.shortest_path("a", "b", max_depth=0) is None
+
+    def test_reachable(self):
+        graph = self._graph()
+        assert graph.reachable("a", "d") is True
+        assert graph.reachable("d", "a") is False
+        assert graph.reachable("a", "unknown") is False
+        assert graph.reachable("b", "e", types=["references"]) is False
+
+    def test_matches_one_sided_bfs(self):
+        rng = random.Random(11)
+        graph = RelationGraph()
+        nodes = [f"n{i}" for i in range(60)]
+        for _ in range(120):
+            graph.add({"source_id": rng.choice(nodes), "target_id": rng.choice(nodes), "type": "relates_to"})
+        for _ in range(200):
+            a, b = rng.sample(nodes, 2)
+            expected = next((s.depth for s in graph.traverse(a) if s.node == b), None)
+            path = graph.shortest_path(a, b)
+            if expected is None:
+                assert path is None
+                continue
+            assert len(path) - 1 == expected
+            assert path[0] == a and path[-1] == b
+            for s, t in zip(path, path[1:]):
+                assert graph.has_edge(s, t, "relates_to")
+
+
+class TestIsDescendant:
+    def _forest(self) -> RelationGraph:
+        #   root -> folder -> doc
+        #        -> other
+        #   lone -> leaf
+        graph = RelationGraph()
+        for s, t in [("root", "folder"), ("folder", "doc"), ("root", "other"), ("lone", "leaf")]:
+            graph.add({"source_id": s, "target_id": t, "type": "parent_of"})
+        return graph
+
+    def test_forest_uses_interval_labels(self):
+        graph = self._forest()
+        assert graph.is_descendant("doc", "root") is True
+        assert graph.is_descendant("doc", "folder") is True
+        assert graph.is_descendant("folder", "doc") is False
+        assert graph.is_descendant("doc", "other") is False
+        assert graph.is_descendant("leaf", "root") is False
+        assert graph.is_descendant("root", "root") is False
+        assert graph.is_descendant("unknown", "root") is False
+        assert graph._labels
+
+    def test_relabels_after_structural_change(self):
+        graph = self._forest()
+        assert graph.is_descendant("leaf", "root") is False
+        rel = graph.add({"source_id": "other", "target_id": "lone", "type": "parent_of"})
+        assert graph.is_descendant("leaf", "root") is True
+        graph.remove(rel.id)
+        assert graph.is_descendant("leaf", "root") is False
+
+    def test_other_relation_types_keep_labels(self):
+        graph = self._forest()
+        graph.is_descendant("doc", "root")
+        labels = graph._labels
+        graph.add({"source_id": "doc", "target_id": "leaf", "type": "references"})
+        assert graph._labels is labels
+
+    def test_dag_falls_back_to_cached_closure(self):
+        graph = self._forest()
+        graph.add({"source_id": "lone", "target_id": "doc", "type": "parent_of"})
+        assert graph.is_descendant("doc", "root") is True
+        assert graph.is_descendant("doc", "lone") is True
+        assert graph.is_descendant("leaf", "root") is False
+        assert graph._labels == {}
+        assert set(graph._closure) == {"root", "lone"}
+
+    def test_cycle_falls_back_to_closure(self):
+        graph = RelationGraph()
+        graph.add({"source_id": "a", "target_id": "b", "type": "parent_of"})
+        graph.add({"source_id": "b", "target_id": "a", "type": "parent_of"})
+        graph.add({"source_id": "b", "target_id": "c", "type": "parent_of"})
+        assert graph.is_descendant("c", "a") is True
+        assert graph.is_descendant("x", "a") is False
+
+    def test_matches_get_tree(self):
+        rng = random.Random(3)
+        nodes = [f"n{i}" for i in range(80)]
+        for allow_dag in (False, True):
+            graph = RelationGraph()
+            for i in range(1, len(nodes)):
+                graph.add({"source_id": nodes[rng.randrange(i)], "target_id": nodes[i], "type": "parent_of"})
+                if allow_dag and rng.random() < 0.1:
+                    graph.add({"source_id": nodes[rng.randrange(i)], "target_id": nodes[i], "type": "parent_of"})
+            for y in nodes:
+                below = set(graph.get_tree(y))
+                for x in nodes:
+                    assert graph.is_descendant(x, y) == (x in below)
+
+
+class TestBulkRelations:
+    def test_add_many_shares_timestamp_and_generates_uuids(self):
+        import uuid
+        graph = RelationGraph()
+        rels = graph.add_many(
+            {"source_id": "a", "target_id": f"t{i}", "type": "parent_of"} for i in range(50)
+        )
+        assert len(rels) == 50
+        assert len({r.created_at for r in rels}) == 1
+        assert len({r.id for r in rels}) == 50
+        for r in rels:
+            parsed = uuid.UUID(r.id)
+            assert parsed.version == 4 and str(parsed) == r.id
+        assert graph.get_children("a") == [f"t{i}" for i in range(50)]
+
+    def test_add_many_applies_if_exists_within_batch(self):
+        graph = RelationGraph()
+        first = graph.add({"source_id": "a", "target_id": "b", "type": "blocks"})
+        rels = graph.add_many([
+            {"sourceId": "a", "targetId": "b", "type": "blocks"},
+            {"sourceId": "b", "targetId": "c", "type": "blocks"},
+            {"sourceId": "b", "targetId": "c", "type": "blocks"},
+        ])
+        assert rels[0] is first
+        assert rels[1] is rels[2]
+        assert len(graph.list()) == 2
+
+    def test_insert_many_keeps_prefix_on_error(self):
+        graph = RelationGraph(acyclic_types=["blocks"])
+        with pytest.raises(CycleError):
+            graph.add_many([
+                {"source_id": "a", "target_id": "b", "type": "blocks"},
+                {"source_id": "b", "target_id": "a", "type": "blocks"},
+            ])
+        assert graph.has_edge("a", "b", "blocks")
+        assert len(graph.list()) == 1
+
+    def test_remove_many(self):
+        graph = RelationGraph()
+        rels = graph.add_many({"source_id": "a", "target_id": f"t{i}", "type": "references"} for i in range(5))
+        assert graph.remove_many([rels[0].id, rels[3].id, rels[0].id, "missing"]) == 2
+        assert [r.target_id for r in graph.get_from_source("a")] == ["t1", "t2", "t4"]
+
+    def test_remove_by_minion_ids(self):
+        graph = RelationGraph()
+        graph.add_many([
+            {"source_id": "a", "target_id": "b", "type": "parent_of"},
+            {"source_id": "b", "target_id": "c", "type": "parent_of"},
+            {"source_id": "c", "target_id": "d", "type": "references"},
+            {"source_id": "x", "target_id": "y", "type": "references"},
+        ])
+        assert graph.remove_by_minion_ids(["b", "c"]) == 3
+        assert [(r.source_id, r.target_id) for r in graph.list()] == [("x", "y")]
+
+    def test_neighbors_many(self):
+        graph = RelationGraph()
+        graph.add_many([
+            {"source_id": "a", "target_id": "b", "type": "depends_on"},
+            {"source_id": "a", "target_id": "c", "type": "references"},
+            {"source_id": "c", "target_id": "a", "type": "depends_on"},
+        ])
+        assert graph.neighbors_many(["a", "c", "z"]) == {"a": ["b", "c"], "c": ["a"], "z": []}
+        assert graph.neighbors_many(["a"], types=["depends_on"]) == {"a": ["b"]}
+        assert graph.neighbors_many(["a"], types=["depends_on"], direction="both") == {"a": ["b", "c"]}
+        assert graph.neighbors_many(["a", "b"], direction="in") == {"a": ["c"], "b": ["a"]}
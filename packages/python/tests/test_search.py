@@ -0,0 +1,185 @@
+"""
+Tests for the Minions Python SearchIndex.
+"""
+
+import dataclasses
+
+from minions import SearchIndex
+from minions.lifecycle import create_minion
+from minions.schemas import note_type
+from minions.search import edit_distance, iter_json_strings, tokenize
+
+
+def make_note(title: str, content: str):
+    minion, _ = create_minion({"title": title, "fields": {"content": content}}, note_type)
+    return minion
+
+
+class TestTokenize:
+    def test_lowercases_and_splits_on_whitespace(self):
+        assert tokenize("Hello  World\tAgain") == ("hello", "world", "again")
+
+
+class TestIterJsonStrings:
+    payload = {
+        "messages": [
+            {"role": "user", "content": "Find flights"},
+            {"role": "assistant", "content": "Searching", "meta": {"tool": "web"}},
+        ],
+        "options": {"limit": 5, "region": "EU"},
+    }
+
+    def test_whole_value_yields_every_string_leaf_in_order(self):
+        assert list(iter_json_strings(self.payload)) == [
+            "user", "Find flights", "assistant", "Searching", "web", "EU",
+        ]
+
+    def test_selected_paths_only(self):
+        paths = ["messages.*.content", "options.region"]
+        assert list(iter_json_strings(self.payload, paths)) == ["Find flights", "Searching", "EU"]
+
+    def test_list_indices_and_subtrees(self):
+        assert list(iter_json_strings(self.payload, ["messages.1"])) == ["assistant", "Searching", "web"]
+        assert list(iter_json_strings(self.payload, ["$.options"])) == ["EU"]
+
+    def test_root_string(self):
+        assert list(iter_json_strings("plain text")) == ["plain text"]
+
+    def test_stops_at_character_cap(self):
+        value = ["abcdef"] + ["never visited"] * 1000
+        assert list(iter_json_strings(value, max_chars=4)) == ["abcd"]
+
+
+class TestEditDistance:
+    def test_basic_operations(self):
+        assert edit_distance("kitten", "kitten", 2) == 0
+        assert edit_distance("kitten", "sitten", 2) == 1
+        assert edit_distance("kitten", "kiten", 2) == 1
+        assert edit_distance("kitten", "kitttten", 2) == 2
+
+    def test_adjacent_transposition_costs_one(self):
+        assert edit_distance("teh", "the", 2) == 1
+
+    def test_stops_past_limit(self):
+        assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+
+class TestSearchIndex:
+    def test_exact_search_keeps_substring_semantics(self):
+        index = SearchIndex()
+        a = make_note("Quantum Mechanics", "advanced physics")
+        b = make_note("Cooking", "pasta recipe")
+        index.add(a)
+        index.add(b)
+
+        assert index.search("mech phys") == [a.id]
+        assert index.search("quantum pasta") == []
+
+    def test_empty_query_returns_all_in_insertion_order(self):
+        index = SearchIndex()
+        notes = [make_note(f"Note {i}", "x") for i in range(3)]
+        for n in notes:
+            index.add(n)
+        assert index.search("  ") == [n.id for n in notes]
+
+    def test_soft_deleted_minions_are_not_indexed(self):
+        index = SearchIndex()
+        m = make_note("Secret", "hidden")
+        index.add(m)
+        index.add(dataclasses.replace(m, deleted_at="2024-01-01T00:00:00Z"))
+        assert m.id not in index
+        assert index.search("secret") == []
+
+    def test_remove_drops_unused_vocabulary(self):
+        index = SearchIndex()
+        m = make_note("Unique", "zyzzyva")
+        index.add(m)
+        assert index.vocabulary_size > 0
+        index.remove(m.id)
+        assert index.vocabulary_size == 0
+        assert index.search("zyzzyva") == []
+
+    def test_fuzzy_terms_within_distance(self):
+        index = SearchIndex()
+        index.add(make_note("Algorithm design", "graphs"))
+
+        assert index.fuzzy_terms("algoritm") == {"algorithm"}
+        assert index.fuzzy_terms("aglorithm") == {"algorithm"}
+        assert index.fuzzy_terms("algxrxthm", max_distance=1) == set()
+
+    def test_fuzzy_terms_scale_with_token_length(self):
+        index = SearchIndex()
+        index.add(make_note("ox", "cat"))
+        # Two-character tokens get no typo budget by default.
+        assert index.fuzzy_terms("ax") == set()
+        assert index.fuzzy_terms("cut") == {"cat"}
+
+    def test_fuzzy_terms_beyond_prefix_length(self):
+        index = SearchIndex(prefix_length=4)
+        index.add(make_note("Internationalization", "i18n"))
+        assert index.fuzzy_terms("internatoinalization") == {"internationalization"}
+        assert index.fuzzy_terms("xnternationalization") == {"internationalization"}
+
+    def test_fuzzy_map_tracks_later_additions_and_removals(self):
+        index = SearchIndex()
+        a = make_note("Banana", "fruit")
+        index.add(a)
+        assert index.search("bananna", fuzzy=True) == [a.id]
+
+        b = make_note("Cherry", "fruit")
+        index.add(b)
+        assert index.search("chery", fuzzy=True) == [b.id]
+
+        index.remove(b.id)
+        assert index.search("chery", fuzzy=True) == []
+
+    def test_fuzzy_search_requires_every_token(self):
+        index = SearchIndex()
+        a = make_note("Research Paper", "quantum computing")
+        index.add(a)
+        assert index.search("quantm computing", fuzzy=True) == [a.id]
+        assert index.search("quantm cooking", fuzzy=True) == []
+
+
+class TestSimilar:
+    def setup_method(self):
+        self.index = SearchIndex()
+        self.notes = {
+            "ml": make_note("Neural networks", "deep learning on neural networks via gradient descent"),
+            "ml2": make_note("Training tips", "gradient descent tuning for deep networks"),
+            "cook": make_note("Pasta", "boil water add pasta with salt"),
+            "cook2": make_note("Sauce", "tomato sauce for pasta"),
+        }
+        for n in self.notes.values():
+            self.index.add(n)
+
+    def test_ranks_related_minions_first(self):
+        result = self.index.similar(self.notes["ml"].id, k=3)
+        ids = [mid for mid, _ in result]
+        assert ids[0] == self.notes["ml2"].id
+        assert self.notes["ml"].id not in ids
+        assert all(0 < score <= 1 for _, score in result)
+
+    def test_only_scores_minions_sharing_terms(self):
+        ids = [mid for mid, _ in self.index.similar(self.notes["cook"].id)]
+        assert ids == [self.notes["cook2"].id]
+
+    def test_unknown_id_returns_empty(self):
+        assert self.index.similar("missing") == []
+
+    def test_identical_documents_score_one(self):
+        twin = dataclasses.replace(self.notes["ml"], id="twin")
+        self.index.add(twin)
+        (mid, score), *_ = self.index.similar(self.notes["ml"].id, k=1)
+        assert mid == "twin"
+        assert abs(score - 1.0) < 1e-9
+
+    def test_numpy_path_matches_pure_python(self):
+        import pytest
+        pytest.importorskip("numpy")
+        source = self.notes["ml"].id
+        expected = self.index.similar(source, use_numpy=False)
+        actual = self.index.similar(source, use_numpy=True)
+        assert [mid for mid, _ in actual] == [mid for mid, _ in expected]
+        for (_, a), (_, b) in zip(actual, expected):
+            assert abs(a - b) < 1e-9
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import asyncio
 import json
+import math
 import os
+import random
 import tempfile
 from pathlib import Path
 from typing import Optional
@@ -19,6 +21,7 @@ from minions import (
     StorageFilter,
     Minions,
 )
+from minions.storage import json_codec
 from minions.storage.adapter import StorageAdapter
 from minions.lifecycle import create_minion
 from minions.schemas import note_type, agent_type
@@ -74,6 +77,16 @@ class SharedAdapterTests:
     def test_delete_nonexistent_does_not_raise(self):
         run(self.adapter.delete("does-not-exist"))  # Should not raise
 
+    def test_batch_get_set_delete(self):
+        a, b, c = make_note("A", "a"), make_note("B", "b"), make_note("C", "c")
+        run(self.adapter.set_many([a, b, c]))
+        found = run(self.adapter.get_many([c.id, "missing", a.id]))
+        assert [m.id for m in found] == [c.id, a.id]
+
+        run(self.adapter.delete_many([a.id, c.id, "missing"]))
+        assert [m.id for m in run(self.adapter.get_many([a.id, b.id, c.id]))] == [b.id]
+        assert [m.id for m in run(self.adapter.search("a"))] == []
+
     def test_list_excludes_deleted_by_default(self):
         import dataclasses
         from datetime import datetime, timezone
@@ -174,6 +187,51 @@ class SharedAdapterTests:
         results = run(self.adapter.search(""))
         assert len(results) >= 2
 
+    def test_search_matches_substring_of_word(self):
+        m = make_note("Photosynthesis", "chlorophyll")
+        run(self.adapter.set(m))
+        results = run(self.adapter.search("synth"))
+        assert m.id in [r.id for r in results]
+
+    def test_search_reflects_overwrite(self):
+        import dataclasses
+        m = make_note("Draft", "original wording")
+        run(self.adapter.set(m))
+        run(self.adapter.set(dataclasses.replace(m, searchable_text="draft revised wording")))
+        assert run(self.adapter.search("original")) == []
+        assert [r.id for r in run(self.adapter.search("revised"))] == [m.id]
+
+    def test_fuzzy_search_tolerates_typos(self):
+        m1 = make_note("Research Paper", "quantum computing concepts")
+        m2 = make_note("Shopping List", "milk eggs bread")
+        run(self.adapter.set(m1))
+        run(self.adapter.set(m2))
+        assert run(self.adapter.search("quantm compting")) == []
+        results = run(self.adapter.search("quantm compting", fuzzy=True))
+        assert [r.id for r in results] == [m1.id]
+
+    def test_similar_returns_related_minions(self):
+        m1 = make_note("Quantum Computing", "qubits plus entanglement")
+        m2 = make_note("Quantum Physics", "entanglement experiments")
+        m3 = make_note("Gardening", "tomatoes in compost")
+        for m in (m1, m2, m3):
+            run(self.adapter.set(m))
+        results = run(self.adapter.similar(m1.id, k=5))
+        assert [r.id for r in results] == [m2.id]
+
+    def test_autocomplete_titles_and_tags(self):
+        import dataclasses
+        m1 = dataclasses.replace(make_note("Planning", "q3"), tags=["plans"], updated_at="2024-01-01")
+        m2 = dataclasses.replace(make_note("Platform", "infra"), updated_at="2024-02-01")
+        run(self.adapter.set(m1))
+        run(self.adapter.set(m2))
+        results = run(self.adapter.autocomplete("pla"))
+        assert [(c.text, c.kind) for c in results] == [
+            ("Platform", "title"), ("Planning", "title"), ("plans", "tag"),
+        ]
+        run(self.adapter.delete(m2.id))
+        assert [c.text for c in run(self.adapter.autocomplete("plat"))] == []
+
     def test_sort_by_title_ascending(self):
         m1 = make_note("Zebra", "z")
         m2 = make_note("Apple", "a")
@@ -242,6 +300,9 @@ class TestJsonFileStorageAdapterSharedContract:
     def test_delete_nonexistent_does_not_raise(self):
         SharedAdapterTests.test_delete_nonexistent_does_not_raise(self)
 
+    def test_batch_get_set_delete(self):
+        SharedAdapterTests.test_batch_get_set_delete(self)
+
     def test_list_excludes_deleted_by_default(self):
         SharedAdapterTests.test_list_excludes_deleted_by_default(self)
 
@@ -272,6 +333,21 @@ class TestJsonFileStorageAdapterSharedContract:
     def test_search_empty_query_returns_all(self):
         SharedAdapterTests.test_search_empty_query_returns_all(self)
 
+    def test_search_matches_substring_of_word(self):
+        SharedAdapterTests.test_search_matches_substring_of_word(self)
+
+    def test_search_reflects_overwrite(self):
+        SharedAdapterTests.test_search_reflects_overwrite(self)
+
+    def test_fuzzy_search_tolerates_typos(self):
+        SharedAdapterTests.test_fuzzy_search_tolerates_typos(self)
+
+    def test_similar_returns_related_minions(self):
+        SharedAdapterTests.test_similar_returns_related_minions(self)
+
+    def test_autocomplete_titles_and_tags(self):
+        SharedAdapterTests.test_autocomplete_titles_and_tags(self)
+
     def test_sort_by_title_ascending(self):
         SharedAdapterTests.test_sort_by_title_ascending(self)
 
@@ -292,6 +368,12 @@ class TestJsonFileStorageAdapterSpecific:
         import shutil
         shutil.rmtree(self._tmp, ignore_errors=True)
 
+    def test_autocomplete_rebuilt_on_open(self):
+        adapter1 = run(JsonFileStorageAdapter.create(self._tmp))
+        run(adapter1.set(make_note("Reloaded title", "x")))
+        adapter2 = run(JsonFileStorageAdapter.create(self._tmp))
+        assert [c.text for c in run(adapter2.autocomplete("relo"))] == ["Reloaded title"]
+
     def test_persists_across_instances(self):
         adapter1 = run(JsonFileStorageAdapter.create(self._tmp))
         minion = make_note("Persistent", "should survive reload")
@@ -334,6 +416,77 @@ class TestJsonFileStorageAdapterSpecific:
         assert data["id"] == minion.id
 
 
+    @pytest.mark.parametrize("backend", ["default", "json"])
+    def test_json_codec_round_trip(self, backend, monkeypatch):
+        if backend == "json":
+            monkeypatch.setattr(json_codec, "_orjson", None)
+        doc = {"text": "naïve ✓", "n": 2 ** 70, "f": 0.1, "k": {1: True}, "x": None}
+        assert json_codec.loads(json_codec.dumps(doc)) == {**doc, "k": {"1": True}}
+        assert json.loads(json_codec.dumps(doc, indent=True)) == json_codec.loads(json_codec.dumps(doc))
+        assert json_codec.loads(b'{"v": NaN}')["v"] != json_codec.loads(b'{"v": NaN}')["v"]
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads("{broken")
+
+    @pytest.mark.parametrize("backend", ["default", "json"])
+    def test_json_codec_output_matches_json_module(self, backend, monkeypatch):
+        if backend == "json":
+            monkeypatch.setattr(json_codec, "_orjson", None)
+        for doc in (
+            {"payload": {"score": float("nan"), "hi": float("inf"), "lo": -float("inf")}},
+            {"n": [2 ** 64, -(2 ** 63) - 1, 2 ** 63], "k": {2 ** 70: "big", 1.5: "f", True: "b"}},
+            {"nested": [[[{"a": (1, 2.5, "x", None)}]]]},
+        ):
+            for indent in (False, True):
+                expected = json.loads(json.dumps(doc, indent=2 if indent else None))
+                decoded = json.loads(json_codec.dumps(doc, indent=indent))
+                assert json.dumps(decoded, sort_keys=True) == json.dumps(expected, sort_keys=True)
+
+        import datetime
+        import uuid
+        for value in (datetime.date(2024, 1, 1), uuid.uuid4(), {1, 2}, {(1, 2): "tuple key"}):
+            with pytest.raises(TypeError):
+                json_codec.dumps({"v": value})
+
+    def test_json_codec_bytes_do_not_depend_on_backend(self, monkeypatch):
+        rng = random.Random(50)
+        scalars = [
+            1e16, 1e-5, 1e-4, 9999999999999998.0, 1.7976931348623157e308, 5e-324, -0.0, 0.1,
+            "naïve ✓", "\x7f", "\u2028", "".join(map(chr, range(128))), 2 ** 63, -(2 ** 63), True, None,
+        ]
+        docs = [
+            {"v": scalars, "k": {1e16: 1, 1e-5: 2, 1.5: 3, "é": 4, None: 5, False: 6}},
+            {"nested": [[[{"a": (1, 2.5, "x", None)}]]], "empty": [[], {}]},
+        ]
+        for _ in range(300):
+            value = rng.choice([
+                rng.random() * 10 ** rng.randint(-8, 20), rng.randint(-(2 ** 64), 2 ** 64),
+                "".join(chr(rng.randrange(0x250)) for _ in range(rng.randint(0, 4))),
+            ])
+            docs.append({"v": value, "l": [value]})
+        for indent in (False, True):
+            encoded = [json_codec.dumps(doc, indent=indent) for doc in docs]
+            with monkeypatch.context() as m:
+                m.setattr(json_codec, "_orjson", None)
+                assert [json_codec.dumps(doc, indent=indent) for doc in docs] == encoded
+
+    def test_non_finite_json_field_survives_reload(self):
+        minion = make_note("Scores", "x")
+        minion.fields["payload"] = {"score": float("nan"), "max": float("inf")}
+        run(run(JsonFileStorageAdapter.create(self._tmp)).set(minion))
+        reloaded = run(run(JsonFileStorageAdapter.create(self._tmp)).get(minion.id))
+        assert math.isnan(reloaded.fields["payload"]["score"])
+        assert reloaded.fields["payload"]["max"] == float("inf")
+
+    def test_reads_files_written_by_json_module(self):
+        minion = make_note("Plain json", "ü")
+        adapter = run(JsonFileStorageAdapter.create(self._tmp))
+        run(adapter.set(minion))
+        hex_id = minion.id.replace("-", "")
+        path = Path(self._tmp) / hex_id[:2] / hex_id[2:4] / f"{minion.id}.json"
+        path.write_text(json.dumps(minion.to_dict(), indent=2))
+        reopened = run(JsonFileStorageAdapter.create(self._tmp))
+        assert run(reopened.get(minion.id)).to_dict() == minion.to_dict()
+
 # ─── Minions client storage integration ──────────────────────────────────────
 
 class TestMinionsClientWithStorage:
@@ -373,6 +526,139 @@ class TestMinionsClientWithStorage:
         assert len(found) == 1
         assert found[0].id == n1.data.id
 
+        fuzzy = run(self.minions.search_minions("nueral", fuzzy=True))
+        assert [m.id for m in fuzzy] == [n1.data.id]
+
+    def test_autocomplete_with_usage_ranking(self):
+        a = run(self.minions.create("note", {"title": "Weekly sync", "fields": {"content": "a"}}))
+        b = run(self.minions.create("note", {"title": "Weekly review", "fields": {"content": "b"}}))
+        run(self.minions.save(a.data))
+        run(self.minions.save(b.data))
+
+        run(self.storage.record_use(a.data.id))
+        results = run(self.minions.autocomplete("week", rank="usage"))
+        assert [c.minion_id for c in results] == [a.data.id, b.data.id]
+
+    def test_similar_minions(self):
+        a = run(self.minions.create("thought", {"title": "Agents need memory", "fields": {"content": "long term memory for agents"}}))
+        b = run(self.minions.create("note", {"title": "Memory design", "fields": {"content": "agents memory store"}}))
+        c = run(self.minions.create("note", {"title": "Groceries", "fields": {"content": "apples"}}))
+        for w in (a, b, c):
+            run(self.minions.save(w.data))
+
+        similar = run(self.minions.similar_minions(a.data.id, k=2))
+        assert [m.id for m in similar] == [b.data.id]
+
+    def _tree(self):
+        """root -> (a -> a1, b); plus an unrelated minion linked from a1."""
+        nodes = {}
+        for name in ("root", "a", "a1", "b", "other"):
+            nodes[name] = run(self.minions.create("note", {"title": name, "fields": {"content": name}}))
+            run(self.minions.save(nodes[name].data))
+        nodes["root"].link_to(nodes["a"].data.id, "parent_of").link_to(nodes["b"].data.id, "parent_of")
+        nodes["a"].link_to(nodes["a1"].data.id, "parent_of")
+        nodes["a1"].link_to(nodes["other"].data.id, "relates_to")
+        return {name: w.data.id for name, w in nodes.items()}
+
+    def test_remove_subtree(self):
+        ids = self._tree()
+        progress = []
+        removed = run(self.minions.remove_subtree(
+            ids["root"], on_progress=lambda done, total: progress.append((done, total)), batch_size=2,
+        ))
+
+        assert removed[0] == ids["root"]
+        assert sorted(removed) == sorted([ids["root"], ids["a"], ids["a1"], ids["b"]])
+        assert progress == [(2, 4), (4, 4)]
+        assert [m.id for m in run(self.minions.list_minions())] == [ids["other"]]
+        assert self.minions.graph.list() == []
+
+    def test_remove_subtree_soft(self):
+        ids = self._tree()
+        run(self.minions.remove_subtree(ids["a"], soft=True))
+
+        assert {m.id for m in run(self.minions.list_minions())} == {ids["root"], ids["b"], ids["other"]}
+        deleted = run(self.minions.load(ids["a1"]))
+        assert deleted.deleted_at is not None
+        assert self.minions.graph.get_children(ids["a"]) == [ids["a1"]]
+
+    def test_load_with_relations(self):
+        ids = self._tree()
+        calls = []
+        get_many = self.storage.get_many
+
+        async def counting_get_many(batch):
+            calls.append(list(batch))
+            return await get_many(batch)
+
+        self.storage.get_many = counting_get_many
+        sub = run(self.minions.load_with_relations(ids["a"], depth=1))
+
+        assert len(calls) == 1
+        assert sub.root.id == ids["a"]
+        assert set(sub.minions) == {ids["a"], ids["root"], ids["a1"]}
+        assert sub.depths == {ids["a"]: 0, ids["root"]: 1, ids["a1"]: 1}
+        assert [m.id for m in sub.children(ids["a"])] == [ids["a1"]]
+        assert [m.id for m in sub.parents(ids["a"])] == [ids["root"]]
+        assert len(sub.relations) == 2
+
+    def test_load_with_relations_filters_types_and_depth(self):
+        ids = self._tree()
+        sub = run(self.minions.load_with_relations(ids["root"], depth=3, types=["parent_of"], direction="out"))
+        assert set(sub.minions) == {ids["root"], ids["a"], ids["b"], ids["a1"]}
+        assert {r.type for r in sub.relations} == {"parent_of"}
+        assert sub.get(ids["other"]) is None
+        assert run(self.minions.load_with_relations("missing")) is None
+
+    def test_save_skips_unchanged_minions(self):
+        writes = []
+        set_ = self.storage.set
+
+        async def counting_set(minion):
+            writes.append(minion.id)
+            return await set_(minion)
+
+        self.storage.set = counting_set
+        note = run(self.minions.create("note", {"title": "Draft", "fields": {"content": "a"}})).data
+        run(self.minions.save(note))
+        same = run(self.minions.update(note, {"title": "Draft", "fields": {"content": "a"}})).data
+        assert same is note
+        run(self.minions.save(same))
+        assert len(writes) == 1
+
+        loaded = run(self.minions.load(note.id))
+        run(self.minions.save(loaded))
+        assert len(writes) == 1
+
+        changed = run(self.minions.update(loaded, {"fields": {"content": "b"}})).data
+        run(self.minions.save(changed))
+        run(self.minions.save(changed, force=True))
+        assert len(writes) == 3
+
+        run(self.minions.remove(changed))
+        run(self.minions.save(changed))
+        assert len(writes) == 4
+        assert run(self.minions.load(note.id)).fields == {"content": "b"}
+
+    def test_save_writes_minions_mutated_in_place(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            minions = Minions(storage=run(JsonFileStorageAdapter.create(tmp)))
+            note = run(minions.create("note", {"title": "Old", "fields": {"content": "a"}})).data
+            run(minions.save(note))
+
+            loaded = run(minions.load(note.id))
+            loaded.fields["content"] = "CHANGED"
+            loaded.title = "new"
+            run(minions.save(loaded))
+
+            reloaded = run(run(JsonFileStorageAdapter.create(tmp)).get(note.id))
+            assert reloaded.title == "new"
+            assert reloaded.fields == {"content": "CHANGED"}
+        finally:
+            import shutil
+            shutil.rmtree(tmp, ignore_errors=True)
+
     def test_raises_without_adapter(self):
         minions = Minions()
         n = run(minions.create("note", {"title": "X", "fields": {"content": "y"}}))
@@ -417,6 +703,24 @@ class TestWithHooks:
         loaded = run(self.inner.get(minion.id))
         assert loaded.title == "HELLO"
 
+    def test_batch_operations_fire_per_item_hooks(self):
+        from minions.storage import with_hooks, StorageHooks
+        seen = []
+
+        async def before_get(id):
+            seen.append(("get", id))
+
+        async def before_delete(id):
+            seen.append(("delete", id))
+
+        hooked = with_hooks(self.inner, StorageHooks(before_get=before_get, before_delete=before_delete))
+        a, b = make_note("A", "a"), make_note("B", "b")
+        run(hooked.set_many([a, b]))
+        assert len(run(hooked.get_many([a.id, b.id]))) == 2
+        run(hooked.delete_many([a.id]))
+        assert seen == [("get", a.id), ("get", b.id), ("delete", a.id)]
+        assert run(self.inner.get(a.id)) is None
+
     def test_after_set_callback(self):
         from minions.storage import with_hooks, StorageHooks
         captured = [None]
@@ -503,6 +807,15 @@ class TestWithHooks:
         assert query_log[0] == "quantum"
         assert count[0] == 1
 
+    def test_similar_passes_through(self):
+        from minions.storage import with_hooks, StorageHooks
+        hooked = with_hooks(self.inner, StorageHooks())
+        a = make_note("Solar power", "panels and inverters")
+        b = make_note("Solar farms", "panels at scale")
+        run(hooked.set(a))
+        run(hooked.set(b))
+        assert [m.id for m in run(hooked.similar(a.id))] == [b.id]
+
     def test_hook_error_propagation(self):
         from minions.storage import with_hooks, StorageHooks
 
@@ -4,14 +4,20 @@ Verifies to_dict()/from_dict() round-tripping and camelCase interop.
 """
 
 import json
+import random
 from copy import deepcopy
 
+import pytest
+
 from minions.types import (
     FieldValidation,
     FieldDefinition,
     Minion,
     MinionType,
     Relation,
+    _dict_to_camel,
+    _dict_to_snake,
+    _to_snake,
 )
 
 
@@ -42,6 +48,11 @@ class TestFieldValidation:
         assert v.min_length == 5
         assert v.max_length == 10
 
+    def test_json_limits_round_trip(self):
+        original = FieldValidation(max_depth=8, max_nodes=10_000)
+        assert original.to_dict() == {"maxDepth": 8, "maxNodes": 10_000}
+        assert FieldValidation.from_dict(original.to_dict()) == original
+
     def test_round_trip(self):
         original = FieldValidation(min_length=2, max_length=50, pattern="^\\w+$")
         restored = FieldValidation.from_dict(original.to_dict())
@@ -91,6 +102,15 @@ class TestFieldDefinition:
         assert restored.required == original.required
         assert restored.validation.pattern == original.validation.pattern
 
+    def test_search_paths_round_trip(self):
+        original = FieldDefinition(
+            name="input", type="json", search_paths=["messages.*.content"], search_max_chars=500,
+        )
+        d = original.to_dict()
+        assert d["searchPaths"] == ["messages.*.content"]
+        assert d["searchMaxChars"] == 500
+        assert FieldDefinition.from_dict(d) == original
+
 
 # ─── Minion ───────────────────────────────────────────────────────────────────
 
@@ -178,6 +198,103 @@ class TestMinion:
         assert restored._legacy == original._legacy
 
 
+    def test_fingerprint_is_stable(self):
+        m = self._make_minion(tags=["x"], fields={"a": 1, "b": {"c": [1, 2]}})
+        reordered = self._make_minion(tags=["x"], fields={"b": {"c": [1, 2]}, "a": 1})
+        restored = Minion.from_dict(json.loads(json.dumps(m.to_dict())))
+        assert len(m.fingerprint) == 32
+        assert m.fingerprint == reordered.fingerprint == restored.fingerprint
+
+    def test_fingerprint_tracks_content(self):
+        m = self._make_minion()
+        assert self._make_minion(searchable_text="derived").fingerprint == m.fingerprint
+        assert self._make_minion(title="Other").fingerprint != m.fingerprint
+        assert self._make_minion(fields={"content": "bye"}).fingerprint != m.fingerprint
+        assert self._make_minion(updated_at="2024-01-02T00:00:00Z").fingerprint != m.fingerprint
+
+    def test_fingerprint_reflects_in_place_changes(self):
+        m = self._make_minion(tags=["a"])
+        before = m.fingerprint
+        m.fields["content"] = "changed"
+        assert m.fingerprint != before
+        before = m.fingerprint
+        m.tags.append("b")
+        assert m.fingerprint != before
+
+    def test_slotted(self):
+        m = self._make_minion()
+        assert not hasattr(m, "__dict__")
+        with pytest.raises(AttributeError):
+            m.extra = 1
+
+    def test_low_cardinality_strings_are_interned(self):
+        doc = '{"id": "1", "title": "A title", "minionTypeId": "builtin-note", "status": "todo", "priority": "high", "tags": ["x", "y"]}'
+        a, b = Minion.from_dict(json.loads(doc)), Minion.from_dict(json.loads(doc))
+        assert a.minion_type_id is b.minion_type_id
+        assert a.status is b.status and a.priority is b.priority
+        assert all(x is y for x, y in zip(a.tags, b.tags))
+        assert a.title is not b.title
+
+    def test_tags_are_copied(self):
+        tags = ["x"]
+        m = self._make_minion(tags=tags)
+        tags.append("y")
+        assert m.tags == ["x"]
+
+    def test_from_dict_matches_tolerant_lookups(self):
+        """Generated from_dict agrees with ``d.get(camel) or d.get(snake)`` for any key mix."""
+        def reference(d):
+            return Minion(
+                id=d["id"], title=d["title"],
+                minion_type_id=d.get("minionTypeId") or d.get("minion_type_id", ""),
+                fields=d.get("fields", {}),
+                created_at=d.get("createdAt") or d.get("created_at", ""),
+                updated_at=d.get("updatedAt") or d.get("updated_at", ""),
+                tags=d.get("tags"), status=d.get("status"), priority=d.get("priority"),
+                description=d.get("description"),
+                due_date=d.get("dueDate") or d.get("due_date"),
+                category_id=d.get("categoryId") or d.get("category_id"),
+                created_by=d.get("createdBy") or d.get("created_by"),
+                deleted_at=d.get("deletedAt") or d.get("deleted_at"),
+                searchable_text=d.get("searchableText") or d.get("searchable_text"),
+                _legacy=d.get("_legacy"),
+            )
+
+        rng = random.Random(7)
+        keys = [
+            ("minionTypeId", "minion_type_id"), ("createdAt", "created_at"), ("updatedAt", "updated_at"),
+            ("dueDate", "due_date"), ("categoryId", "category_id"), ("createdBy", "created_by"),
+            ("deletedAt", "deleted_at"), ("searchableText", "searchable_text"),
+            ("fields", "fields"), ("status", "status"), ("tags", "tags"), ("_legacy", "_legacy"),
+        ]
+        for _ in range(500):
+            style = rng.choice(["camel", "snake", "mixed"])
+            d = {"id": "1", "title": "T"}
+            for camel, snake in keys:
+                if rng.random() < 0.7:
+                    key = {"camel": camel, "snake": snake}.get(style) or rng.choice([camel, snake])
+                    d[key] = rng.choice([None, "", "v", {"a": 1}, ["x"]])
+            assert Minion.from_dict(d) == reference(d)
+            if style != "mixed":
+                assert Minion.from_dict(d, key_style=style) == reference(d)
+
+    def test_from_dict_builds_subclasses_through_their_constructor(self):
+        from dataclasses import dataclass
+
+        @dataclass(slots=True)
+        class Tagged(Minion):
+            note: str = "n"
+
+        m = Tagged.from_dict({"id": "1", "title": "T", "tags": ["x"]})
+        assert type(m) is Tagged and m.note == "n" and m.tags == ["x"]
+        assert m.search_tokens is None and Minion.from_dict(m.to_dict()).fingerprint == m.fingerprint
+
+    def test_from_dict_rejects_unknown_key_style(self):
+        with pytest.raises(ValueError, match="Unknown key style"):
+            Minion.from_dict({"id": "1", "title": "T"}, key_style="kebab")
+        with pytest.raises(KeyError):
+            Minion.from_dict({"id": "1"}, key_style="camel")
+
 # ─── MinionType ───────────────────────────────────────────────────────────────
 
 class TestMinionType:
@@ -246,3 +363,23 @@ class TestRelation:
         assert restored.source_id == original.source_id
         assert restored.metadata == original.metadata
         assert restored.created_by == original.created_by
+
+    def test_slotted_and_interned(self):
+        a, b = (Relation.from_dict(json.loads('{"id": "r", "type": "parent_of", "createdAt": "t"}')) for _ in range(2))
+        assert not hasattr(a, "__dict__")
+        assert a.type is b.type
+
+
+# ─── Key conversion ───────────────────────────────────────────────────────────
+
+class TestKeyConversion:
+    def test_to_snake(self):
+        assert _to_snake("minionTypeId") == "minion_type_id"
+        assert _to_snake("v2Name") == "v2_name"
+        assert _to_snake("already_snake") == "already_snake"
+
+    def test_dict_round_trip(self):
+        d = {"search_paths": ["a"], "validation": {"min_length": 1}, "items": [{"max_depth": 2}, 3]}
+        camel = _dict_to_camel(d)
+        assert camel == {"searchPaths": ["a"], "validation": {"minLength": 1}, "items": [{"maxDepth": 2}, 3]}
+        assert _dict_to_snake(camel) == d
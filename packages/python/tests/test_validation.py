@@ -3,9 +3,15 @@ Tests for the Minions Python validation engine.
 Mirrors: packages/core/src/__tests__/validation.test.ts
 """
 
+import asyncio
+import json
+import random
+
 import pytest
-from minions.types import FieldDefinition, FieldValidation
-from minions.validation import validate_field, validate_fields, ValidationResult
+from minions.types import FieldDefinition, FieldValidation, MinionType
+from minions.validation import (
+    compile_validator, validate_field, validate_fields, validate_many, validate_many_async, ValidationResult,
+)
 
 
 # ─── Helpers ──────────────────────────────────────────────────────────────────
@@ -14,7 +20,7 @@ def field(name: str, type: str, **kwargs) -> FieldDefinition:
     """Shorthand for building a FieldDefinition in tests."""
     validation_kwargs = {
         k: v for k, v in kwargs.items()
-        if k in ("min_length", "max_length", "min", "max", "pattern")
+        if k in ("min_length", "max_length", "min", "max", "pattern", "max_depth", "max_nodes")
     }
     other_kwargs = {
         k: v for k, v in kwargs.items()
@@ -300,6 +306,53 @@ class TestJSON:
     def test_rejects_non_serializable(self):
         assert invalid(object(), field("x", "json"))
 
+    def test_matches_json_dumps(self):
+        rng = random.Random(46)
+        shared = [1, "two"]
+        cyclic: list = [1]
+        cyclic.append({"back": cyclic})
+        leaves = [0, -1.5, float("inf"), True, None, "s", b"bytes", {1, 2}, object(), shared, cyclic]
+        keys = ["k", 1, 2.5, False, None, (1, 2), b"k"]
+
+        def build(depth):
+            roll = rng.random()
+            if depth > 4 or roll < 0.4:
+                return rng.choice(leaves)
+            if roll < 0.6:
+                return [build(depth + 1) for _ in range(rng.randrange(4))]
+            if roll < 0.7:
+                return tuple(build(depth + 1) for _ in range(rng.randrange(3)))
+            return {rng.choice(keys) if rng.random() < 0.2 else f"k{i}": build(depth + 1) for i in range(rng.randrange(4))}
+
+        for _ in range(2000):
+            value = build(0)
+            try:
+                json.dumps(value)
+                expected = True
+            except (TypeError, ValueError):
+                expected = False
+            assert valid(value, field("x", "json")) is expected, value
+
+    def test_depth_limit(self):
+        nested: list = []
+        for _ in range(5):
+            nested = [nested]
+        assert valid(nested, field("x", "json", max_depth=6))
+        errors = validate_field(nested, field("x", "json", max_depth=5))
+        assert errors[0].message == "JSON value is nested deeper than 5 levels"
+
+    def test_default_depth_limit_rejects_instead_of_recursing(self):
+        nested: list = []
+        for _ in range(5000):
+            nested = [nested]
+        assert invalid(nested, field("x", "json"))
+
+    def test_node_limit(self):
+        payload = {"rows": [{"a": i} for i in range(10)]}  # 1 + 1 + 10 * 2 values
+        assert valid(payload, field("x", "json", max_nodes=22))
+        errors = validate_field(payload, field("x", "json", max_nodes=21))
+        assert errors[0].message == "JSON value has more than 21 values"
+
 
 # ─── Array ────────────────────────────────────────────────────────────────────
 
@@ -356,3 +409,147 @@ class TestValidateFields:
         assert d["valid"] is False
         assert isinstance(d["errors"], list)
         assert d["errors"][0]["field"] == "name"
+
+
+# ─── compile_validator ────────────────────────────────────────────────────────
+
+_DIFF_SCHEMA = [
+    field("title", "string", required=True, min_length=2, max_length=8, pattern="^[A-Z]"),
+    field("body", "textarea"),
+    field("count", "number", min=0, max=10),
+    field("ratio", "number", required=True),
+    field("done", "boolean"),
+    field("due", "date"),
+    field("contact", "email"),
+    field("site", "url"),
+    field("color", "select", options=["red", "green", "a, b"]),
+    field("sizes", "multi-select", options=["s", "m", [1]]),
+    field("labels", "tags"),
+    field("payload", "json"),
+    field("items", "array"),
+    field("mystery", "widget", required=True),
+]
+
+_DIFF_VALUES = [
+    None, "", "Hello", "x", "hello world", "red", "a, b", "2024-01-15", "2024-01-15T10:30:00Z",
+    "a@b.co", "https://example.com", "ftp://example.com", "http://[", 0, 5, 11, -1, 2.5,
+    float("nan"), True, False, [], ["s"], ["s", "xl"], [[1]], [{"k": 1}], ["a", 1], {"k": [1]}, {1, 2},
+]
+
+
+def _outcome(validate, fields) -> tuple:
+    try:
+        result = validate(fields)
+    except Exception as exc:  # both sides must fail the same way
+        return "raised", type(exc), str(exc)
+    return result.valid, [(e.field, e.message, repr(e.value)) for e in result.errors]
+
+
+class TestCompiledValidator:
+    @pytest.mark.parametrize("codegen", [False, True])
+    def test_matches_validate_fields(self, codegen):
+        rng = random.Random(43)
+        compiled = compile_validator(_DIFF_SCHEMA, codegen=codegen)
+        for _ in range(3000):
+            fields = {
+                f.name: rng.choice(_DIFF_VALUES)
+                for f in _DIFF_SCHEMA if rng.random() < 0.8
+            }
+            expected = _outcome(lambda f: validate_fields(f, _DIFF_SCHEMA), fields)
+            assert _outcome(compiled, fields) == expected, fields
+
+    @pytest.mark.parametrize("codegen", [False, True])
+    def test_valid_record(self, codegen):
+        schema = _DIFF_SCHEMA[:-1]
+        fields = {
+            "title": "Hello", "ratio": 2.5, "count": 3, "done": False, "due": "2024-01-15",
+            "contact": "a@b.co", "site": "https://example.com", "color": "a, b", "sizes": ["s", [1]],
+            "labels": ["x"], "payload": {"k": [1]}, "items": [],
+        }
+        result = compile_validator(schema, codegen=codegen)(fields)
+        assert result.valid
+        assert _outcome(lambda f: validate_fields(f, schema), fields) == (True, [])
+
+    def test_generated_source(self):
+        assert compile_validator(_DIFF_SCHEMA).source is None
+        source = compile_validator(_DIFF_SCHEMA, codegen=True).source
+        assert source.startswith("def validate(fields):")
+        assert "'title'" in source
+
+    def test_cached_per_type_and_rebuilt_on_schema_change(self):
+        from minions.lifecycle import _field_validator, create_minion
+        t = MinionType(id="test-compiled", name="Compiled", slug="test-compiled",
+                       schema=[field("a", "string")])
+        assert _field_validator(t) is _field_validator(t)
+        _, validation = create_minion({"title": "T", "fields": {}}, t)
+        assert validation.valid
+
+        t.schema = [field("a", "string", required=True)]
+        _, validation = create_minion({"title": "T", "fields": {}}, t)
+        assert not validation.valid
+
+
+# ─── validate_many ────────────────────────────────────────────────────────────
+
+def _records(n: int) -> list[dict]:
+    rng = random.Random(44)
+    return [
+        {f.name: rng.choice(_DIFF_VALUES) for f in _DIFF_SCHEMA[:8] if rng.random() < 0.7}
+        for _ in range(n)
+    ]
+
+
+class TestValidateMany:
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_matches_validate_fields_in_order(self, workers):
+        schema = _DIFF_SCHEMA[:8]
+        records = _records(250)
+        steps = list(validate_many(iter(records), schema, workers=workers, chunk_size=16))
+        assert [s.index for s in steps] == list(range(len(records)))
+        for step, record in zip(steps, records):
+            assert step.record is record
+            assert _outcome(lambda f: step.result, record) == _outcome(lambda f: validate_fields(f, schema), record)
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_fail_fast_stops_at_first_invalid(self, workers):
+        schema = [field("name", "string", required=True)]
+        records = [{"name": "a"}, {"name": "b"}, {}, {"name": "c"}] * 20
+        steps = list(validate_many(records, schema, workers=workers, chunk_size=3, fail_fast=True))
+        assert [s.result.valid for s in steps] == [True, True, False]
+
+    def test_rejects_bad_chunk_size(self):
+        with pytest.raises(ValueError):
+            list(validate_many([], [], chunk_size=0))
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    async def test_async_matches_sync(self, workers):
+        schema = _DIFF_SCHEMA[:8]
+        records = _records(120)
+        steps = [s async for s in validate_many_async(iter(records), schema, workers=workers, chunk_size=16)]
+        expected = list(validate_many(records, schema))
+        assert [(s.index, s.record) for s in steps] == [(s.index, s.record) for s in expected]
+        # repr, because NaN values come back from worker processes as new objects
+        assert [repr(s.result) for s in steps] == [repr(s.result) for s in expected]
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    async def test_async_fail_fast(self, workers):
+        schema = [field("name", "string", required=True)]
+        records = [{"name": "a"}, {"name": "b"}, {}, {"name": "c"}] * 20
+        steps = [s async for s in validate_many_async(records, schema, workers=workers, chunk_size=3, fail_fast=True)]
+        assert [s.result.valid for s in steps] == [True, True, False]
+
+    async def test_async_keeps_event_loop_running(self):
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(heartbeat())
+        records = [{"name": "x"}] * 5000
+        async for _ in validate_many_async(records, [field("name", "string")], chunk_size=500):
+            pass
+        task.cancel()
+        assert ticks >= 10